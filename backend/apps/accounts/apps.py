@@ -8,3 +8,5 @@ class AccountsConfig(AppConfig):
         # This import registers the CookiesJWTScheme when Django starts
         print("Ready method executed!")
         import apps.accounts.authentication
+        from apps.accounts.token_cache import token_user_cache
+        token_user_cache.configure()
@@ -4,6 +4,8 @@ from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from rest_framework.exceptions import AuthenticationFailed
 from drf_spectacular.extensions import OpenApiAuthenticationExtension
 
+from apps.accounts.token_cache import token_user_cache
+
 class CookiesJWTAuthentication(JWTAuthentication):
     """
     Authenticate using:
@@ -20,13 +22,26 @@ class CookiesJWTAuthentication(JWTAuthentication):
             if raw_token is None:
                 return None
 
-            validated_token = self.get_validated_token(raw_token)
-            user = self.get_user(validated_token)
-            
-            return user, validated_token
+            return resolve_token_user(raw_token)
         except (InvalidToken, TokenError):
             raise AuthenticationFailed("Access token expired or invalid")
         
+def load_token_user(raw_token):
+    """
+    Verify `raw_token` (a single decode), load its user and cache the pair.
+    Raises InvalidToken/TokenError for bad tokens and AuthenticationFailed
+    for unknown or inactive users.
+    """
+    backend = CookiesJWTAuthentication()
+    validated_token = backend.get_validated_token(raw_token)
+    user = backend.get_user(validated_token)
+    token_user_cache.set(raw_token, user, validated_token)
+    return user, validated_token
+
+def resolve_token_user(raw_token):
+    """(user, validated_token) for a raw access token, cached when possible."""
+    return token_user_cache.get(raw_token) or load_token_user(raw_token)
+
 class CookiesJWTScheme(OpenApiAuthenticationExtension):
     target_class = CookiesJWTAuthentication
     name = 'CookieAuth'
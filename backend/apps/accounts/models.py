@@ -4,6 +4,7 @@ from django.utils import timezone
 import pytz
 
 from apps.pomodoro.constants import DEFAULT_POMODORO_SETTINGS
+from apps.accounts.token_cache import token_user_cache
 
 # Create your models here.
 class CustomUserManager(UserManager):
@@ -55,6 +56,17 @@ class User(AbstractUser):
 
     objects = CustomUserManager()
     
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Password, profile and settings changes must not be served from the auth cache
+        token_user_cache.invalidate_user(self.pk)
+
+    def delete(self, *args, **kwargs):
+        user_id = self.pk
+        result = super().delete(*args, **kwargs)
+        token_user_cache.invalidate_user(user_id)
+        return result
+
     def get_pomodoro_setting(self, key):
         return self.pomodoro_settings.get(
             key,
@@ -1,6 +1,7 @@
 from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
 from apps.accounts.models import User
+from apps.analytics.services import DailyStatsService, StreakService
 class UserSerializer(serializers.ModelSerializer):
     password = serializers.CharField(write_only=True)
     class Meta:
@@ -39,6 +40,15 @@ class UserProfileSerializer(serializers.ModelSerializer):
         read_only_fields = ['email']
         optional_fields = ['timezone', 'pomodoro_settings']
 
+    def update(self, instance, validated_data):
+        previous_timezone = instance.timezone
+        instance = super().update(instance, validated_data)
+        if instance.timezone != previous_timezone:
+            # Rollups, heatmap and streak days are all local dates
+            DailyStatsService.rebuild(instance)
+            StreakService.rebuild(instance)
+        return instance
+
 class UserSettingsSerializer(serializers.ModelSerializer):
     current_password = serializers.CharField(write_only=True, required=True)
     password = serializers.CharField(write_only=True, required=True)
@@ -0,0 +1,46 @@
+from django.contrib.auth import get_user_model
+from rest_framework.test import APITestCase
+
+User = get_user_model()
+
+
+class ConditionalGetTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="etag@example.com", password="StrongPassword123!")
+        self.client.force_authenticate(self.user)
+
+    def test_profile(self):
+        etag = self.client.get("/auth/profile/")["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/auth/profile/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.client.patch("/auth/profile/", {"first_name": "Renamed"}, format="json")
+        response = self.client.get("/auth/profile/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["first_name"], "Renamed")
+
+    def test_pomodoro_settings(self):
+        url = "/auth/settings/pomodoro/"
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.client.put(url, {
+            "focus_minutes": 50, "short_break_minutes": 10,
+            "long_break_minutes": 20, "long_break_every": 4,
+        }, format="json")
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["focus_minutes"], 50)
+
+    def test_timezones_are_cacheable(self):
+        self.client.force_authenticate(None)
+        first = self.client.get("/auth/timezones/")
+        self.assertIn("max-age=86400", first["Cache-Control"])
+        self.assertIn("public", first["Cache-Control"])
+
+        response = self.client.get("/auth/timezones/", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, 304)
+        # Same representation, same ETag, whoever asks
+        self.assertEqual(self.client.get("/auth/timezones/")["ETag"], first["ETag"])
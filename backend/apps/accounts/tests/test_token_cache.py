@@ -0,0 +1,93 @@
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from rest_framework.test import APITestCase, APITransactionTestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.accounts.token_cache import TokenUserCache, token_user_cache
+from apps.pomodoro.middleware import get_user_from_token
+
+User = get_user_model()
+
+
+class TokenCacheSetup:
+    def setUp(self):
+        token_user_cache.clear()
+        self.user = User.objects.create_user(email="cache@example.com", password="StrongPassword123!")
+        self.token = str(AccessToken.for_user(self.user))
+
+    def get_authenticated(self):
+        return self.client.get("/auth/authenticated/", HTTP_AUTHORIZATION=f"Bearer {self.token}")
+
+
+class TokenCacheTests(TokenCacheSetup, APITestCase):
+    def test_repeat_requests_skip_user_query(self):
+        self.assertEqual(self.get_authenticated().status_code, 200)
+
+        with self.assertNumQueries(0):
+            response = self.get_authenticated()
+
+        self.assertEqual(response.data["user"]["id"], self.user.id)
+        self.assertEqual(token_user_cache.stats()["hits"], 1)
+
+    def test_settings_update_invalidates(self):
+        self.get_authenticated()
+
+        self.user.pomodoro_settings = {**self.user.pomodoro_settings, "focus_minutes": 50}
+        self.user.save()
+
+        response = self.get_authenticated()
+        self.assertEqual(response.data["user"]["pomodoro_settings"]["focus_minutes"], 50)
+
+    def test_logout_invalidates(self):
+        self.get_authenticated()
+
+        self.client.post("/auth/logout/", HTTP_AUTHORIZATION=f"Bearer {self.token}")
+
+        self.assertEqual(len(token_user_cache), 0)
+
+
+
+class SocketTokenCacheTests(TokenCacheSetup, APITransactionTestCase):
+    # database_sync_to_async closes the connection, which a TestCase
+    # transaction would not survive on a file database
+    def test_websocket_and_http_share_entries(self):
+        user = async_to_sync(get_user_from_token)(self.token)
+        self.assertEqual(user.id, self.user.id)
+
+        with self.assertNumQueries(0):
+            self.get_authenticated()
+
+    def test_invalid_token_is_anonymous_on_socket(self):
+        user = async_to_sync(get_user_from_token)("not-a-token")
+
+        self.assertTrue(user.is_anonymous)
+        self.assertEqual(len(token_user_cache), 0)
+
+
+class TokenUserCacheBoundsTests(APITestCase):
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = TokenUserCache(max_entries=2)
+        users = [
+            User.objects.create_user(email=f"u{n}@example.com", password="StrongPassword123!")
+            for n in range(3)
+        ]
+        tokens = [AccessToken.for_user(user) for user in users]
+
+        cache.set(str(tokens[0]), users[0], tokens[0])
+        cache.set(str(tokens[1]), users[1], tokens[1])
+        cache.get(str(tokens[0]))
+        cache.set(str(tokens[2]), users[2], tokens[2])
+
+        self.assertIsNotNone(cache.get(str(tokens[0])))
+        self.assertIsNone(cache.get(str(tokens[1])))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_entries_do_not_outlive_the_token(self):
+        cache = TokenUserCache()
+        user = User.objects.create_user(email="exp@example.com", password="StrongPassword123!")
+        token = AccessToken.for_user(user)
+        token.set_exp(lifetime=-token.lifetime)  # already expired
+
+        cache.set(str(token), user, token)
+
+        self.assertIsNone(cache.get(str(token)))
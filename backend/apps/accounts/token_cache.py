@@ -0,0 +1,120 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+
+class TokenUserCache:
+    """
+    Bounded, in-process TTL cache from raw access token to authenticated user.
+
+    Shared by CookiesJWTAuthentication (HTTP) and CookiesJWTAuthMiddleware
+    (websocket), so a token is decoded once and its user loaded once per
+    `ttl_seconds` instead of on every request or reconnect. Entries never
+    outlive the token's own `exp`.
+
+    Entries are dropped when the user is saved (password, profile and
+    pomodoro settings changes all go through User.save) and on logout.
+    Other worker processes keep their copy for at most `ttl_seconds`.
+    """
+
+    def __init__(self, max_entries=10000, ttl_seconds=60):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # raw token -> (user, validated token, expires)
+        self._by_user = {}  # user id -> raw tokens
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, raw_token):
+        """Return (user, validated_token) for a cached token, else None."""
+        key = self._key(raw_token)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[2] <= now:
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            user, validated_token, _ = entry
+
+        # Callers may modify request.user; never hand out the cached instance
+        return copy.copy(user), validated_token
+
+    def set(self, raw_token, user, validated_token):
+        key = self._key(raw_token)
+        ttl = self.ttl_seconds
+        exp = validated_token.get("exp")
+        if exp is not None:
+            ttl = min(ttl, exp - time.time())
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (copy.copy(user), validated_token, time.monotonic() + ttl)
+            self._by_user.setdefault(user.pk, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate_user(self, user_id):
+        with self._lock:
+            for key in self._by_user.pop(user_id, set()):
+                self._entries.pop(key, None)
+
+    def invalidate_token(self, raw_token):
+        with self._lock:
+            self._remove(self._key(raw_token))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_user.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def configure(self):
+        self.max_entries = getattr(settings, "AUTH_USER_CACHE_MAX_ENTRIES", self.max_entries)
+        self.ttl_seconds = getattr(settings, "AUTH_USER_CACHE_TTL_SECONDS", self.ttl_seconds)
+
+    @staticmethod
+    def _key(raw_token):
+        return raw_token.decode() if isinstance(raw_token, bytes) else raw_token
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        keys = self._by_user.get(entry[0].pk)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_user[entry[0].pk]
+
+    def __len__(self):
+        return len(self._entries)
+
+
+token_user_cache = TokenUserCache()
@@ -8,6 +8,7 @@ urlpatterns = [
     path('token/refresh/', views.CustomTokenRefreshView.as_view(), name='token_refresh'),
     path('logout/', views.logout, name='logout'),
     path('authenticated/', views.authenticated, name='authenticated'),
+    path('token-cache/', views.token_cache_stats, name='token-cache-stats'),
     path('profile/', views.UserProfileView.as_view(), name='user-profile'),
     path('settings/password/', views.UserSettingsView.as_view(), name='change-password'),
     path("settings/pomodoro/", views.PomodoroSettingsView.as_view()),
@@ -4,15 +4,17 @@ from google.auth.transport import requests as google_requests
 
 from rest_framework_simplejwt.views import TokenObtainPairView,TokenRefreshView
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.permissions import IsAuthenticated, AllowAny, IsAdminUser
 from drf_spectacular.utils import extend_schema, inline_serializer
 from rest_framework.response import Response
 from rest_framework import status, serializers, generics
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from apps.accounts.models import User
+from apps.accounts.token_cache import token_user_cache
 from apps.accounts.serializers import UserSerializer, UserProfileSerializer, UserSettingsSerializer, PomodoroSettingsSerializer
 from apps.pomodoro.constants import DEFAULT_POMODORO_SETTINGS
+from core.conditional import conditional, conditional_response
 
 # Create your views here.
 class UserCreateView(generics.CreateAPIView):
@@ -113,6 +115,8 @@ class CustomTokenRefreshView(TokenRefreshView):
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 def logout(request):
+    token_user_cache.invalidate_user(request.user.id)
+
     res = Response({"success": True})
 
     res.delete_cookie("access_token", path="/")
@@ -142,10 +146,24 @@ def authenticated(request):
                     }
                 })
     
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def token_cache_stats(request):
+    """Hit/miss counters of the token -> user auth cache in this worker."""
+    return Response(token_user_cache.stats())
+
+import hashlib
 import pytz
+# Only changes with a pytz upgrade, so built once and cached by clients for a day
+TIMEZONES = list(pytz.common_timezones)
+TIMEZONES_VERSION = hashlib.md5("\n".join(TIMEZONES).encode(), usedforsecurity=False).hexdigest()
+
 @api_view(["GET"])
 def timezone_list(request):
-    return Response(pytz.common_timezones)
+    return conditional_response(
+        request, TIMEZONES_VERSION, lambda: Response(TIMEZONES),
+        cache_control={"public": True, "max_age": 60 * 60 * 24},
+    )
 
 class UserProfileView(generics.RetrieveUpdateAPIView):
     serializer_class = UserProfileSerializer
@@ -153,6 +171,12 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
 
     def get_object(self):
         return self.request.user
+
+    @conditional(lambda view, request: [request.user.pk] + [
+        getattr(request.user, field) for field in UserProfileSerializer.Meta.fields
+    ])
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
     
     def update(self, request, *args, **kwargs):
         print(request.data)
@@ -182,6 +206,10 @@ class PomodoroSettingsView(generics.RetrieveUpdateAPIView):
     def get_object(self):
         return self.request.user
 
+    @conditional(lambda view, request: [request.user.pk, request.user.pomodoro_settings])
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
 @api_view(["POST"])
 @permission_classes([AllowAny])
 def google_login(request):
@@ -1,3 +1,7 @@
 from django.contrib import admin
+from apps.analytics.models import UserDailyStats, UserStreak, UserActivityYear
 
 # Register your models here.
+admin.site.register(UserDailyStats)
+admin.site.register(UserStreak)
+admin.site.register(UserActivityYear)
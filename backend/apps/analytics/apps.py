@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class AnalyticsConfig(AppConfig):
     name = 'apps.analytics'
     label = 'analytics'
+
+    def ready(self):
+        from apps.analytics.cache import analytics_cache
+        analytics_cache.configure()
@@ -0,0 +1,160 @@
+import threading
+import time
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from apps.accounts.utils import TimezoneHandler
+
+
+class AnalyticsCache:
+    """
+    Versioned cache of analytics responses.
+
+    Results are stored under (user, endpoint, normalized params, data
+    version). Each user has two version counters in the cache:
+
+    - `history`, bumped when a write touches a local day before today
+      (late session completions, deleted tasks, rebuilds, timezone changes);
+    - `today`, bumped when a write touches today.
+
+    Ranges that end before today are keyed by `history` only, so past
+    weeks and months stay cached while the user keeps working; ranges
+    reaching today also carry `today` and today's date. Stale entries are
+    never deleted, they simply stop being addressed and age out.
+
+    Works with any Django cache backend (`ANALYTICS_CACHE_ALIAS`); hit and
+    miss counters are kept per worker process.
+    """
+
+    HISTORY = "history"
+    TODAY = "today"
+
+    def __init__(self, alias="default", timeout=60 * 60 * 24):
+        self.alias = alias
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def fetch(self, user, endpoint, params, start_date, end_date, compute):
+        """
+        Return the cached result of `compute()` for `endpoint` and `params`,
+        which cover the local dates `start_date`..`end_date`.
+        """
+        return self.fetch_key(self.key(user, endpoint, params, start_date, end_date), compute)
+
+    def key(self, user, endpoint, params, start_date, end_date):
+        """
+        The cache key of a result. It changes whenever the result may, so
+        it also serves as the response's ETag.
+        """
+        today = TimezoneHandler(user).parse_date().date()
+        versions = self._versions(user.pk)
+
+        parts = [f"v{versions[self.HISTORY]}"]
+        if end_date >= today:
+            parts += [f"t{versions[self.TODAY]}", today.isoformat()]
+        parts += [f"{name}={self._normalize(params[name])}" for name in sorted(params)]
+        return f"analytics:{user.pk}:{endpoint}:" + ":".join(parts)
+
+    def fetch_key(self, key, compute):
+        result = self.cache.get(key)
+        if result is not None:
+            self._count(hit=True)
+            return result
+
+        self._count(hit=False)
+        result = compute()
+        self.cache.set(key, result, self.timeout)
+        return result
+
+    def touch(self, user, *moments):
+        """
+        Record that data for the given local dates (or aware datetimes)
+        changed. None stands for "now".
+        """
+        tz = TimezoneHandler(user)
+        today = tz.parse_date().date()
+        days = [
+            today if moment is None
+            else moment.astimezone(tz.user_tz).date() if isinstance(moment, datetime)
+            else moment
+            for moment in (moments or (None,))
+        ]
+        scopes = {self.HISTORY if day < today else self.TODAY for day in days}
+        self._bump_on_commit(user.pk, scopes)
+
+    def invalidate_user(self, user_id):
+        """Drop every cached result for the user."""
+        self._bump_on_commit(user_id, {self.HISTORY, self.TODAY})
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": self.cache.__class__.__name__,
+                "timeout": self.timeout,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = self.misses = 0
+
+    def configure(self):
+        self.alias = getattr(settings, "ANALYTICS_CACHE_ALIAS", self.alias)
+        self.timeout = getattr(settings, "ANALYTICS_CACHE_TIMEOUT", self.timeout)
+
+    def _versions(self, user_id):
+        keys = {scope: self._version_key(user_id, scope) for scope in (self.HISTORY, self.TODAY)}
+        found = self.cache.get_many(keys.values())
+        versions = {}
+        for scope, key in keys.items():
+            if key not in found:
+                # A fresh starting point, so an evicted counter never reuses old keys
+                self.cache.add(key, time.time_ns(), None)
+                found[key] = self.cache.get(key)
+            versions[scope] = found[key]
+        return versions
+
+    def _bump_on_commit(self, user_id, scopes):
+        # Bump now so this transaction's own reads miss, and again after
+        # commit so a concurrent reader cannot cache pre-commit data under
+        # the new version
+        self._bump(user_id, scopes)
+        transaction.on_commit(lambda: self._bump(user_id, scopes))
+
+    def _bump(self, user_id, scopes):
+        for scope in scopes:
+            key = self._version_key(user_id, scope)
+            try:
+                self.cache.incr(key)
+            except ValueError:
+                self.cache.set(key, time.time_ns(), None)
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    @staticmethod
+    def _version_key(user_id, scope):
+        return f"analytics:{user_id}:{scope}"
+
+    @staticmethod
+    def _normalize(value):
+        return value.isoformat() if hasattr(value, "isoformat") else value
+
+
+analytics_cache = AnalyticsCache()
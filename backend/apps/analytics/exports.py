@@ -0,0 +1,120 @@
+import csv
+from datetime import datetime, time, timedelta
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+
+from apps.accounts.utils import TimezoneHandler
+from apps.pomodoro.models import PomodoroSession, PomodoroPause
+from apps.tasks.models import Task
+
+
+class Echo:
+    """File-like object whose write() hands the line back to csv.writer's caller."""
+
+    def write(self, value):
+        return value
+
+
+class HistoryExporter:
+    """
+    Streams a user's tasks, sessions and pauses as NDJSON or CSV.
+
+    Rows are read with `.values_list(...).iterator(chunk_size=...)`
+    (a server-side cursor on PostgreSQL) and encoded one at a time, so
+    memory stays flat whatever the size of the history. Pauses are
+    exported as their own records instead of being aggregated per session.
+
+    Under ASGI, serve `astream()`: Django would otherwise collect a sync
+    iterator into a list before sending the first byte.
+    """
+
+    CHUNK_SIZE = 2000
+
+    RECORDS = {
+        "tasks": (
+            "task",
+            ("id", "title", "status", "priority", "category", "estimated_pomodoros",
+             "total_focus_seconds", "completed_pomodoros", "created_at", "started_at", "ended_at"),
+        ),
+        "sessions": (
+            "session",
+            ("id", "task_id", "started_at", "ended_at", "duration_minutes",
+             "actual_duration_seconds", "paused_duration_seconds", "is_break",
+             "break_type", "completed", "state"),
+        ),
+        "pauses": (
+            "pause",
+            ("id", "session_id", "paused_at", "resumed_at"),
+        ),
+    }
+
+    FORMATS = {
+        "ndjson": "application/x-ndjson",
+        "csv": "text/csv",
+    }
+
+    def __init__(self, user, records=None, start_date=None, end_date=None):
+        self.user = user
+        self.records = records or tuple(self.RECORDS)
+        tz = TimezoneHandler(user)
+        self.start = tz.user_tz.localize(datetime.combine(start_date, time.min)) if start_date else None
+        self.end = (
+            tz.user_tz.localize(datetime.combine(end_date + timedelta(days=1), time.min))
+            if end_date else None
+        )
+
+    def queryset(self, name):
+        if name == "tasks":
+            queryset, field = Task.objects.filter(owner=self.user), "created_at"
+        elif name == "sessions":
+            queryset, field = PomodoroSession.objects.filter(user=self.user), "started_at"
+        else:
+            queryset, field = PomodoroPause.objects.filter(session__user=self.user), "paused_at"
+
+        if self.start:
+            queryset = queryset.filter(**{f"{field}__gte": self.start})
+        if self.end:
+            queryset = queryset.filter(**{f"{field}__lt": self.end})
+        return queryset.order_by("pk")
+
+    def rows(self, name):
+        _, fields = self.RECORDS[name]
+        return self.queryset(name).values_list(*fields).iterator(chunk_size=self.CHUNK_SIZE)
+
+    def ndjson(self):
+        """One JSON object per line, tagged with its record `type`."""
+        encoder = DjangoJSONEncoder(separators=(",", ":"))
+        for name in self.records:
+            record_type, fields = self.RECORDS[name]
+            for row in self.rows(name):
+                yield encoder.encode({"type": record_type, **dict(zip(fields, row))}) + "\n"
+
+    def csv(self):
+        """A header and rows for a single record kind."""
+        name, = self.records
+        _, fields = self.RECORDS[name]
+        writer = csv.writer(Echo())
+        yield writer.writerow(fields)
+        for row in self.rows(name):
+            yield writer.writerow([
+                value.isoformat() if isinstance(value, datetime) else value
+                for value in row
+            ])
+
+    def stream(self, output):
+        return self.ndjson() if output == "ndjson" else self.csv()
+
+    async def astream(self, output):
+        """stream() as an async iterator, read CHUNK_SIZE lines at a time on the sync thread."""
+        lines = self.stream(output)
+        next_chunk = sync_to_async(lambda: "".join(islice(lines, self.CHUNK_SIZE)))
+        try:
+            while chunk := await next_chunk():
+                yield chunk
+        finally:
+            await sync_to_async(lines.close)()
+
+    def filename(self, output):
+        return f"focusflow-{'-'.join(self.records)}.{output}"
@@ -0,0 +1,36 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.accounts.models import User
+from apps.analytics.services import DailyStatsService
+
+
+class Command(BaseCommand):
+    help = "Rebuild UserDailyStats rollups from raw tasks and pomodoro sessions."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", action="append", help="User id or email (repeatable); default all users")
+        parser.add_argument("--start", type=date.fromisoformat, help="First local date (YYYY-MM-DD)")
+        parser.add_argument("--end", type=date.fromisoformat, help="Last local date (YYYY-MM-DD)")
+
+    def handle(self, *args, **options):
+        start, end = options["start"], options["end"]
+        if start and end and start > end:
+            raise CommandError("--start must not be after --end")
+
+        users = User.objects.order_by("id")
+        if options["user"]:
+            ids = [value for value in options["user"] if value.isdigit()]
+            emails = [value for value in options["user"] if not value.isdigit()]
+            users = users.filter(id__in=ids) | users.filter(email__in=emails)
+            if not users.exists():
+                raise CommandError("No matching users")
+
+        total = 0
+        for user in users.iterator():
+            rows = DailyStatsService.rebuild(user, start, end)
+            total += rows
+            self.stdout.write(f"{user.email}: {rows} day(s)")
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {total} daily rollup row(s)"))
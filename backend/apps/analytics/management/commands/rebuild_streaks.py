@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.accounts.models import User
+from apps.analytics.services import StreakService
+
+
+class Command(BaseCommand):
+    help = "Rebuild UserStreak rows from completed tasks (after history edits or timezone changes)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", action="append", help="User id or email (repeatable); default all users")
+
+    def handle(self, *args, **options):
+        users = User.objects.order_by("id")
+        if options["user"]:
+            ids = [value for value in options["user"] if value.isdigit()]
+            emails = [value for value in options["user"] if not value.isdigit()]
+            users = users.filter(id__in=ids) | users.filter(email__in=emails)
+            if not users.exists():
+                raise CommandError("No matching users")
+
+        count = 0
+        for user in users.iterator():
+            streak = StreakService.rebuild(user)
+            count += 1
+            self.stdout.write(f"{user.email}: longest {streak.longest_streak}, {streak.total_active_days} active day(s)")
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} streak row(s)"))
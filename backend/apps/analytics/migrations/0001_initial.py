@@ -0,0 +1,40 @@
+# Generated by Django 6.0 on 2026-10-18 19:44
+
+import apps.analytics.models
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('focus_seconds', models.PositiveIntegerField(default=0)),
+                ('break_seconds', models.PositiveIntegerField(default=0)),
+                ('pomodoros_completed', models.PositiveIntegerField(default=0)),
+                ('breaks_completed', models.PositiveIntegerField(default=0)),
+                ('hourly_focus_seconds', models.JSONField(default=apps.analytics.models.empty_hours)),
+                ('hourly_break_seconds', models.JSONField(default=apps.analytics.models.empty_hours)),
+                ('tasks_created', models.PositiveIntegerField(default=0)),
+                ('tasks_completed', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'user_daily_stats',
+                'ordering': ['date'],
+                'constraints': [models.UniqueConstraint(fields=('user', 'date'), name='unique_user_daily_stats')],
+            },
+        ),
+    ]
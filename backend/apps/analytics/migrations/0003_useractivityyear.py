@@ -0,0 +1,32 @@
+# Generated by Django 6.0 on 2026-10-18 22:10
+
+import apps.analytics.models
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0002_userstreak'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserActivityYear',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField()),
+                ('active_days', models.BinaryField(default=apps.analytics.models.empty_day_bitmap)),
+                ('focus_seconds', models.BinaryField(default=apps.analytics.models.empty_day_counters)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='activity_years', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'user_activity_years',
+                'constraints': [models.UniqueConstraint(fields=('user', 'year'), name='unique_user_activity_year')],
+            },
+        ),
+    ]
@@ -1,3 +1,110 @@
 from django.db import models
 
+from apps.accounts.models import User
+
+
+def empty_hours():
+    return [0] * 24
+
+
 # Create your models here.
+class UserDailyStats(models.Model):
+    """
+    Per-user rollup of one day in the user's local timezone.
+
+    Kept up to date incrementally as sessions and tasks complete (see
+    DailyStatsService) so analytics read a few rows instead of scanning
+    raw tasks and sessions. `rebuild_daily_stats` recomputes it.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='daily_stats')
+    date = models.DateField()
+
+    focus_seconds = models.PositiveIntegerField(default=0)
+    break_seconds = models.PositiveIntegerField(default=0)
+    pomodoros_completed = models.PositiveIntegerField(default=0)
+    breaks_completed = models.PositiveIntegerField(default=0)
+
+    # Seconds per local hour (index 0-23) of this date. Sessions are split
+    # over the hours they actually ran in, so a session started late in the
+    # evening may add hours to the next day's row.
+    hourly_focus_seconds = models.JSONField(default=empty_hours)
+    hourly_break_seconds = models.JSONField(default=empty_hours)
+
+    tasks_created = models.PositiveIntegerField(default=0)
+    tasks_completed = models.PositiveIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'user_daily_stats'
+        ordering = ['date']
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'date'], name='unique_user_daily_stats'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.date}"
+
+
+class UserStreak(models.Model):
+    """
+    Task completion streak state, advanced by TaskService.complete_task.
+
+    A streak day is a local date with at least one completed task.
+    `current_streak` is the run ending on `last_active_date`; readers treat
+    it as broken once that date is before yesterday.
+    """
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='streak')
+
+    current_streak = models.PositiveIntegerField(default=0)
+    current_streak_start = models.DateField(null=True, blank=True)
+    longest_streak = models.PositiveIntegerField(default=0)
+    longest_streak_start = models.DateField(null=True, blank=True)
+    total_active_days = models.PositiveIntegerField(default=0)
+    last_active_date = models.DateField(null=True, blank=True)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'user_streaks'
+
+    def __str__(self):
+        return f"{self.user_id}: {self.current_streak}"
+
+
+DAYS_IN_YEAR = 366
+
+
+def empty_day_bitmap():
+    return bytes((DAYS_IN_YEAR + 7) // 8)
+
+
+def empty_day_counters():
+    return bytes(DAYS_IN_YEAR * 4)
+
+
+class UserActivityYear(models.Model):
+    """
+    Compact activity heatmap for one user and calendar year.
+
+    `active_days` is a bitmap with one bit per local day of the year (bit
+    n = day-of-year n + 1) set when a task was completed that day;
+    `focus_seconds` packs one little-endian uint32 per day. A year is
+    ~1.5 KB, so a multi-year heatmap is a couple of row reads.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='activity_years')
+    year = models.PositiveSmallIntegerField()
+
+    active_days = models.BinaryField(default=empty_day_bitmap)
+    focus_seconds = models.BinaryField(default=empty_day_counters)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'user_activity_years'
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'year'], name='unique_user_activity_year'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.year}"
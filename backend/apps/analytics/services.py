@@ -1,50 +1,105 @@
 from django.utils import timezone
-from django.db.models import Sum, Q
+from django.db import transaction
+from django.db.models import Count, Sum, Q
 from calendar import monthrange
 from django.db.models.functions import TruncDate
 from collections import defaultdict
-from datetime import timedelta
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+import struct
+import pytz
 
 from apps.tasks.models import Task
-from apps.pomodoro.models import PomodoroSession
+from apps.pomodoro.models import PomodoroSession, PomodoroPause
 from apps.accounts.utils import TimezoneHandler
+from apps.analytics.cache import analytics_cache
+from apps.analytics.models import (
+    UserDailyStats, UserStreak, UserActivityYear,
+    DAYS_IN_YEAR, empty_day_bitmap, empty_day_counters,
+)
+from core.timing import timed_methods
 
 WORK_START_HOUR = 8
 WORK_END_HOUR = 22
 
+def as_date(value):
+    return value.date() if isinstance(value, datetime) else value
+
+def active_intervals(started_at, ended_at, pauses):
+    """[started_at, ended_at] minus the (paused_at, resumed_at) pauses."""
+    intervals = []
+    cursor = started_at
+    for paused_at, resumed_at in sorted(pauses):
+        if paused_at > cursor:
+            intervals.append((cursor, min(paused_at, ended_at)))
+        cursor = max(cursor, resumed_at or ended_at)
+    if cursor < ended_at:
+        intervals.append((cursor, ended_at))
+    return intervals
+
+def split_by_local_hour(intervals, user_tz, total_seconds):
+    """
+    Spread `total_seconds` over the local (date, hour) buckets the active
+    intervals cover, proportionally to the time spent in each bucket.
+    Sessions straddling an hour (or midnight) are split instead of being
+    attributed wholly to their start hour.
+    """
+    spans = defaultdict(float)
+    for start, end in intervals:
+        cursor = start
+        while cursor < end:
+            local = cursor.astimezone(user_tz)
+            boundary = (local.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)).astimezone(pytz.UTC)
+            step_end = min(boundary, end)
+            spans[(local.date(), local.hour)] += (step_end - cursor).total_seconds()
+            cursor = step_end
+
+    wall = sum(spans.values())
+    if not wall:
+        return {}
+
+    buckets, assigned = {}, 0
+    for key, seconds in spans.items():
+        buckets[key] = int(total_seconds * seconds / wall)
+        assigned += buckets[key]
+    # Rounding remainder goes to the largest bucket
+    buckets[max(spans, key=spans.get)] += total_seconds - assigned
+    return buckets
+
+@timed_methods
 class AnalyticsService:
+    DASHBOARD_SECTIONS = ("daily", "weekly", "streaks", "monthly")
+
     @staticmethod
     def get_daily_summary(user, date_str=None):
         """Get user's productivity summary for a specific date"""
         tz = TimezoneHandler(user)
         user_date = tz.parse_date(date_str) 
         
-        tasks = Task.objects.for_user_date(user, 'created_at', date_str)
+        tasks = Task.objects.for_user_date(user, 'created_at', date_str).filter(owner=user)
         
-        pending_tasks = tasks.filter(status='pending').count()
-        in_progress_tasks = tasks.filter(status='in_progress').count()
-        completed_tasks = tasks.filter(status='completed').count()
-        
-        sessions = PomodoroSession.objects.for_user_date(
-            user, 'started_at', date_str
-        ).filter(completed=True)
-        total_pomodoros = sessions.filter(is_break=False).count()
+        counts = tasks.aggregate(
+            total=Count('id'),
+            pending=Count('id', filter=Q(status='pending')),
+            in_progress=Count('id', filter=Q(status='in_progress')),
+            completed=Count('id', filter=Q(status='completed')),
+        )
         
-        total_focus_seconds = sessions.filter(is_break=False).aggregate(
-            total=Sum("actual_duration_seconds")
-        )["total"] or 0
+        day = user_date.date()
+        rollups = DailyStatsService.get_range(user, day - timedelta(days=1), day)
+
+        return AnalyticsService._build_daily(user, day, counts, rollups)
+
+    @staticmethod
+    def _build_daily(user, day, counts, rollups):
+        today_stats = rollups.get(day) or UserDailyStats(user=user, date=day)
+        yesterday_stats = rollups.get(day - timedelta(days=1))
+
+        total_pomodoros = today_stats.pomodoros_completed
+        total_focus_seconds = today_stats.focus_seconds
         
         # Comparison with yesterday's focus time
-        yesterday = user_date - timedelta(days=1)
-        yesterday_str = yesterday.date().isoformat()
-        
-        yesterday_sessions = PomodoroSession.objects.for_user_date(
-            user, 'started_at', yesterday_str
-        ).filter(is_break=False, completed=True)
-        
-        yesterdays_focus_seconds = yesterday_sessions.aggregate(
-            total=Sum("actual_duration_seconds")
-        )["total"] or 0
+        yesterdays_focus_seconds = yesterday_stats.focus_seconds if yesterday_stats else 0
         
         diff_seconds = total_focus_seconds - yesterdays_focus_seconds
         
@@ -64,19 +119,11 @@ class AnalyticsService:
             )
         }
         
-        # Hourly aggregation
-        hourly_data = defaultdict(lambda: {"focus": 0, "break": 0})
-        for s in sessions:
-            hour = tz.to_user_timezone(s.started_at).hour
-            if WORK_START_HOUR <= hour <= WORK_END_HOUR:
-                key = "break" if s.is_break else "focus"
-                hourly_data[hour][key] += s.actual_duration_seconds
-                
         ## Chart data
         daily_flow = []
         for hour in range(WORK_START_HOUR, WORK_END_HOUR + 1):
-            focus_sec = hourly_data[hour]["focus"]
-            break_sec = hourly_data[hour]["break"]
+            focus_sec = today_stats.hourly_focus_seconds[hour]
+            break_sec = today_stats.hourly_break_seconds[hour]
             total_sec = focus_sec + break_sec
             productivity_score = round((focus_sec / total_sec * 100), 1) if total_sec > 0 else 0
 
@@ -92,11 +139,11 @@ class AnalyticsService:
         avg_daily_productivity = int(total_productivity / len(daily_flow))
         
         return {
-            'date': user_date.date().isoformat(),
-            'total_tasks': tasks.count(),
-            'completed_tasks': completed_tasks,
-            'pending_tasks': pending_tasks,
-            'in_progress_tasks': in_progress_tasks,
+            'date': day.isoformat(),
+            'total_tasks': counts.get('total', 0),
+            'completed_tasks': counts.get('completed', 0),
+            'pending_tasks': counts.get('pending', 0),
+            'in_progress_tasks': counts.get('in_progress', 0),
             'total_focus_seconds': total_focus_seconds,
             'total_focus_hours': round(total_focus_seconds / 3600, 2),
             'avg_daily_productivity': avg_daily_productivity,
@@ -110,144 +157,647 @@ class AnalyticsService:
         """
         Returns a summary of tasks and focus sessions between start_date and end_date (inclusive)
         """
-        tasks = Task.objects.filter(
-            owner=user,
-            created_at__date__gte=start_date,
-            created_at__date__lte=end_date
-        )
-        total_tasks_completed = tasks.filter(status="completed").count()
-        
-        # Prepare daily breakdown
+        summary = AnalyticsService.get_range_summary(user, start_date, end_date)
+        return AnalyticsService._build_weekly(start_date, end_date, summary)
+
+    @staticmethod
+    def _build_weekly(start_date, end_date, summary):
+        return {
+            "week_start": start_date,
+            "week_end": end_date,
+            "total_tasks_completed": summary["total_tasks_completed"],
+            "total_focus_hours": summary["total_focus_seconds"],
+            "avg_daily_focus_hours": summary["avg_daily_focus_hours"],
+            "daily_breakdown": summary["daily_breakdown"],
+        }
+
+    @staticmethod
+    def get_range_summary(user, start_date, end_date):
+        """
+        Per-day tasks and focus time for an inclusive range of the user's
+        local dates, in two grouped queries whatever the length of the range.
+        """
+        start_date, end_date = as_date(start_date), as_date(end_date)
+        tz = TimezoneHandler(user)
+
+        task_counts = AnalyticsService._task_counts_by_day(user, tz, start_date, end_date)
+        rollups = DailyStatsService.get_range(user, start_date, end_date)
+
+        return AnalyticsService._build_range(start_date, end_date, task_counts, rollups)
+
+    @staticmethod
+    def _task_counts_by_day(user, tz, start_date, end_date):
+        """Task counts per status, grouped by the local date they were created on."""
+        return {
+            row["day"]: row
+            for row in Task.objects.for_user_date_range(
+                user,
+                "created_at",
+                tz.user_tz.localize(datetime.combine(start_date, time.min)),
+                tz.user_tz.localize(datetime.combine(end_date, time.min)),
+            )
+            .filter(owner=user)
+            .annotate(day=TruncDate("created_at", tzinfo=tz.user_tz))
+            .values("day")
+            .annotate(
+                total=Count("id"),
+                pending=Count("id", filter=Q(status="pending")),
+                in_progress=Count("id", filter=Q(status="in_progress")),
+                completed=Count("id", filter=Q(status="completed")),
+            )
+            .order_by()
+        }
+
+    @staticmethod
+    def _build_range(start_date, end_date, task_counts, rollups):
+        """Range summary from task counts and rollups that may cover a wider window."""
         daily_breakdown = []
+        total_tasks = total_completed = total_focus_seconds = 0
         current_date = start_date
         while current_date <= end_date:
-            day_tasks = tasks.filter(created_at__date=current_date)
-            completed = day_tasks.filter(status="completed").count()
-            
-            
-            sessions = PomodoroSession.objects.filter(
-                user=user,
-                started_at__date=current_date,
-                is_break=False,
-                completed=True
-            )
-            focus_hours = round((sessions.aggregate(total=Sum("actual_duration_seconds"))["total"] or 0) / 3600, 2)
+            counts = task_counts.get(current_date, {})
+            day_stats = rollups.get(current_date)
+            focus_seconds = day_stats.focus_seconds if day_stats else 0
 
             daily_breakdown.append({
                 "date": current_date,
-                "focus_hours": focus_hours,
-                "tasks_completed": completed,
-                "total_tasks": day_tasks.count()
+                "focus_hours": round(focus_seconds / 3600, 2),
+                "tasks_completed": counts.get("completed", 0),
+                "total_tasks": counts.get("total", 0),
             })
+            total_tasks += counts.get("total", 0)
+            total_completed += counts.get("completed", 0)
+            total_focus_seconds += focus_seconds
             current_date += timedelta(days=1)
-        # Weekly average daily focus
-        avg_daily_focus_hours = round(sum(d["focus_hours"] for d in daily_breakdown) / len(daily_breakdown), 2)
 
-        total_focus_seconds = sum(d["focus_hours"] * 3600 for d in daily_breakdown)
-    
+        days = len(daily_breakdown) or 1
+
         return {
-            "week_start": start_date,
-            "week_end": end_date,
-            "total_tasks_completed": total_tasks_completed,
-            "total_focus_hours": total_focus_seconds,
-            "avg_daily_focus_hours": avg_daily_focus_hours,
+            "start_date": start_date,
+            "end_date": end_date,
+            "total_tasks": total_tasks,
+            "total_tasks_completed": total_completed,
+            "total_focus_seconds": total_focus_seconds,
+            "avg_daily_focus_hours": round(sum(d["focus_hours"] for d in daily_breakdown) / days, 2),
             "daily_breakdown": daily_breakdown,
         }
         
     @staticmethod
     def get_task_completion_streaks(user):
         """
-        Calculates task completion streaks for a user.
-        A streak day = at least one completed task on that date.
+        Task completion streaks for a user, read from their UserStreak row.
+        A streak day = at least one completed task on that (local) date.
         """
-        # Get all distinct dates with completed tasks
-        completed_days_qs = (
-            Task.objects
-            .filter(owner=user, status="completed")
-            .annotate(day=TruncDate("ended_at"))
-            .values_list("day", flat=True)
-            .distinct()
-            .order_by("day")
-        )
-
-        completed_days = list(completed_days_qs)
-
-        if not completed_days:
-            return {
-                "current_streak": 0,
-                "longest_streak": 0,
-                "streak_start_date": None,
-                "total_active_days": 0,
-            }
-
-        # Calculate streaks
-        longest_streak = 1
-        current_streak = 1
-        temp_streak = 1
-
-        streak_start_date = completed_days[0]
-        longest_streak_start = completed_days[0]
+        streak = UserStreak.objects.filter(user=user).first()
+        if streak is None:
+            streak = StreakService.rebuild(user)
 
-        for i in range(1, len(completed_days)):
-            if completed_days[i] == completed_days[i - 1] + timedelta(days=1):
-                temp_streak += 1
-            else:
-                if temp_streak > longest_streak:
-                    longest_streak = temp_streak
-                    longest_streak_start = completed_days[i - temp_streak]
-                temp_streak = 1
-
-        # Final longest streak check
-        if temp_streak > longest_streak:
-            longest_streak = temp_streak
-            longest_streak_start = completed_days[-temp_streak]
+        today = TimezoneHandler(user).parse_date().date()
+        return AnalyticsService._build_streaks(streak, today)
 
+    @staticmethod
+    def _build_streaks(streak, today):
         # Current streak (must include today or yesterday)
-        today = timezone.now().date()
-
-        if completed_days[-1] == today:
-            current_streak = temp_streak
-            streak_start_date = completed_days[-temp_streak]
-        elif completed_days[-1] == today - timedelta(days=1):
-            current_streak = temp_streak
-            streak_start_date = completed_days[-temp_streak]
-        else:
-            current_streak = 0
-            streak_start_date = None
+        current_alive = (
+            streak.last_active_date is not None
+            and streak.last_active_date >= today - timedelta(days=1)
+        )
 
         return {
-            "current_streak": current_streak,
-            "longest_streak": longest_streak,
-            "streak_start_date": streak_start_date,
-            "total_active_days": len(completed_days),
+            "current_streak": streak.current_streak if current_alive else 0,
+            "longest_streak": streak.longest_streak,
+            "streak_start_date": streak.current_streak_start if current_alive else None,
+            "total_active_days": streak.total_active_days,
         }
         
     @staticmethod
     def get_monthly_active_days(user, year=None, month=None):
-        today = timezone.now().date()
+        today = TimezoneHandler(user).parse_date().date()
 
         year = year or today.year
         month = month or today.month
 
-        start_date = today.replace(day=1)
-        last_day = monthrange(year, month)[1]
-        end_date = today.replace(day=last_day)
+        start_date = date(year, month, 1)
+        end_date = date(year, month, monthrange(year, month)[1])
 
-        active_days = (
-            Task.objects
-            .filter(
-                owner=user,
-                status="completed",
-                updated_at__date__range=(start_date, end_date)
-            )
-            .annotate(day=TruncDate("updated_at"))
-            .values_list("day", flat=True)
-            .distinct()
-            .order_by("day")
-        )
+        heatmap = HeatmapService.get_range(user, start_date, end_date)
+        active_days = [
+            start_date + timedelta(days=offset)
+            for offset, active in enumerate(heatmap["active"])
+            if active
+        ]
 
         return {
             "year": year,
             "month": month,
             "active_days": list(active_days)
-        }
\ No newline at end of file
+        }
+
+    @staticmethod
+    def get_dashboard(user, sections=None):
+        """
+        The home screen's daily, weekly, streaks and monthly sections for
+        the user's current local day, week and month.
+
+        All sections are computed from one fetch of the rollups and one
+        grouped task count over the window they share (plus the streak
+        row), instead of each endpoint querying its own overlapping slice.
+        """
+        sections = sections or AnalyticsService.DASHBOARD_SECTIONS
+        tz = TimezoneHandler(user)
+        today = tz.parse_date().date()
+        week_start = today - timedelta(days=today.weekday())
+        week_end = week_start + timedelta(days=6)
+        month_start = today.replace(day=1)
+        month_end = today.replace(day=monthrange(today.year, today.month)[1])
+
+        windows = {
+            "daily": (today - timedelta(days=1), today),
+            "weekly": (week_start, week_end),
+            "monthly": (month_start, month_end),
+        }
+        needed = [windows[name] for name in sections if name in windows]
+
+        rollups, task_counts = {}, {}
+        if needed:
+            start_date = min(start for start, _ in needed)
+            end_date = max(end for _, end in needed)
+            rollups = DailyStatsService.get_range(user, start_date, end_date)
+            if "daily" in sections or "weekly" in sections:
+                task_counts = AnalyticsService._task_counts_by_day(user, tz, start_date, end_date)
+
+        data = {"date": today}
+        if "daily" in sections:
+            data["daily"] = AnalyticsService._build_daily(
+                user, today, task_counts.get(today, {}), rollups
+            )
+        if "weekly" in sections:
+            data["weekly"] = AnalyticsService._build_weekly(
+                week_start, week_end,
+                AnalyticsService._build_range(week_start, week_end, task_counts, rollups),
+            )
+        if "streaks" in sections:
+            streak = UserStreak.objects.filter(user=user).first() or StreakService.rebuild(user)
+            data["streaks"] = AnalyticsService._build_streaks(streak, today)
+        if "monthly" in sections:
+            # Same days as the heatmap's active bits, which mirror tasks_completed
+            data["monthly"] = {
+                "year": today.year,
+                "month": today.month,
+                "active_days": sorted(
+                    day for day, stats in rollups.items()
+                    if month_start <= day <= month_end and stats.tasks_completed
+                ),
+            }
+        return data
+
+
+class DailyStatsService:
+    """Incremental maintenance and rebuilds of UserDailyStats rollups."""
+
+    @staticmethod
+    def get_range(user, start_date, end_date):
+        """Rollups for the inclusive local date range, keyed by date."""
+        return {
+            stats.date: stats
+            for stats in UserDailyStats.objects.filter(
+                user=user, date__range=(start_date, end_date)
+            )
+        }
+
+    @staticmethod
+    def record_session(session):
+        """Add a completed session to its local start day and the hours it covered."""
+        if not session.completed:
+            return
+
+        user = session.user
+        pauses = session.pauses.values_list("paused_at", "resumed_at")
+        start_date, hourly = DailyStatsService._session_buckets(
+            ZoneInfo(user.timezone),
+            session.started_at,
+            session.ended_at,
+            session.actual_duration_seconds,
+            pauses,
+        )
+        seconds = sum(hourly.values())
+        if session.is_break:
+            counters = {"break_seconds": seconds, "breaks_completed": 1}
+            hourly_field = "hourly_break_seconds"
+        else:
+            counters = {"focus_seconds": seconds, "pomodoros_completed": 1}
+            hourly_field = "hourly_focus_seconds"
+
+        by_date = defaultdict(dict)
+        for (day, hour), bucket_seconds in hourly.items():
+            by_date[day][hour] = bucket_seconds
+        by_date.setdefault(start_date, {})
+
+        with transaction.atomic():
+            for day, hours in by_date.items():
+                DailyStatsService._bump(
+                    user, day, counters if day == start_date else {}, hourly_field, hours
+                )
+            if not session.is_break:
+                HeatmapService.record(user, start_date, focus_seconds=seconds)
+
+    @staticmethod
+    @transaction.atomic
+    def record_sessions(user, sessions):
+        """
+        record_session for a batch of one user's completed sessions, given
+        as (session, pauses) pairs with pauses as (paused_at, resumed_at).
+        Each affected rollup row is read and written once per batch.
+        """
+        user_tz = ZoneInfo(user.timezone)
+        deltas = {}
+        focus_by_day = defaultdict(int)
+
+        def delta_for(day):
+            if day not in deltas:
+                deltas[day] = UserDailyStats(user=user, date=day)
+            return deltas[day]
+
+        for session, pauses in sessions:
+            start_day, hourly = DailyStatsService._session_buckets(
+                user_tz, session.started_at, session.ended_at, session.actual_duration_seconds, pauses
+            )
+            seconds = sum(hourly.values())
+            stats = delta_for(start_day)
+            if session.is_break:
+                stats.break_seconds += seconds
+                stats.breaks_completed += 1
+            else:
+                stats.focus_seconds += seconds
+                stats.pomodoros_completed += 1
+                focus_by_day[start_day] += seconds
+            for (day, hour), bucket_seconds in hourly.items():
+                stats = delta_for(day)
+                buckets = stats.hourly_break_seconds if session.is_break else stats.hourly_focus_seconds
+                buckets[hour] += bucket_seconds
+
+        if not deltas:
+            return
+
+        # Create missing rows first so every row can be locked and updated in place
+        UserDailyStats.objects.bulk_create(
+            [UserDailyStats(user=user, date=day) for day in deltas], ignore_conflicts=True
+        )
+        rows = list(UserDailyStats.objects.select_for_update().filter(user=user, date__in=list(deltas)))
+        now = timezone.now()
+        for row in rows:
+            row.updated_at = now
+            delta = deltas[row.date]
+            for field in ("focus_seconds", "break_seconds", "pomodoros_completed", "breaks_completed"):
+                setattr(row, field, getattr(row, field) + getattr(delta, field))
+            row.hourly_focus_seconds = [a + b for a, b in zip(row.hourly_focus_seconds, delta.hourly_focus_seconds)]
+            row.hourly_break_seconds = [a + b for a, b in zip(row.hourly_break_seconds, delta.hourly_break_seconds)]
+        UserDailyStats.objects.bulk_update(rows, [
+            "focus_seconds", "break_seconds", "pomodoros_completed", "breaks_completed",
+            "hourly_focus_seconds", "hourly_break_seconds", "updated_at",
+        ])
+
+        HeatmapService.record_focus(user, focus_by_day)
+        analytics_cache.touch(user, *deltas)
+
+    @staticmethod
+    def record_task_created(task):
+        DailyStatsService._bump(
+            task.owner, DailyStatsService._local_date(task.owner, task.created_at), {"tasks_created": 1}
+        )
+
+    @staticmethod
+    @transaction.atomic
+    def record_tasks_created(user, tasks):
+        """record_task_created for a batch of one user's tasks, one bump per day."""
+        per_day = defaultdict(int)
+        for task in tasks:
+            per_day[DailyStatsService._local_date(user, task.created_at)] += 1
+        for day, count in per_day.items():
+            DailyStatsService._bump(user, day, {"tasks_created": count})
+
+    @staticmethod
+    @transaction.atomic
+    def record_task_completed(task):
+        day = DailyStatsService._local_date(task.owner, task.ended_at or timezone.now())
+        DailyStatsService._bump(task.owner, day, {"tasks_completed": 1})
+        HeatmapService.record(task.owner, day, active=True)
+
+    @staticmethod
+    def _local_date(user, when):
+        return TimezoneHandler(user).to_user_timezone(when).date()
+
+    @staticmethod
+    def _session_buckets(user_tz, started_at, ended_at, duration, pauses):
+        """(local start date, {(date, hour): seconds}) for one completed session."""
+        seconds = max(0, duration or 0)
+        start_local = started_at.astimezone(user_tz)
+        hourly = {}
+        if ended_at and ended_at > started_at:
+            hourly = split_by_local_hour(
+                active_intervals(started_at, ended_at, pauses), user_tz, seconds
+            )
+        if not hourly:
+            hourly = {(start_local.date(), start_local.hour): seconds}
+        return start_local.date(), hourly
+
+    @staticmethod
+    def _bump(user, day, counters, hourly_field=None, hours=None):
+        with transaction.atomic():
+            stats, _ = (
+                UserDailyStats.objects
+                .select_for_update()
+                .get_or_create(user=user, date=day)
+            )
+            for field, amount in counters.items():
+                setattr(stats, field, getattr(stats, field) + amount)
+            if hourly_field and hours:
+                buckets = list(getattr(stats, hourly_field))
+                for hour, seconds in hours.items():
+                    buckets[hour] += seconds
+                setattr(stats, hourly_field, buckets)
+            stats.save()
+        analytics_cache.touch(user, day)
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild(user, start_date=None, end_date=None):
+        """
+        Recompute the user's rollups from raw tasks and sessions, for the
+        inclusive local date range or the whole history. Returns the number
+        of day rows written.
+        """
+        tz = TimezoneHandler(user)
+        bounds = {}
+        if start_date:
+            bounds["gte"] = tz.user_tz.localize(datetime.combine(start_date, time.min))
+        if end_date:
+            bounds["lt"] = tz.user_tz.localize(datetime.combine(end_date + timedelta(days=1), time.min))
+
+        def in_range(field):
+            return {f"{field}__{lookup}": value for lookup, value in bounds.items()}
+
+        days = {}
+
+        def in_dates(day):
+            return (not start_date or day >= start_date) and (not end_date or day <= end_date)
+
+        def stats_for(day):
+            if day not in days:
+                days[day] = UserDailyStats(user=user, date=day)
+            return days[day]
+
+        def day_for(when):
+            return stats_for(tz.to_user_timezone(when).date())
+
+        # Sessions started the evening before the range can spill into its first day
+        session_bounds = dict(bounds)
+        if start_date:
+            session_bounds["gte"] = bounds["gte"] - timedelta(days=1)
+        sessions = PomodoroSession.objects.filter(
+            user=user,
+            completed=True,
+            **{f"started_at__{lookup}": value for lookup, value in session_bounds.items()},
+        )
+        pauses = defaultdict(list)
+        for session_id, paused_at, resumed_at in PomodoroPause.objects.filter(
+            session__in=sessions
+        ).values_list("session_id", "paused_at", "resumed_at"):
+            pauses[session_id].append((paused_at, resumed_at))
+
+        user_tz = ZoneInfo(user.timezone)
+        for session_id, started_at, ended_at, is_break, duration in sessions.values_list(
+            "id", "started_at", "ended_at", "is_break", "actual_duration_seconds"
+        ):
+            start_day, hourly = DailyStatsService._session_buckets(
+                user_tz, started_at, ended_at, duration, pauses[session_id]
+            )
+            if in_dates(start_day):
+                stats = stats_for(start_day)
+                if is_break:
+                    stats.break_seconds += sum(hourly.values())
+                    stats.breaks_completed += 1
+                else:
+                    stats.focus_seconds += sum(hourly.values())
+                    stats.pomodoros_completed += 1
+            for (day, hour), seconds in hourly.items():
+                if in_dates(day):
+                    stats = stats_for(day)
+                    buckets = stats.hourly_break_seconds if is_break else stats.hourly_focus_seconds
+                    buckets[hour] += seconds
+
+        for created_at in Task.objects.filter(
+            owner=user, **in_range("created_at")
+        ).values_list("created_at", flat=True):
+            day_for(created_at).tasks_created += 1
+
+        for ended_at in Task.objects.filter(
+            owner=user, status="completed", ended_at__isnull=False, **in_range("ended_at")
+        ).values_list("ended_at", flat=True):
+            day_for(ended_at).tasks_completed += 1
+
+        existing = UserDailyStats.objects.filter(user=user)
+        if start_date:
+            existing = existing.filter(date__gte=start_date)
+        if end_date:
+            existing = existing.filter(date__lte=end_date)
+        existing.delete()
+
+        UserDailyStats.objects.bulk_create(days.values())
+
+        years = None
+        if start_date and end_date:
+            years = range(start_date.year, end_date.year + 1)
+        HeatmapService.rebuild(user, years)
+        analytics_cache.invalidate_user(user.pk)
+        return len(days)
+
+
+class StreakService:
+    """Incremental maintenance and rebuilds of UserStreak rows."""
+
+    @staticmethod
+    @transaction.atomic
+    def record_completion(user, when):
+        """Count a task completed at `when` towards the user's streak."""
+        day = TimezoneHandler(user).to_user_timezone(when).date()
+        streak, created = UserStreak.objects.select_for_update().get_or_create(user=user)
+        if created:
+            # First write since streaks were stored: count the earlier history too
+            return StreakService.rebuild(user)
+
+        last = streak.last_active_date
+        if last == day:
+            return streak
+        if last is not None and day < last:
+            # Out-of-order completion (e.g. after a timezone change)
+            return StreakService.rebuild(user)
+
+        if last is not None and day == last + timedelta(days=1):
+            streak.current_streak += 1
+        else:
+            streak.current_streak = 1
+            streak.current_streak_start = day
+        streak.total_active_days += 1
+        streak.last_active_date = day
+
+        if streak.current_streak > streak.longest_streak:
+            streak.longest_streak = streak.current_streak
+            streak.longest_streak_start = streak.current_streak_start
+
+        streak.save()
+        return streak
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild(user):
+        """Recompute the streak row from the user's completed tasks."""
+        tz = TimezoneHandler(user)
+        days = sorted({
+            tz.to_user_timezone(ended_at).date()
+            for ended_at in Task.objects.filter(
+                owner=user, status="completed", ended_at__isnull=False
+            ).values_list("ended_at", flat=True)
+        })
+
+        streak, _ = UserStreak.objects.select_for_update().get_or_create(user=user)
+        streak.current_streak = 0
+        streak.current_streak_start = None
+        streak.longest_streak = 0
+        streak.longest_streak_start = None
+        streak.last_active_date = None
+
+        for day in days:
+            if streak.last_active_date and day == streak.last_active_date + timedelta(days=1):
+                streak.current_streak += 1
+            else:
+                streak.current_streak = 1
+                streak.current_streak_start = day
+            streak.last_active_date = day
+            if streak.current_streak > streak.longest_streak:
+                streak.longest_streak = streak.current_streak
+                streak.longest_streak_start = streak.current_streak_start
+
+        streak.total_active_days = len(days)
+        streak.save()
+        analytics_cache.invalidate_user(user.pk)
+        return streak
+
+
+class HeatmapService:
+    """Maintenance and reads of the per-year UserActivityYear heatmap rows."""
+
+    MAX_RANGE_DAYS = 5 * 366
+
+    @staticmethod
+    def _index(day):
+        return day.timetuple().tm_yday - 1
+
+    @staticmethod
+    @transaction.atomic
+    def record(user, day, *, active=False, focus_seconds=0):
+        """Mark `day` active and/or add focus seconds to it."""
+        row, _ = (
+            UserActivityYear.objects
+            .select_for_update()
+            .get_or_create(user=user, year=day.year)
+        )
+        index = HeatmapService._index(day)
+        if active:
+            bitmap = bytearray(row.active_days)
+            bitmap[index // 8] |= 1 << (index % 8)
+            row.active_days = bytes(bitmap)
+        if focus_seconds:
+            counters = bytearray(row.focus_seconds)
+            current, = struct.unpack_from("<I", counters, index * 4)
+            struct.pack_into("<I", counters, index * 4, current + focus_seconds)
+            row.focus_seconds = bytes(counters)
+        row.save()
+
+    @staticmethod
+    @transaction.atomic
+    def record_focus(user, seconds_by_day):
+        """Add focus seconds to many days, with one row write per year."""
+        by_year = defaultdict(dict)
+        for day, seconds in seconds_by_day.items():
+            by_year[day.year][day] = seconds
+
+        for year, days in by_year.items():
+            row, _ = (
+                UserActivityYear.objects
+                .select_for_update()
+                .get_or_create(user=user, year=year)
+            )
+            counters = bytearray(row.focus_seconds)
+            for day, seconds in days.items():
+                index = HeatmapService._index(day)
+                current, = struct.unpack_from("<I", counters, index * 4)
+                struct.pack_into("<I", counters, index * 4, current + seconds)
+            row.focus_seconds = bytes(counters)
+            row.save()
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild(user, years=None):
+        """Recompute heatmap rows from the UserDailyStats rollups."""
+        rollups = UserDailyStats.objects.filter(user=user)
+        existing = UserActivityYear.objects.filter(user=user)
+        if years is not None:
+            rollups = rollups.filter(date__year__in=list(years))
+            existing = existing.filter(year__in=list(years))
+
+        rows = {}
+        for day, tasks_completed, focus_seconds in rollups.values_list(
+            "date", "tasks_completed", "focus_seconds"
+        ):
+            if day.year not in rows:
+                rows[day.year] = (bytearray(empty_day_bitmap()), bytearray(empty_day_counters()))
+            bitmap, counters = rows[day.year]
+            index = HeatmapService._index(day)
+            if tasks_completed:
+                bitmap[index // 8] |= 1 << (index % 8)
+            struct.pack_into("<I", counters, index * 4, focus_seconds)
+
+        existing.delete()
+        UserActivityYear.objects.bulk_create([
+            UserActivityYear(
+                user=user, year=year, active_days=bytes(bitmap), focus_seconds=bytes(counters)
+            )
+            for year, (bitmap, counters) in rows.items()
+        ])
+        analytics_cache.invalidate_user(user.pk)
+
+    @staticmethod
+    def get_range(user, start_date, end_date):
+        """
+        Day-by-day activity for an inclusive range of local dates: parallel
+        `active` (0/1) and `focus_minutes` lists, one entry per day.
+        """
+        years = {
+            row.year: (bytes(row.active_days), struct.unpack(f"<{DAYS_IN_YEAR}I", bytes(row.focus_seconds)))
+            for row in UserActivityYear.objects.filter(
+                user=user, year__range=(start_date.year, end_date.year)
+            )
+        }
+
+        active, focus_minutes = [], []
+        current_date = start_date
+        while current_date <= end_date:
+            bitmap, counters = years.get(current_date.year, (None, None))
+            if bitmap is None:
+                active.append(0)
+                focus_minutes.append(0)
+            else:
+                index = HeatmapService._index(current_date)
+                active.append((bitmap[index // 8] >> (index % 8)) & 1)
+                focus_minutes.append(counters[index] // 60)
+            current_date += timedelta(days=1)
+
+        return {
+            "start_date": start_date,
+            "end_date": end_date,
+            "active_days": sum(active),
+            "total_focus_minutes": sum(focus_minutes),
+            "active": active,
+            "focus_minutes": focus_minutes,
+        }
@@ -0,0 +1,99 @@
+"""
+Dashboard benchmark: one composite request against the four endpoints
+the home screen used to call.
+
+Not collected by the default test run; invoke explicitly:
+
+    python manage.py test apps.analytics.tests.bench_dashboard
+
+Each request authenticates with the access token cookie, as the frontend
+does. The analytics cache is cleared before every run so both sides
+compute from the database.
+"""
+import statistics
+import time
+from datetime import datetime, timedelta
+
+import pytz
+from django.core.cache import cache
+from django.db import connection
+from django.contrib.auth import get_user_model
+from django.conf import settings
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.accounts.token_cache import token_user_cache
+from apps.analytics.services import DailyStatsService
+from apps.pomodoro.models import PomodoroSession
+from apps.tasks.models import Task
+
+User = get_user_model()
+
+DAYS = 60
+RUNS = 10
+HOME_SCREEN = ("/analytics/daily/", "/analytics/weekly/", "/analytics/streaks/", "/analytics/activity-heatmap/monthly/")
+
+
+class DashboardBenchmark(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="dash@example.com", password="password123")
+        cls.user.timezone = "Asia/Kathmandu"
+        cls.user.save()
+
+        now = timezone.now().replace(minute=0, second=0, microsecond=0)
+        tasks, sessions = [], []
+        for offset in range(DAYS):
+            day = now - timedelta(days=offset)
+            for n in range(6):
+                tasks.append(Task(
+                    title=f"Task {offset}-{n}",
+                    owner=cls.user,
+                    status="completed" if n % 2 else "pending",
+                    ended_at=day,
+                ))
+            for n in range(8):
+                started = day - timedelta(hours=n)
+                sessions.append(PomodoroSession(
+                    user=cls.user,
+                    started_at=started,
+                    ended_at=started + timedelta(minutes=25),
+                    actual_duration_seconds=25 * 60,
+                    completed=True,
+                    is_break=bool(n % 2),
+                    state="TERMINATED",
+                ))
+        for task in Task.objects.bulk_create(tasks):
+            Task.objects.filter(pk=task.pk).update(created_at=task.ended_at)
+        PomodoroSession.objects.bulk_create(sessions)
+        DailyStatsService.rebuild(cls.user)
+
+    def setUp(self):
+        token = str(RefreshToken.for_user(self.user).access_token)
+        self.client.cookies[settings.AUTH_COOKIE] = token
+
+    def measure(self, paths):
+        def load():
+            cache.clear()
+            token_user_cache.clear()
+            for path in paths:
+                self.assertEqual(self.client.get(path).status_code, 200)
+
+        # request_started resets connection.queries, so count with a wrapper
+        queries = []
+        with connection.execute_wrapper(lambda execute, sql, *args: queries.append(sql) or execute(sql, *args)):
+            load()
+        timings = []
+        for _ in range(RUNS):
+            started = time.perf_counter()
+            load()
+            timings.append(time.perf_counter() - started)
+        return {"queries": len(queries), "median_ms": round(statistics.median(timings) * 1000, 2)}
+
+    def test_dashboard_against_separate_endpoints(self):
+        separate = self.measure(HOME_SCREEN)
+        dashboard = self.measure(["/analytics/dashboard/"])
+        print(f"\nseparate endpoints: {separate}\ndashboard: {dashboard}")
+
+        self.assertLess(dashboard["queries"], separate["queries"])
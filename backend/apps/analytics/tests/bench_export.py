@@ -0,0 +1,88 @@
+"""
+History export benchmark: peak memory against history size.
+
+Not collected by the default test run; invoke explicitly:
+
+    python manage.py test apps.analytics.tests.bench_export
+
+Streams the NDJSON export, through astream() as ASGI serves it, for users with 10k, 100k and 1M sessions and
+reports tracemalloc peaks, next to loading the same rows into a list as
+the unpaginated session list does. Set EXPORT_BENCH_MAX_SESSIONS to
+shrink the largest user on slow machines.
+"""
+import os
+import time
+import tracemalloc
+from datetime import timedelta
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.analytics.exports import HistoryExporter
+from apps.pomodoro.models import PomodoroSession
+
+User = get_user_model()
+
+MAX_SESSIONS = int(os.getenv("EXPORT_BENCH_MAX_SESSIONS", 1_000_000))
+SIZES = sorted({min(size, MAX_SESSIONS) for size in (10_000, 100_000, 1_000_000)})
+BATCH = 20_000
+
+
+async def streamed_size(exporter):
+    size = 0
+    async for chunk in exporter.astream("ndjson"):
+        size += len(chunk)
+    return size
+
+
+def peak_kib(fn):
+    tracemalloc.start()
+    try:
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, round(peak / 1024), round(elapsed, 2)
+
+
+class ExportBenchmark(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = {}
+        started = timezone.now() - timedelta(days=3650)
+        for size in SIZES:
+            user = User.objects.create_user(email=f"export{size}@example.com", password="password123")
+            for offset in range(0, size, BATCH):
+                PomodoroSession.objects.bulk_create([
+                    PomodoroSession(
+                        user=user,
+                        started_at=started + timedelta(minutes=5 * n),
+                        ended_at=started + timedelta(minutes=5 * n + 25),
+                        actual_duration_seconds=25 * 60,
+                        completed=True,
+                        state="TERMINATED",
+                    )
+                    for n in range(offset, min(offset + BATCH, size))
+                ])
+            cls.users[size] = user
+
+    def test_streaming_memory_is_flat(self):
+        peaks = []
+        for size, user in self.users.items():
+            exporter = HistoryExporter(user, ("sessions",))
+            written, peak, seconds = peak_kib(lambda: async_to_sync(streamed_size)(exporter))
+            peaks.append(peak)
+
+            listed = ""
+            if size <= 100_000:
+                _, list_peak, _ = peak_kib(lambda: list(exporter.queryset("sessions").values()))
+                listed = f" in-memory list peak={list_peak} KiB"
+            print(f"\n{size:>9} sessions: {written / 2**20:.1f} MiB streamed in {seconds}s, "
+                  f"stream peak={peak} KiB{listed}")
+
+        # Peak memory does not grow with history size
+        self.assertLess(max(peaks), min(peaks) * 2)
@@ -0,0 +1,65 @@
+"""
+Activity heatmap benchmark: read latency against task volume.
+
+Not collected by the default test run; invoke explicitly:
+
+    python manage.py test apps.analytics.tests.bench_heatmap
+
+A 365-day heatmap is read for users with 100, 1,000 and 10,000 completed
+tasks. The read only touches UserActivityYear rows, so query count and
+latency should stay flat as the task table grows.
+"""
+import statistics
+import time
+from datetime import date, datetime, timedelta
+
+import pytz
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+
+from apps.analytics.services import DailyStatsService, HeatmapService
+from apps.tasks.models import Task
+
+User = get_user_model()
+
+END = date(2026, 3, 31)
+TASK_COUNTS = (100, 1000, 10000)
+RUNS = 20
+
+
+class HeatmapBenchmark(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = {}
+        for count in TASK_COUNTS:
+            user = User.objects.create_user(email=f"heat{count}@example.com", password="password123")
+            Task.objects.bulk_create([
+                Task(
+                    title=f"Task {n}",
+                    owner=user,
+                    status="completed",
+                    ended_at=datetime.combine(
+                        END - timedelta(days=n % 365), datetime.min.time()
+                    ).replace(hour=12, tzinfo=pytz.UTC),
+                )
+                for n in range(count)
+            ])
+            DailyStatsService.rebuild(user)
+            cls.users[count] = user
+
+    def test_latency_is_independent_of_task_count(self):
+        start = END - timedelta(days=364)
+        for count, user in self.users.items():
+            with CaptureQueriesContext(connection) as queries:
+                HeatmapService.get_range(user, start, END)
+            timings = []
+            for _ in range(RUNS):
+                started = time.perf_counter()
+                HeatmapService.get_range(user, start, END)
+                timings.append(time.perf_counter() - started)
+            print(f"\n{count:>5} tasks: queries={len(queries)} "
+                  f"median_ms={round(statistics.median(timings) * 1000, 2)}")
+
+            self.assertEqual(len(queries), 1)
@@ -0,0 +1,101 @@
+"""
+Range summary benchmark over a user with a year of history.
+
+Not collected by the default test run; invoke explicitly:
+
+    python manage.py test apps.analytics.tests.bench_summary
+
+Compares the grouped range summary with the per-day query loop it
+replaced, reporting query counts and median wall time per call.
+"""
+import statistics
+import time
+from datetime import date, datetime, timedelta
+
+import pytz
+from django.db import connection
+from django.db.models import Sum
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+
+from apps.analytics.services import AnalyticsService, DailyStatsService
+from apps.pomodoro.models import PomodoroSession
+from apps.tasks.models import Task
+
+User = get_user_model()
+
+END = date(2026, 3, 31)
+DAYS = 365
+RUNS = 5
+
+
+def per_day_loop(user, start_date, end_date):
+    """The pre-rollup weekly summary: several queries per day."""
+    tasks = Task.objects.filter(
+        owner=user, created_at__date__gte=start_date, created_at__date__lte=end_date
+    )
+    tasks.filter(status="completed").count()
+    current_date = start_date
+    while current_date <= end_date:
+        day_tasks = tasks.filter(created_at__date=current_date)
+        day_tasks.filter(status="completed").count()
+        PomodoroSession.objects.filter(
+            user=user, started_at__date=current_date, is_break=False, completed=True
+        ).aggregate(total=Sum("actual_duration_seconds"))
+        day_tasks.count()
+        current_date += timedelta(days=1)
+
+
+class RangeSummaryBenchmark(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="year@example.com", password="password123")
+        cls.user.timezone = "Asia/Kathmandu"
+        cls.user.save()
+
+        tasks, sessions = [], []
+        for offset in range(DAYS):
+            day = datetime.combine(END - timedelta(days=offset), datetime.min.time()).replace(tzinfo=pytz.UTC)
+            for n in range(4):
+                tasks.append(Task(
+                    title=f"Task {offset}-{n}",
+                    owner=cls.user,
+                    status="completed" if n % 2 else "pending",
+                    ended_at=day + timedelta(hours=9 + n),
+                ))
+            for n in range(8):
+                started = day + timedelta(hours=8 + n)
+                sessions.append(PomodoroSession(
+                    user=cls.user,
+                    started_at=started,
+                    ended_at=started + timedelta(minutes=25),
+                    actual_duration_seconds=25 * 60,
+                    completed=True,
+                    is_break=bool(n % 2),
+                    state="TERMINATED",
+                ))
+        for task in Task.objects.bulk_create(tasks):
+            # auto_now_add ignores explicit values on create
+            Task.objects.filter(pk=task.pk).update(created_at=task.ended_at - timedelta(hours=1))
+        PomodoroSession.objects.bulk_create(sessions)
+        DailyStatsService.rebuild(cls.user)
+
+    def measure(self, fn, runs=RUNS):
+        with CaptureQueriesContext(connection) as queries:
+            fn()
+        timings = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - started)
+        return {"queries": len(queries), "median_ms": round(statistics.median(timings) * 1000, 2)}
+
+    def test_ranges(self):
+        for days in (7, 90, DAYS):
+            start = END - timedelta(days=days - 1)
+            grouped = self.measure(lambda: AnalyticsService.get_range_summary(self.user, start, END))
+            loop = self.measure(lambda: per_day_loop(self.user, start, END), runs=1)
+            print(f"\n{days:>3} days grouped: {grouped}  per-day loop: {loop}")
+
+            self.assertEqual(grouped["queries"], 2)
@@ -0,0 +1,93 @@
+from datetime import timedelta
+from django.utils import timezone
+
+from apps.analytics.cache import analytics_cache
+from apps.analytics.models import UserDailyStats
+from apps.analytics.services import DailyStatsService
+from apps.pomodoro.tests.base import BaseAPITestCase
+from apps.tasks.models import Task
+
+
+class TestAnalyticsCache(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        analytics_cache.reset_stats()
+        self.today = timezone.now().date()
+        self.week_ago = self.today - timedelta(days=7)
+
+    def range_url(self, start, end):
+        return f"/analytics/range/?start_date={start}&end_date={end}"
+
+    def test_repeated_request_is_served_from_cache(self):
+        url = self.range_url(self.week_ago, self.today)
+        first = self.client.get(url)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(url)
+
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(analytics_cache.stats()["hits"], 1)
+        self.assertEqual(analytics_cache.stats()["hit_rate"], 0.5)
+
+    def test_today_write_keeps_past_ranges(self):
+        past = self.range_url(self.week_ago, self.today - timedelta(days=1))
+        current = self.range_url(self.week_ago, self.today)
+        self.client.get(past)
+        self.client.get(current)
+
+        DailyStatsService._bump(self.user, self.today, {"focus_seconds": 600})
+
+        with self.assertNumQueries(0):
+            self.client.get(past)
+        response = self.client.get(current)
+        self.assertEqual(response.data["daily_breakdown"][-1]["focus_hours"], round(600 / 3600, 2))
+
+    def test_past_write_invalidates_past_ranges(self):
+        past = self.range_url(self.week_ago, self.today - timedelta(days=1))
+        self.client.get(past)
+
+        DailyStatsService._bump(self.user, self.week_ago, {"focus_seconds": 3600})
+
+        response = self.client.get(past)
+        self.assertEqual(response.data["daily_breakdown"][0]["focus_hours"], 1.0)
+
+    def test_task_status_change_refreshes_daily_summary(self):
+        self.assertEqual(self.client.get("/analytics/daily/").data["pending_tasks"], 1)
+
+        self.task.status = "completed"
+        self.task.save()
+
+        self.assertEqual(self.client.get("/analytics/daily/").data["pending_tasks"], 0)
+
+    def test_users_do_not_share_entries(self):
+        UserDailyStats.objects.create(user=self.user, date=self.today, tasks_completed=1)
+        self.client.get("/analytics/activity-heatmap/monthly/")
+
+        other = type(self.user).objects.create_user(email="other@example.com", password="password123")
+        Task.objects.create(title="Other", owner=other)
+        self.client.force_authenticate(other)
+
+        self.assertEqual(self.client.get("/analytics/activity-heatmap/monthly/").data["active_days"], [])
+
+    def test_stats_endpoint_requires_admin(self):
+        self.assertEqual(self.client.get("/analytics/cache-stats/").status_code, 403)
+
+        self.user.is_staff = True
+        self.user.save()
+        response = self.client.get("/analytics/cache-stats/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("hit_rate", response.data)
+
+    def test_unchanged_result_is_not_modified(self):
+        url = self.range_url(self.week_ago, self.today)
+        etag = self.client.get(url)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        # Answered from the ETag, without looking the result up
+        self.assertEqual(analytics_cache.stats()["hits"], 0)
+
+        DailyStatsService._bump(self.user, self.today, {"focus_seconds": 600})
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
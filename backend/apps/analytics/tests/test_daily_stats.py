@@ -0,0 +1,111 @@
+from datetime import date, datetime, timedelta
+from io import StringIO
+import pytz
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.analytics.models import UserDailyStats
+from apps.analytics.services import AnalyticsService, DailyStatsService, HeatmapService
+from apps.pomodoro.models import PomodoroSession
+from apps.pomodoro.services import PomodoroService
+from apps.pomodoro.tests.base import BaseAPITestCase
+from apps.tasks.services import TaskService
+
+
+class TestDailyStatsRollup(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.user.timezone = "Asia/Kathmandu"  # UTC+05:45
+        self.user.save()
+        # 20:00 UTC is 01:45 the next day in Kathmandu
+        self.started_at = datetime(2026, 3, 9, 20, 0, tzinfo=pytz.UTC)
+
+    def complete_focus(self, minutes=25):
+        session = PomodoroSession.objects.create(
+            user=self.user, task=self.task, started_at=self.started_at
+        )
+        PomodoroService.complete_session(
+            session, manual=True, ended_at=self.started_at + timedelta(minutes=minutes)
+        )
+        return session
+
+    def test_completed_session_lands_on_local_day_and_hour(self):
+        self.complete_focus()
+
+        stats = UserDailyStats.objects.get(user=self.user)
+        self.assertEqual(stats.date, date(2026, 3, 10))
+        self.assertEqual(stats.focus_seconds, 25 * 60)
+        self.assertEqual(stats.pomodoros_completed, 1)
+        # 01:45-02:10 local, split over the two hours
+        self.assertEqual(stats.hourly_focus_seconds[1], 15 * 60)
+        self.assertEqual(stats.hourly_focus_seconds[2], 10 * 60)
+
+    def test_task_creation_and_completion_are_counted(self):
+        response = self.client.post("/tasks/", {"title": "New"}, format="json")
+        self.assertEqual(response.status_code, 201)
+
+        PomodoroSession.objects.create(user=self.user, task=self.task)
+        TaskService.complete_task(self.task, self.user)
+
+        today = timezone.now().astimezone(pytz.timezone("Asia/Kathmandu")).date()
+        stats = UserDailyStats.objects.get(user=self.user, date=today)
+        self.assertEqual(stats.tasks_created, 1)
+        self.assertEqual(stats.tasks_completed, 1)
+        self.assertEqual(stats.pomodoros_completed, 1)
+
+    def test_rebuild_matches_incremental_rollup(self):
+        self.complete_focus(minutes=20)
+        self.complete_focus(minutes=30)
+        incremental = UserDailyStats.objects.get(user=self.user, date=date(2026, 3, 10))
+
+        UserDailyStats.objects.all().delete()
+        DailyStatsService.rebuild(self.user, date(2026, 3, 1), date(2026, 3, 31))
+
+        rebuilt = UserDailyStats.objects.get(user=self.user, date=date(2026, 3, 10))
+        self.assertEqual(rebuilt.focus_seconds, incremental.focus_seconds)
+        self.assertEqual(rebuilt.pomodoros_completed, 2)
+        self.assertEqual(rebuilt.hourly_focus_seconds, incremental.hourly_focus_seconds)
+
+    def test_rebuild_command_limits_to_range(self):
+        self.complete_focus()
+        UserDailyStats.objects.create(user=self.user, date=date(2026, 1, 5), focus_seconds=99)
+
+        call_command("rebuild_daily_stats", user=[self.user.email], start=date(2026, 3, 1), end=date(2026, 3, 31), stdout=StringIO())
+
+        self.assertEqual(UserDailyStats.objects.get(date=date(2026, 1, 5)).focus_seconds, 99)
+        self.assertEqual(UserDailyStats.objects.get(date=date(2026, 3, 10)).focus_seconds, 25 * 60)
+
+    def test_summaries_read_rollups(self):
+        UserDailyStats.objects.create(user=self.user, date=date(2026, 3, 9), focus_seconds=600)
+        UserDailyStats.objects.create(
+            user=self.user, date=date(2026, 3, 10), focus_seconds=1200, tasks_completed=2
+        )
+
+        daily = AnalyticsService.get_daily_summary(self.user, "2026-03-10")
+        self.assertEqual(daily["total_focus_seconds"], 1200)
+        self.assertEqual(daily["comparison"]["difference_seconds"], 600)
+
+        HeatmapService.rebuild(self.user)
+        monthly = AnalyticsService.get_monthly_active_days(self.user, 2026, 3)
+        self.assertEqual(monthly["active_days"], [date(2026, 3, 10)])
+
+    def test_timezone_change_rebuilds_rollups(self):
+        # 20:00 UTC on the 9th is the 10th in Kathmandu, the 9th in UTC
+        self.complete_focus()
+        HeatmapService.rebuild(self.user)
+
+        response = self.client.patch("/auth/profile/", {"timezone": "UTC"}, format="json")
+        self.assertEqual(response.status_code, 200)
+
+        daily = self.client.get("/analytics/daily/?date=2026-03-09").data
+        self.assertEqual(daily["total_focus_seconds"], 25 * 60)
+        self.assertEqual(self.client.get("/analytics/daily/?date=2026-03-10").data["total_focus_seconds"], 0)
+
+        weekly = self.client.get("/analytics/weekly/?start_date=2026-03-09&end_date=2026-03-15").data
+        self.assertEqual(weekly["total_focus_hours"], 25 * 60)
+        self.assertEqual(
+            [day["focus_hours"] for day in weekly["daily_breakdown"][:2]], [round(25 / 60, 2), 0]
+        )
+
+        heatmap = HeatmapService.get_range(self.user, date(2026, 3, 9), date(2026, 3, 10))
+        self.assertEqual(heatmap["focus_minutes"], [25, 0])
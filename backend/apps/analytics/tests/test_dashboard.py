@@ -0,0 +1,52 @@
+from datetime import timedelta
+from django.utils import timezone
+
+from apps.analytics.models import UserDailyStats
+from apps.analytics.services import AnalyticsService, HeatmapService, StreakService
+from apps.pomodoro.tests.base import BaseAPITestCase
+from apps.tasks.models import Task
+
+
+class TestDashboard(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.today = timezone.now().date()
+        for offset in range(3):
+            day = self.today - timedelta(days=offset)
+            UserDailyStats.objects.create(
+                user=self.user, date=day, focus_seconds=1800 * (offset + 1),
+                pomodoros_completed=offset + 1, tasks_completed=1,
+            )
+        Task.objects.create(title="Done", owner=self.user, status="completed", ended_at=timezone.now())
+        StreakService.rebuild(self.user)
+        HeatmapService.rebuild(self.user)
+
+    def test_sections_match_individual_services(self):
+        week_start = self.today - timedelta(days=self.today.weekday())
+
+        with self.assertNumQueries(3):
+            dashboard = AnalyticsService.get_dashboard(self.user)
+
+        self.assertEqual(dashboard["daily"], AnalyticsService.get_daily_summary(self.user))
+        self.assertEqual(
+            dashboard["weekly"],
+            AnalyticsService.get_weekly_summary(self.user, week_start, week_start + timedelta(days=6)),
+        )
+        self.assertEqual(dashboard["streaks"], AnalyticsService.get_task_completion_streaks(self.user))
+        monthly = AnalyticsService.get_monthly_active_days(self.user)
+        self.assertEqual(dashboard["monthly"]["active_days"], monthly["active_days"])
+
+    def test_section_selection(self):
+        with self.assertNumQueries(1):
+            data = AnalyticsService.get_dashboard(self.user, ("streaks",))
+
+        self.assertEqual(set(data), {"date", "streaks"})
+
+    def test_endpoint(self):
+        response = self.client.get("/analytics/dashboard/?sections=daily,monthly")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.data), {"date", "daily", "monthly"})
+        self.assertEqual(response.data["daily"]["completed_tasks"], 1)
+
+        response = self.client.get("/analytics/dashboard/?sections=daily,yearly")
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,78 @@
+import csv
+import json
+from datetime import datetime, timedelta
+
+import pytz
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.pomodoro.models import PomodoroSession, PomodoroPause
+from apps.pomodoro.tests.base import BaseAPITestCase
+
+
+class TestExport(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        started = datetime(2026, 3, 10, 9, tzinfo=pytz.UTC)
+        self.session = PomodoroSession.objects.create(
+            user=self.user, task=self.task, started_at=started,
+            ended_at=started + timedelta(minutes=25), completed=True, state="TERMINATED",
+        )
+        PomodoroPause.objects.create(
+            session=self.session, paused_at=started + timedelta(minutes=5),
+            resumed_at=started + timedelta(minutes=7),
+        )
+        PomodoroSession.objects.create(
+            user=self.user, started_at=started + timedelta(days=30), is_break=True, break_type="short",
+        )
+
+    def read(self, response):
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return async_to_sync(self.aread)(response)
+
+    async def aread(self, response):
+        return b"".join([chunk async for chunk in response.streaming_content]).decode()
+
+    def test_ndjson_exports_every_record_kind(self):
+        response = self.client.get("/analytics/export/")
+        rows = [json.loads(line) for line in self.read(response).splitlines()]
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual([row["type"] for row in rows], ["task", "session", "session", "pause"])
+        self.assertEqual(rows[3]["session_id"], self.session.id)
+        self.assertEqual(rows[1]["started_at"], "2026-03-10T09:00:00Z")
+
+    def test_csv_with_date_range(self):
+        response = self.client.get("/analytics/export/?output=csv&records=sessions&start_date=2026-03-01&end_date=2026-03-31")
+        rows = list(csv.reader(self.read(response).splitlines()))
+
+        self.assertIn("attachment", response["Content-Disposition"])
+        self.assertEqual(rows[0][:2], ["id", "task_id"])
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1][0], str(self.session.id))
+
+    def test_other_users_history_is_excluded(self):
+        other = type(self.user).objects.create_user(email="other@example.com", password="password123")
+        PomodoroSession.objects.create(user=other, started_at=timezone.now())
+
+        rows = self.read(self.client.get("/analytics/export/?records=sessions")).splitlines()
+
+        self.assertEqual(len(rows), 2)
+
+    def test_invalid_parameters(self):
+        for query in ("output=xml", "records=notes", "output=csv&records=tasks,sessions", "start_date=yesterday"):
+            self.assertEqual(self.client.get(f"/analytics/export/?{query}").status_code, 400, query)
+
+    async def test_streams_asynchronously_under_asgi(self):
+        response = await AsyncClient().get(
+            "/analytics/export/?records=sessions,pauses",
+            headers={"Authorization": f"Bearer {AccessToken.for_user(self.user)}"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_async)
+        rows = [json.loads(line) for line in (await self.aread(response)).splitlines()]
+        self.assertEqual([row["type"] for row in rows], ["session", "session", "pause"])
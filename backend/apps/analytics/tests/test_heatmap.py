@@ -0,0 +1,101 @@
+from datetime import date, datetime, timedelta
+from unittest import mock
+from django.utils import timezone
+import pytz
+
+from apps.analytics.models import UserActivityYear
+from apps.analytics.services import AnalyticsService, DailyStatsService, HeatmapService
+from apps.pomodoro.models import PomodoroSession
+from apps.pomodoro.tests.base import BaseAPITestCase
+from apps.tasks.models import Task
+from apps.tasks.services import TaskService
+
+
+class TestHeatmap(BaseAPITestCase):
+    def test_record_sets_bit_and_adds_focus(self):
+        HeatmapService.record(self.user, date(2026, 3, 2), active=True)
+        HeatmapService.record(self.user, date(2026, 3, 2), focus_seconds=1500)
+        HeatmapService.record(self.user, date(2026, 3, 4), focus_seconds=600)
+
+        data = HeatmapService.get_range(self.user, date(2026, 3, 1), date(2026, 3, 4))
+
+        self.assertEqual(data["active"], [0, 1, 0, 0])
+        self.assertEqual(data["focus_minutes"], [0, 25, 0, 10])
+        self.assertEqual(data["active_days"], 1)
+        self.assertEqual(UserActivityYear.objects.filter(user=self.user).count(), 1)
+
+    def test_completion_updates_heatmap(self):
+        PomodoroSession.objects.create(
+            user=self.user, task=self.task, started_at=timezone.now() - timedelta(minutes=25)
+        )
+        TaskService.complete_task(self.task, self.user)
+
+        today = timezone.now().date()
+        data = HeatmapService.get_range(self.user, today, today)
+
+        self.assertEqual(data["active"], [1])
+        self.assertEqual(data["focus_minutes"], [25])
+
+    def test_range_spanning_years_is_one_query(self):
+        HeatmapService.record(self.user, date(2025, 12, 31), active=True)
+        HeatmapService.record(self.user, date(2026, 1, 1), active=True)
+
+        with self.assertNumQueries(1):
+            data = HeatmapService.get_range(self.user, date(2024, 1, 1), date(2026, 12, 31))
+
+        self.assertEqual(len(data["active"]), 366 + 365 + 365)
+        self.assertEqual(data["active_days"], 2)
+
+    def test_rebuild_matches_incremental(self):
+        ended = datetime(2026, 2, 10, 12, tzinfo=pytz.UTC)
+        Task.objects.create(title="Done", owner=self.user, status="completed", ended_at=ended)
+        PomodoroSession.objects.create(
+            user=self.user,
+            started_at=ended - timedelta(minutes=30),
+            ended_at=ended,
+            actual_duration_seconds=1800,
+            completed=True,
+            state="TERMINATED",
+        )
+        DailyStatsService.rebuild(self.user)
+
+        data = HeatmapService.get_range(self.user, date(2026, 2, 9), date(2026, 2, 11))
+
+        self.assertEqual(data["active"], [0, 1, 0])
+        self.assertEqual(data["focus_minutes"], [0, 30, 0])
+
+    def test_monthly_active_days_respects_year_and_month(self):
+        HeatmapService.record(self.user, date(2024, 2, 29), active=True)
+
+        data = AnalyticsService.get_monthly_active_days(self.user, year=2024, month=2)
+
+        self.assertEqual(data["active_days"], [date(2024, 2, 29)])
+
+    def test_monthly_endpoint_defaults_to_the_users_month(self):
+        self.user.timezone = "Pacific/Kiritimati"  # UTC+14
+        self.user.save(update_fields=["timezone"])
+        utc_now = datetime(2026, 1, 31, 12, tzinfo=pytz.UTC)
+
+        with mock.patch("django.utils.timezone.now", return_value=utc_now):
+            response = self.client.get("/analytics/activity-heatmap/monthly/")
+
+        self.assertEqual((response.data["year"], response.data["month"]), (2026, 2))
+
+    def test_monthly_endpoint_rejects_invalid_dates(self):
+        for query in ("month=13", "month=0", "year=x", "year=2026&month=feb"):
+            response = self.client.get(f"/analytics/activity-heatmap/monthly/?{query}")
+            self.assertEqual(response.status_code, 400, query)
+
+    def test_endpoint(self):
+        response = self.client.get("/analytics/activity-heatmap/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["active"]), 365)
+
+        response = self.client.get("/analytics/activity-heatmap/?start_date=2026-01-01&end_date=2026-01-31")
+        self.assertEqual(len(response.data["focus_minutes"]), 31)
+
+        response = self.client.get("/analytics/activity-heatmap/?start_date=2016-01-01&end_date=2026-01-01")
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.get("/analytics/activity-heatmap/?start_date=nope")
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,82 @@
+from datetime import date, datetime, timedelta
+import pytz
+from django.contrib.auth import get_user_model
+
+from apps.analytics.models import UserDailyStats
+from apps.analytics.services import AnalyticsService, DailyStatsService
+from apps.pomodoro.models import PomodoroPause, PomodoroSession
+from apps.pomodoro.tests.base import BaseAPITestCase
+from apps.tasks.models import Task
+
+
+class TestHourlyFlow(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.user.timezone = "Asia/Kathmandu"  # UTC+05:45
+        self.user.save()
+        self.tz = pytz.timezone("Asia/Kathmandu")
+
+    def completed_session(self, local_start, minutes, pauses=()):
+        started_at = self.tz.localize(local_start)
+        ended_at = started_at + timedelta(minutes=minutes)
+        session = PomodoroSession.objects.create(
+            user=self.user,
+            task=self.task,
+            started_at=started_at,
+            ended_at=ended_at,
+            completed=True,
+            actual_duration_seconds=int((ended_at - started_at).total_seconds())
+            - sum(int((end - start).total_seconds()) for start, end in pauses),
+        )
+        for start, end in pauses:
+            PomodoroPause.objects.create(session=session, paused_at=start, resumed_at=end)
+        DailyStatsService.record_session(session)
+        return session
+
+    def test_session_straddling_an_hour_is_split(self):
+        self.completed_session(datetime(2026, 3, 10, 10, 50), 25)
+
+        stats = UserDailyStats.objects.get(user=self.user, date=date(2026, 3, 10))
+        self.assertEqual(stats.hourly_focus_seconds[10], 10 * 60)
+        self.assertEqual(stats.hourly_focus_seconds[11], 15 * 60)
+        self.assertEqual(stats.focus_seconds, 25 * 60)
+
+    def test_paused_time_is_not_bucketed(self):
+        start = self.tz.localize(datetime(2026, 3, 10, 9, 40))
+        self.completed_session(
+            datetime(2026, 3, 10, 9, 40), 40,
+            pauses=[(start + timedelta(minutes=10), start + timedelta(minutes=25))],
+        )
+
+        stats = UserDailyStats.objects.get(user=self.user, date=date(2026, 3, 10))
+        self.assertEqual(stats.hourly_focus_seconds[9], 10 * 60)
+        self.assertEqual(stats.hourly_focus_seconds[10], 15 * 60)
+
+    def test_midnight_spill_goes_to_next_day_and_survives_rebuild(self):
+        self.completed_session(datetime(2026, 3, 10, 23, 50), 20)
+        incremental = list(UserDailyStats.objects.order_by("date").values_list(
+            "date", "pomodoros_completed", "hourly_focus_seconds"
+        ))
+
+        DailyStatsService.rebuild(self.user, date(2026, 3, 11), date(2026, 3, 11))
+        DailyStatsService.rebuild(self.user, date(2026, 3, 10), date(2026, 3, 10))
+        rebuilt = list(UserDailyStats.objects.order_by("date").values_list(
+            "date", "pomodoros_completed", "hourly_focus_seconds"
+        ))
+
+        self.assertEqual(incremental[1][2][0], 10 * 60)
+        self.assertEqual(incremental[1][1], 0)
+        self.assertEqual(rebuilt, incremental)
+
+    def test_daily_summary_is_two_queries(self):
+        self.completed_session(datetime(2026, 3, 10, 10, 50), 25)
+        other = get_user_model().objects.create_user(email="other@example.com", password="password123")
+        Task.objects.create(title="Other user's task", owner=other)
+
+        with self.assertNumQueries(2):
+            summary = AnalyticsService.get_daily_summary(self.user, "2026-03-10")
+
+        flow = {point["time"]: point["focus"] for point in summary["daily_flow"]}
+        self.assertEqual(flow["10:00"], 10.0)
+        self.assertEqual(flow["11:00"], 15.0)
+        self.assertEqual(len(summary["daily_flow"]), 15)
@@ -0,0 +1,55 @@
+from datetime import date, datetime, timedelta
+import pytz
+
+from apps.analytics.models import UserDailyStats
+from apps.analytics.services import AnalyticsService
+from apps.pomodoro.tests.base import BaseAPITestCase
+from apps.tasks.models import Task
+
+
+class TestRangeSummary(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.user.timezone = "America/New_York"
+        self.user.save()
+
+    def create_task(self, created_at, status="pending"):
+        task = Task.objects.create(title="T", owner=self.user, status=status)
+        Task.objects.filter(pk=task.pk).update(created_at=created_at)
+
+    def test_weekly_summary_uses_constant_queries(self):
+        for offset in range(7):
+            day = datetime(2026, 3, 2 + offset, 15, tzinfo=pytz.UTC)
+            self.create_task(day, status="completed")
+            UserDailyStats.objects.create(user=self.user, date=day.date(), focus_seconds=3600)
+
+        with self.assertNumQueries(2):
+            summary = AnalyticsService.get_weekly_summary(self.user, date(2026, 3, 2), date(2026, 3, 8))
+
+        self.assertEqual(summary["total_tasks_completed"], 7)
+        self.assertEqual(summary["avg_daily_focus_hours"], 1.0)
+
+    def test_long_range_uses_the_same_queries(self):
+        with self.assertNumQueries(2):
+            summary = AnalyticsService.get_range_summary(self.user, date(2026, 1, 1), date(2026, 3, 31))
+
+        self.assertEqual(len(summary["daily_breakdown"]), 90)
+
+    def test_tasks_group_by_local_date(self):
+        # 02:00 UTC on the 10th is still the 9th in New York
+        self.create_task(datetime(2026, 3, 10, 2, tzinfo=pytz.UTC))
+
+        summary = AnalyticsService.get_range_summary(self.user, date(2026, 3, 9), date(2026, 3, 10))
+
+        self.assertEqual([d["total_tasks"] for d in summary["daily_breakdown"]], [1, 0])
+
+    def test_range_endpoint_validates_dates(self):
+        response = self.client.get("/analytics/range/?start_date=2026-01-01&end_date=2026-01-31")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["daily_breakdown"]), 31)
+
+        response = self.client.get("/analytics/range/?start_date=2026-02-01&end_date=2026-01-01")
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.get("/analytics/range/?start_date=2024-01-01&end_date=2026-01-01")
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta
+from io import StringIO
+import pytz
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.analytics.models import UserStreak
+from apps.analytics.services import AnalyticsService, StreakService
+from apps.pomodoro.models import PomodoroSession
+from apps.pomodoro.tests.base import BaseAPITestCase
+from apps.tasks.models import Task
+from apps.tasks.services import TaskService
+
+
+class TestStreaks(BaseAPITestCase):
+    def completed_task(self, ended_at):
+        return Task.objects.create(title="Done", owner=self.user, status="completed", ended_at=ended_at)
+
+    def test_complete_task_advances_streak(self):
+        PomodoroSession.objects.create(user=self.user, task=self.task)
+        TaskService.complete_task(self.task, self.user)
+
+        streak = UserStreak.objects.get(user=self.user)
+        self.assertEqual(streak.current_streak, 1)
+        self.assertEqual(streak.total_active_days, 1)
+
+    def test_incremental_matches_rebuild(self):
+        start = timezone.now() - timedelta(days=6)
+        for offset in (0, 1, 2, 4, 5, 6):
+            when = start + timedelta(days=offset)
+            self.completed_task(when)
+            StreakService.record_completion(self.user, when)
+        StreakService.record_completion(self.user, start + timedelta(days=6))  # same day again
+
+        incremental = UserStreak.objects.values().get(user=self.user)
+        StreakService.rebuild(self.user)
+        rebuilt = UserStreak.objects.values().get(user=self.user)
+
+        for field in ("current_streak", "longest_streak", "longest_streak_start", "total_active_days", "last_active_date"):
+            self.assertEqual(incremental[field], rebuilt[field])
+        self.assertEqual(rebuilt["longest_streak"], 3)
+        self.assertEqual(rebuilt["total_active_days"], 6)
+
+    def test_first_completion_counts_earlier_history(self):
+        today = timezone.now()
+        for days_ago in range(5, 0, -1):
+            self.completed_task(today - timedelta(days=days_ago))
+        PomodoroSession.objects.create(user=self.user, task=self.task)
+
+        TaskService.complete_task(self.task, self.user)
+
+        streak = UserStreak.objects.get(user=self.user)
+        self.assertEqual(streak.current_streak, 6)
+        self.assertEqual(streak.longest_streak, 6)
+        self.assertEqual(streak.total_active_days, 6)
+
+    def test_summary_is_a_single_row_read(self):
+        self.completed_task(timezone.now())
+        StreakService.rebuild(self.user)
+
+        with self.assertNumQueries(1):
+            data = AnalyticsService.get_task_completion_streaks(self.user)
+
+        self.assertEqual(data["current_streak"], 1)
+
+    def test_lapsed_streak_reports_zero_current(self):
+        self.completed_task(timezone.now() - timedelta(days=5))
+
+        data = AnalyticsService.get_task_completion_streaks(self.user)
+
+        self.assertEqual(data["current_streak"], 0)
+        self.assertEqual(data["longest_streak"], 1)
+        self.assertIsNone(data["streak_start_date"])
+
+    def test_timezone_change_rebuilds(self):
+        # 23:30 and 00:30 UTC fall on two UTC days but one New York day
+        first = datetime(2026, 3, 9, 23, 30, tzinfo=pytz.UTC)
+        self.completed_task(first)
+        self.completed_task(first + timedelta(hours=1))
+        StreakService.rebuild(self.user)
+        self.assertEqual(UserStreak.objects.get(user=self.user).total_active_days, 2)
+
+        response = self.client.patch("/auth/profile/", {"timezone": "America/New_York"}, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(UserStreak.objects.get(user=self.user).total_active_days, 1)
+
+    def test_rebuild_command(self):
+        self.completed_task(timezone.now())
+
+        call_command("rebuild_streaks", user=[str(self.user.id)], stdout=StringIO())
+
+        self.assertEqual(UserStreak.objects.get(user=self.user).total_active_days, 1)
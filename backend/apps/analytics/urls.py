@@ -4,6 +4,11 @@ from apps.analytics import views
 urlpatterns = [
     path('daily/', views.DailySummaryView.as_view(), name='daily_summary'),
     path('weekly/', views.WeeklySummaryView.as_view(), name='weekly_summary'),
+    path('dashboard/', views.DashboardView.as_view(), name='dashboard'),
+    path('export/', views.ExportView.as_view(), name='export'),
+    path('range/', views.RangeSummaryView.as_view(), name='range_summary'),
     path('streaks/', views.TaskStreakView.as_view(), name="streaks"),
+    path("activity-heatmap/", views.ActivityHeatmapView.as_view(), name="activity_heatmap"),
     path("activity-heatmap/monthly/", views.MonthlyActivityView.as_view()),
+    path("cache-stats/", views.analytics_cache_stats, name="analytics-cache-stats"),
 ]
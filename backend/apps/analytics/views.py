@@ -1,13 +1,34 @@
 from django.shortcuts import render
 from rest_framework.views import APIView
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.response import Response
 from rest_framework import status
 
+from django.http import StreamingHttpResponse
 from django.utils import timezone
-from datetime import timedelta
+from calendar import monthrange
+from datetime import date, timedelta
 
-from apps.analytics.services import AnalyticsService
+from apps.analytics.cache import analytics_cache
+from core.conditional import conditional_response
+from apps.analytics.exports import HistoryExporter
+from apps.analytics.services import AnalyticsService, HeatmapService, as_date
+from apps.accounts.utils import TimezoneHandler
+
+MAX_RANGE_DAYS = 366
+
+def cached_response(request, endpoint, params, start_date, end_date, compute):
+    """
+    analytics_cache.fetch() as a response. The cache key doubles as the
+    ETag, so a client holding the current result gets 304 Not Modified
+    without the result being looked up at all.
+    """
+    key = analytics_cache.key(request.user, endpoint, params, start_date, end_date)
+    return conditional_response(
+        request, key,
+        lambda: Response(analytics_cache.fetch_key(key, compute), status=status.HTTP_200_OK),
+    )
 
 # Create your views here.
 class DailySummaryView(APIView):
@@ -18,9 +39,11 @@ class DailySummaryView(APIView):
         user = request.user
         date_str = request.query_params.get("date")
             
-        data = AnalyticsService.get_daily_summary(user=user, date_str=date_str)
-        
-        return Response(data, status=status.HTTP_200_OK)
+        day = TimezoneHandler(user).parse_date(date_str).date()
+        return cached_response(
+            request, "daily", {"date": day}, day - timedelta(days=1), day,
+            lambda: AnalyticsService.get_daily_summary(user=user, date_str=date_str),
+        )
     
 class WeeklySummaryView(APIView):
     permission_classes = [IsAuthenticated]
@@ -35,35 +58,183 @@ class WeeklySummaryView(APIView):
             start_date = timezone.datetime.fromisoformat(start_date_str)
             end_date = timezone.datetime.fromisoformat(end_date_str)
         else:
-            # Default to current week (Monday → Sunday)
-            today = timezone.now().date()
+            # Default to the user's current local week (Monday → Sunday)
+            today = TimezoneHandler(user).parse_date().date()
             start_date = today - timedelta(days=today.weekday())
             end_date = start_date + timedelta(days=6)
             
-        data = AnalyticsService.get_weekly_summary(user=user, start_date=start_date, end_date=end_date)
-        
-        return Response(data, status=status.HTTP_200_OK)
+        start_date, end_date = as_date(start_date), as_date(end_date)
+        return cached_response(
+            request, "weekly", {"start": start_date, "end": end_date}, start_date, end_date,
+            lambda: AnalyticsService.get_weekly_summary(user=user, start_date=start_date, end_date=end_date),
+        )
         
+class RangeSummaryView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """Returns a per-day summary for an arbitrary date range (up to a year)"""
+        try:
+            start_date = date.fromisoformat(request.query_params.get("start_date", ""))
+            end_date = date.fromisoformat(request.query_params.get("end_date", ""))
+        except ValueError:
+            return Response(
+                {"detail": "start_date and end_date must be YYYY-MM-DD dates"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if end_date < start_date or (end_date - start_date).days >= MAX_RANGE_DAYS:
+            return Response(
+                {"detail": f"Range must be between 1 and {MAX_RANGE_DAYS} days"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        user = request.user
+        return cached_response(
+            request, "range", {"start": start_date, "end": end_date}, start_date, end_date,
+            lambda: AnalyticsService.get_range_summary(user=user, start_date=start_date, end_date=end_date),
+        )
+
+class ActivityHeatmapView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """Returns per-day activity and focus minutes, defaulting to the last 365 days"""
+        start_date_str = request.query_params.get("start_date")
+        end_date_str = request.query_params.get("end_date")
+
+        try:
+            if end_date_str:
+                end_date = date.fromisoformat(end_date_str)
+            else:
+                end_date = TimezoneHandler(request.user).parse_date().date()
+            if start_date_str:
+                start_date = date.fromisoformat(start_date_str)
+            else:
+                start_date = end_date - timedelta(days=364)
+        except ValueError:
+            return Response(
+                {"detail": "start_date and end_date must be YYYY-MM-DD dates"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        max_days = HeatmapService.MAX_RANGE_DAYS
+        if end_date < start_date or (end_date - start_date).days >= max_days:
+            return Response(
+                {"detail": f"Range must be between 1 and {max_days} days"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        user = request.user
+        return cached_response(
+            request, "heatmap", {"start": start_date, "end": end_date}, start_date, end_date,
+            lambda: HeatmapService.get_range(user=user, start_date=start_date, end_date=end_date),
+        )
+
+class DashboardView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """Returns the home screen's analytics sections in one response"""
+        user = request.user
+        sections_str = request.query_params.get("sections")
+        sections = AnalyticsService.DASHBOARD_SECTIONS
+        if sections_str:
+            sections = tuple(dict.fromkeys(name.strip() for name in sections_str.split(",") if name.strip()))
+            unknown = set(sections) - set(AnalyticsService.DASHBOARD_SECTIONS)
+            if unknown or not sections:
+                return Response(
+                    {"detail": f"sections must be a comma-separated subset of {', '.join(AnalyticsService.DASHBOARD_SECTIONS)}"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+        today = TimezoneHandler(user).parse_date().date()
+        return cached_response(
+            request, "dashboard", {"sections": ",".join(sorted(sections))},
+            today, today,
+            lambda: AnalyticsService.get_dashboard(user, sections),
+        )
+
+class ExportView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """
+        Streams the user's history. `output` is ndjson (default) or csv,
+        `records` a comma-separated subset of tasks, sessions and pauses
+        (exactly one for csv), optionally limited to start_date/end_date.
+        """
+        output = request.query_params.get("output", "ndjson")
+        if output not in HistoryExporter.FORMATS:
+            return Response(
+                {"detail": "output must be ndjson or csv"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        records_str = request.query_params.get("records")
+        if records_str:
+            records = tuple(dict.fromkeys(name.strip() for name in records_str.split(",") if name.strip()))
+        else:
+            records = ("sessions",) if output == "csv" else tuple(HistoryExporter.RECORDS)
+        if not records or set(records) - set(HistoryExporter.RECORDS) or (output == "csv" and len(records) > 1):
+            return Response(
+                {"detail": "records must be tasks, sessions or pauses (one of them for csv)"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        start_date_str = request.query_params.get("start_date")
+        end_date_str = request.query_params.get("end_date")
+        try:
+            start_date = date.fromisoformat(start_date_str) if start_date_str else None
+            end_date = date.fromisoformat(end_date_str) if end_date_str else None
+        except ValueError:
+            return Response(
+                {"detail": "start_date and end_date must be YYYY-MM-DD dates"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        exporter = HistoryExporter(request.user, records, start_date, end_date)
+        response = StreamingHttpResponse(
+            exporter.astream(output), content_type=HistoryExporter.FORMATS[output]
+        )
+        response["Content-Disposition"] = f'attachment; filename="{exporter.filename(output)}"'
+        return response
+
 class TaskStreakView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
         user = request.user
-        data = AnalyticsService.get_task_completion_streaks(user)
-        return Response(data, status=status.HTTP_200_OK)
+        today = TimezoneHandler(user).parse_date().date()
+        return cached_response(
+            request, "streaks", {}, today, today,
+            lambda: AnalyticsService.get_task_completion_streaks(user),
+        )
 
 class MonthlyActivityView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        year = request.query_params.get("year")
-        month = request.query_params.get("month")
+        user = request.user
+        today = TimezoneHandler(user).parse_date().date()
+        try:
+            year = int(request.query_params.get("year") or today.year)
+            month = int(request.query_params.get("month") or today.month)
+            date(year, month, 1)
+        except ValueError:
+            return Response(
+                {"detail": "year and month must be a valid year and month (1-12)"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
-        data = AnalyticsService.get_monthly_active_days(
-            user=request.user,
-            year=int(year) if year else None,
-            month=int(month) if month else None,
+        return cached_response(
+            request, "monthly", {"year": year, "month": month},
+            date(year, month, 1), date(year, month, monthrange(year, month)[1]),
+            lambda: AnalyticsService.get_monthly_active_days(user=user, year=year, month=month),
         )
 
-        return Response(data, status=status.HTTP_200_OK)
-
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def analytics_cache_stats(request):
+    """Hit/miss counters of the analytics response cache in this worker."""
+    return Response(analytics_cache.stats())
@@ -0,0 +1,83 @@
+from asgiref.sync import sync_to_async
+from django.shortcuts import aget_object_or_404
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework import status
+
+from apps.tasks.models import Task
+
+from apps.pomodoro.services import PomodoroService
+from apps.pomodoro.snapshot import SessionSnapshot
+from apps.pomodoro.views import active_session_data
+
+
+class AsyncAPIView(APIView):
+    """
+    APIView whose handlers are coroutines.
+
+    Request parsing, authentication, permissions, exception handling and
+    rendering are DRF's own; only the initial() checks (which may hit the
+    database for the user) run in the sync thread pool. The handler itself
+    runs on the event loop and should use the async ORM and async services.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if hasattr(response, "__await__"):
+                response = await response
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def options(self, request, *args, **kwargs):
+        return super().options(request, *args, **kwargs)
+
+
+class AsyncActiveSessionAPIView(AsyncAPIView):
+    permission_classes = [IsAuthenticated]
+
+    async def get(self, request, task_id=None):
+        task = None
+        if task_id:
+            task = await aget_object_or_404(Task, pk=task_id, owner=request.user)
+        session = await PomodoroService.aget_active_session(user=request.user, task=task)
+
+        if not session:
+            return Response({"active": False}, status=status.HTTP_200_OK)
+
+        return Response(active_session_data(session), status=status.HTTP_200_OK)
+
+
+class AsyncPomodoroHeartbeatAPIView(AsyncAPIView):
+    permission_classes = [IsAuthenticated]
+
+    async def post(self, request):
+        session = await PomodoroService.aget_active_session(request.user)
+
+        if not session:
+            return Response({
+                "active": False,
+                "fsm_state": "IDLE",
+            })
+
+        return Response({
+            "active": True,
+            **SessionSnapshot(session).to_payload(),
+        })
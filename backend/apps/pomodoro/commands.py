@@ -0,0 +1,110 @@
+from apps.tasks.models import Task
+from apps.tasks.services import TaskService
+
+from apps.pomodoro.fsm import PomodoroFSM, TransitionConflict
+from apps.pomodoro.services import PomodoroService
+from apps.pomodoro.snapshot import SessionSnapshot
+from apps.pomodoro.utils import abroadcast_task_event
+
+
+class InvalidCommand(Exception):
+    def __init__(self, error, message):
+        self.error = error
+        self.message = message
+        super().__init__(message)
+
+
+class SessionCommands:
+    """
+    Typed session commands sent over the pomodoro websocket.
+
+    A command is a JSON object such as
+    {"type": "PAUSE", "task_id": 4, "request_id": "c1"}. It is checked
+    against PomodoroFSM for the user's current session and executed with
+    the same async services as the HTTP endpoints, so other tabs still get
+    the usual SESSION_UPDATE broadcast.
+
+    Task commands (START_FOCUS always, the others when `task_id` is given)
+    behave like /tasks/<pk>/<action>/. Without `task_id` PAUSE and RESUME
+    act on the user's active session, and COMPLETE ends that session but
+    leaves its task open, like /pomodoro/sessions/<pk>/complete/.
+    """
+
+    COMMANDS = {"START_FOCUS", "PAUSE", "RESUME", "COMPLETE", "START_BREAK"}
+
+    BREAK_TYPES = {"short", "long"}
+
+    @staticmethod
+    async def execute(user, message):
+        """Run `message` for `user` and return the resulting session (or None)."""
+        command = message.get("type")
+        if not isinstance(command, str) or command not in SessionCommands.COMMANDS:
+            raise InvalidCommand("UNKNOWN_COMMAND", f"Unknown command: {command}")
+
+        task = None
+        task_id = message.get("task_id")
+        if task_id is not None:
+            if not isinstance(task_id, int) or isinstance(task_id, bool):
+                raise InvalidCommand("INVALID_COMMAND", "task_id must be an integer")
+            task = await Task.objects.filter(pk=task_id, owner=user).afirst()
+            if task is None:
+                raise InvalidCommand("NOT_FOUND", "Task not found")
+        elif command == "START_FOCUS":
+            raise InvalidCommand("INVALID_COMMAND", "START_FOCUS requires task_id")
+
+        session = await PomodoroService.aget_active_session(user, task)
+        state = SessionSnapshot.derive_state(session)
+
+        # Repeating PAUSE/RESUME is a no-op, like the HTTP endpoints
+        if not (PomodoroFSM.can_transition(state, command) or PomodoroFSM.is_settled(state, command)):
+            raise TransitionConflict(command, None, state)
+
+        if command == "START_FOCUS":
+            _, session = await TaskService.astart_task(
+                task, user, duration_minutes=user.get_focus_duration_minutes()
+            )
+            return session
+
+        if command == "START_BREAK":
+            return await SessionCommands._start_break(user, message.get("break_type"))
+
+        if command == "COMPLETE" and task is None:
+            # Ends the session only; its task stays open
+            await PomodoroService.acomplete_session(session, manual=True)
+            await abroadcast_task_event(user.id, session)
+            return session
+
+        if task is None:
+            task = session.task
+
+        if task is not None:
+            if command == "PAUSE":
+                _, session = await TaskService.apause_task(task, user)
+            elif command == "RESUME":
+                _, session = await TaskService.aresume_task(task, user)
+            else:
+                await TaskService.acomplete_task(task, user)
+                await session.arefresh_from_db()
+            return session
+
+        # Breaks started without a task
+        if command == "PAUSE":
+            changed = await PomodoroService.apause(session)
+        else:
+            changed = await PomodoroService.aresume(session)
+        if changed:
+            await abroadcast_task_event(user.id, session)
+        return session
+
+    @staticmethod
+    async def _start_break(user, break_type):
+        if break_type not in SessionCommands.BREAK_TYPES:
+            raise InvalidCommand("INVALID_COMMAND", "Invalid break_type")
+
+        session = await PomodoroService.astart_break(
+            user,
+            break_type,
+            user.get_pomodoro_setting(f"{break_type}_break_minutes"),
+        )
+        await abroadcast_task_event(user.id, session)
+        return session
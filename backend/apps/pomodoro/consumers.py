@@ -1,8 +1,14 @@
-import json
+import logging
+
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
+
+from core import fastjson
+from core.timing import TimedConsumerMixin
+
+logger = logging.getLogger(__name__)
   
-class PomodoroConsumer(AsyncWebsocketConsumer):
+class PomodoroConsumer(TimedConsumerMixin, AsyncWebsocketConsumer):
     async def connect(self):
         user = self.scope["user"]
         if not user or user.is_anonymous:
@@ -15,30 +21,81 @@ class PomodoroConsumer(AsyncWebsocketConsumer):
 
         payload = await self.get_active_session_payload(user.id)
         if payload:
-            await self.send(json.dumps(payload))
+            await self.send(fastjson.dumps_text(payload))
 
     async def disconnect(self, close_code):
         await self.channel_layer.group_discard(self.group_name, self.channel_name)
 
     async def pomodoro_event(self, event):
-        await self.send(json.dumps(event["payload"]))
+        # Senders encode the payload once for every socket in the group
+        if "text" in event:
+            await self.send(event["text"])
+        else:
+            await self.send(fastjson.dumps_text(event["payload"]))
+
+    async def receive(self, text_data=None, bytes_data=None):
+        """
+        Run a session command (see SessionCommands) and reply on this socket
+        with COMMAND_RESULT or COMMAND_ERROR, echoing the client's request_id.
+        """
+        from django.core.exceptions import ValidationError
+        from apps.pomodoro.commands import SessionCommands, InvalidCommand
+        from apps.pomodoro.fsm import TransitionConflict
+        from apps.pomodoro.snapshot import SessionSnapshot
+
+        try:
+            message = fastjson.loads(text_data or "")
+        except ValueError:
+            message = None
+        if not isinstance(message, dict):
+            await self.send_command_error(None, "INVALID_MESSAGE", "Commands must be JSON objects")
+            return
+
+        request_id = message.get("request_id")
+        try:
+            session = await SessionCommands.execute(self.scope["user"], message)
+        except InvalidCommand as e:
+            await self.send_command_error(request_id, e.error, e.message)
+            return
+        except TransitionConflict as e:
+            await self.send_command_error(
+                request_id, "TRANSITION_CONFLICT", e.messages[0], fsm_state=e.actual
+            )
+            return
+        except ValidationError as e:
+            await self.send_command_error(request_id, "INVALID_COMMAND", e.messages[0])
+            return
+        except Exception:
+            # Keep the socket open; the client only learns that the command failed
+            logger.exception("Pomodoro command %r failed", message.get("type"))
+            await self.send_command_error(request_id, "SERVER_ERROR", "Command failed")
+            return
+
+        await self.send(fastjson.dumps_text({
+            "type": "COMMAND_RESULT",
+            "request_id": request_id,
+            "command": message["type"],
+            "session": SessionSnapshot(session).to_payload() if session else None,
+        }))
+
+    async def send_command_error(self, request_id, error, message, **extra):
+        await self.send(fastjson.dumps_text({
+            "type": "COMMAND_ERROR",
+            "request_id": request_id,
+            "error": error,
+            "message": message,
+            **extra,
+        }))
         
     @database_sync_to_async
     def get_active_session_payload(self, user_id):
-        from apps.pomodoro.models import PomodoroSession
-        from apps.pomodoro.utils import build_session_payload
-
-        session = (
-            PomodoroSession.objects
-            .filter(user_id=user_id, completed=False, is_break=False)
-            .select_related("task")
-            .first()
-        )
+        from apps.pomodoro.snapshot import SessionSnapshot
 
-        if not session:
+        snapshot = SessionSnapshot.load_active(user_id, focus_only=True)
+        if not snapshot:
             return None
 
-        return build_session_payload(session)
+        return snapshot.to_payload()
 
     @database_sync_to_async
     def get_active_session(self, user_id):
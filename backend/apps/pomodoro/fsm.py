@@ -1,3 +1,16 @@
+from django.core.exceptions import ValidationError
+
+
+class TransitionConflict(ValidationError):
+    """Raised when a session is no longer in the state a transition expected."""
+
+    def __init__(self, event, expected, actual):
+        self.event = event
+        self.expected = expected
+        self.actual = actual
+        super().__init__(f"Cannot {event.lower()} session in state {actual}")
+
+
 class PomodoroFSM:
     STATES = {
         "IDLE",
@@ -9,13 +22,40 @@ class PomodoroFSM:
     }
 
     TRANSITIONS = {
-        "IDLE": {"START_FOCUS"},
+        "IDLE": {"START_FOCUS", "START_BREAK"},
         "FOCUS_RUNNING": {"PAUSE", "COMPLETE"},
         "FOCUS_PAUSED": {"RESUME", "COMPLETE"},
         "BREAK_RUNNING": {"PAUSE", "COMPLETE"},
         "BREAK_PAUSED": {"RESUME"},
     }
 
+    NEXT_STATE = {
+        ("IDLE", "START_FOCUS"): "FOCUS_RUNNING",
+        ("IDLE", "START_BREAK"): "BREAK_RUNNING",
+        ("FOCUS_RUNNING", "PAUSE"): "FOCUS_PAUSED",
+        ("FOCUS_RUNNING", "COMPLETE"): "TERMINATED",
+        ("FOCUS_PAUSED", "RESUME"): "FOCUS_RUNNING",
+        ("FOCUS_PAUSED", "COMPLETE"): "TERMINATED",
+        ("BREAK_RUNNING", "PAUSE"): "BREAK_PAUSED",
+        ("BREAK_RUNNING", "COMPLETE"): "TERMINATED",
+        ("BREAK_PAUSED", "RESUME"): "BREAK_RUNNING",
+    }
+
+    # States an event leads to; being in one already makes a repeat a no-op
+    SETTLED_STATES = {
+        "PAUSE": {"FOCUS_PAUSED", "BREAK_PAUSED"},
+        "RESUME": {"FOCUS_RUNNING", "BREAK_RUNNING"},
+        "COMPLETE": {"TERMINATED"},
+    }
+
     @staticmethod
     def can_transition(current_state, event):
         return event in PomodoroFSM.TRANSITIONS.get(current_state, set())
+
+    @staticmethod
+    def next_state(current_state, event):
+        return PomodoroFSM.NEXT_STATE.get((current_state, event))
+
+    @staticmethod
+    def is_settled(current_state, event):
+        return current_state in PomodoroFSM.SETTLED_STATES.get(event, set())
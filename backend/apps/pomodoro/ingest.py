@@ -0,0 +1,218 @@
+from bisect import bisect_left
+from datetime import timedelta
+from itertools import accumulate
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.tasks.models import Task
+
+from apps.pomodoro.models import PomodoroSession, PomodoroPause
+from apps.analytics.services import DailyStatsService
+from apps.tasks.counters import TaskCounters
+from apps.sync.sequence import ChangeSequence
+
+
+class SessionIngestError(Exception):
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__(f"{len(errors)} invalid sessions")
+
+
+class SessionIngestService:
+    """
+    Writes sessions recorded offline in one batch.
+
+    Each item is a completed session with its pause intervals:
+
+        {"task_id": 4, "started_at": "...", "ended_at": "...",
+         "is_break": false, "break_type": null, "duration_minutes": 25,
+         "pauses": [{"paused_at": "...", "resumed_at": "..."}]}
+
+    A batch is all or nothing. Items are validated without per-item
+    queries: times must be ordered and in the past, pauses must lie inside
+    their session without overlapping, and sessions may overlap neither
+    each other nor the user's stored sessions. Valid batches are written
+    with bulk_create, then task counters and analytics rollups are updated
+    once for the whole batch. Nothing is broadcast, since none of the
+    sessions is live.
+    """
+
+    MAX_BATCH_SIZE = 5000
+
+    # Tolerated client clock drift for sessions that just ended
+    CLOCK_SKEW = timedelta(minutes=5)
+
+    BREAK_TYPES = {"short", "long"}
+
+    @staticmethod
+    @transaction.atomic
+    def ingest(user, items):
+        """Validate and store `items`; returns the created sessions."""
+        if not isinstance(items, list) or not items:
+            raise SessionIngestError([{"index": None, "message": "sessions must be a non-empty list"}])
+        if len(items) > SessionIngestService.MAX_BATCH_SIZE:
+            raise SessionIngestError([{
+                "index": None,
+                "message": f"At most {SessionIngestService.MAX_BATCH_SIZE} sessions per request",
+            }])
+
+        errors = []
+        parsed = []
+        for index, item in enumerate(items):
+            try:
+                parsed.append(SessionIngestService._parse(index, item))
+            except ValueError as e:
+                errors.append({"index": index, "message": str(e)})
+        if errors:
+            raise SessionIngestError(errors)
+
+        # Taking the change number locks the user's counter row until commit,
+        # so no other batch or live session write lands between the overlap
+        # check and the insert
+        seq = ChangeSequence.next(user.pk)
+        SessionIngestService._check_tasks(user, parsed, errors)
+        errors += SessionIngestService._overlaps(user, parsed)
+        if errors:
+            raise SessionIngestError(sorted(errors, key=lambda error: error["index"]))
+
+        return SessionIngestService._write(user, parsed, seq)
+
+    @staticmethod
+    def _parse(index, item):
+        if not isinstance(item, dict):
+            raise ValueError("Each session must be an object")
+
+        started_at = SessionIngestService._datetime(item.get("started_at"), "started_at")
+        ended_at = SessionIngestService._datetime(item.get("ended_at"), "ended_at")
+        if ended_at <= started_at:
+            raise ValueError("ended_at must be after started_at")
+        if ended_at > timezone.now() + SessionIngestService.CLOCK_SKEW:
+            raise ValueError("ended_at is in the future")
+
+        is_break = bool(item.get("is_break", False))
+        break_type = item.get("break_type")
+        if is_break and break_type not in SessionIngestService.BREAK_TYPES:
+            raise ValueError("Breaks need a break_type of short or long")
+        if not is_break:
+            break_type = None
+
+        task_id = item.get("task_id")
+        if task_id is not None and (isinstance(task_id, bool) or not isinstance(task_id, int)):
+            raise ValueError("task_id must be an integer")
+
+        duration_minutes = item.get("duration_minutes")
+        if duration_minutes is not None and (
+            isinstance(duration_minutes, bool) or not isinstance(duration_minutes, int) or duration_minutes <= 0
+        ):
+            raise ValueError("duration_minutes must be a positive integer")
+
+        pauses = []
+        for pause in item.get("pauses") or []:
+            if not isinstance(pause, dict):
+                raise ValueError("Each pause must be an object")
+            paused_at = SessionIngestService._datetime(pause.get("paused_at"), "paused_at")
+            resumed_at = SessionIngestService._datetime(pause.get("resumed_at"), "resumed_at")
+            if not started_at <= paused_at < resumed_at <= ended_at:
+                raise ValueError("Pauses must lie within the session and end after they start")
+            pauses.append((paused_at, resumed_at))
+        pauses.sort()
+        for previous, current in zip(pauses, pauses[1:]):
+            if current[0] < previous[1]:
+                raise ValueError("Pauses overlap")
+
+        return {
+            "index": index,
+            "task_id": task_id,
+            "started_at": started_at,
+            "ended_at": ended_at,
+            "is_break": is_break,
+            "break_type": break_type,
+            "duration_minutes": duration_minutes,
+            "pauses": pauses,
+        }
+
+    @staticmethod
+    def _datetime(value, field):
+        parsed = parse_datetime(value) if isinstance(value, str) else None
+        if parsed is None:
+            raise ValueError(f"{field} must be an ISO 8601 datetime")
+        if timezone.is_naive(parsed):
+            raise ValueError(f"{field} must include a UTC offset")
+        return parsed
+
+    @staticmethod
+    def _check_tasks(user, parsed, errors):
+        task_ids = {item["task_id"] for item in parsed if item["task_id"] is not None}
+        owned = set(Task.objects.filter(owner=user, pk__in=task_ids).values_list("pk", flat=True))
+        for item in parsed:
+            if item["task_id"] is not None and item["task_id"] not in owned:
+                errors.append({"index": item["index"], "message": "Task not found"})
+
+    @staticmethod
+    def _overlaps(user, parsed):
+        """Errors for sessions overlapping another item or a stored session."""
+        errors = []
+        ordered = sorted(parsed, key=lambda item: item["started_at"])
+        for previous, current in zip(ordered, ordered[1:]):
+            if current["started_at"] < previous["ended_at"]:
+                errors.append({"index": current["index"], "message": f"Overlaps session {previous['index']}"})
+
+        now = timezone.now()
+        stored = sorted(
+            (started_at, ended_at or now)
+            for started_at, ended_at in PomodoroSession.objects.filter(
+                Q(ended_at__gt=ordered[0]["started_at"]) | Q(ended_at__isnull=True),
+                user=user,
+                started_at__lt=max(item["ended_at"] for item in parsed),
+            ).values_list("started_at", "ended_at")
+        )
+        starts = [started_at for started_at, _ in stored]
+        latest_ends = list(accumulate((ended_at for _, ended_at in stored), max))
+        for item in ordered:
+            # Among stored sessions starting before this one ends, does any end after it starts?
+            position = bisect_left(starts, item["ended_at"])
+            if position and latest_ends[position - 1] > item["started_at"]:
+                errors.append({"index": item["index"], "message": "Overlaps an existing session"})
+        return errors
+
+    @staticmethod
+    def _write(user, parsed, seq):
+        sessions = []
+        for item in parsed:
+            paused_seconds = int(sum(
+                (resumed_at - paused_at).total_seconds() for paused_at, resumed_at in item["pauses"]
+            ))
+            duration_minutes = item["duration_minutes"] or (
+                int(user.get_pomodoro_setting(f"{item['break_type']}_break_minutes"))
+                if item["is_break"] else user.get_focus_duration_minutes()
+            )
+            sessions.append(PomodoroSession(
+                user=user,
+                task_id=item["task_id"],
+                started_at=item["started_at"],
+                ended_at=item["ended_at"],
+                duration_minutes=duration_minutes,
+                actual_duration_seconds=int((item["ended_at"] - item["started_at"]).total_seconds()) - paused_seconds,
+                paused_duration_seconds=paused_seconds,
+                is_break=item["is_break"],
+                break_type=item["break_type"],
+                completed=True,
+                state="TERMINATED",
+                sync_seq=seq,
+            ))
+        PomodoroSession.objects.bulk_create(sessions)
+
+        PomodoroPause.objects.bulk_create([
+            PomodoroPause(session=session, paused_at=paused_at, resumed_at=resumed_at)
+            for session, item in zip(sessions, parsed)
+            for paused_at, resumed_at in item["pauses"]
+        ])
+
+        TaskCounters.record_many(sessions)
+        DailyStatsService.record_sessions(
+            user, [(session, item["pauses"]) for session, item in zip(sessions, parsed)]
+        )
+        return sessions
@@ -1,20 +1,23 @@
 from channels.middleware import BaseMiddleware
 from channels.db import database_sync_to_async
 
+async def get_user_from_token(token):
+    from apps.accounts.token_cache import token_user_cache
+
+    # Reconnect storms resolve from the token cache without a thread hop
+    cached = token_user_cache.get(token)
+    if cached is not None:
+        return cached[0]
+    return await load_user_from_token(token)
+
 @database_sync_to_async
-def get_user_from_token(token):
-    from django.contrib.auth import get_user_model
+def load_user_from_token(token):
     from django.contrib.auth.models import AnonymousUser
-    from rest_framework_simplejwt.tokens import UntypedToken
-    from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
-    from jwt import decode as jwt_decode
-    from django.conf import settings
+    from apps.accounts.authentication import load_token_user
 
     try:
-        UntypedToken(token)
-        decoded = jwt_decode(token, settings.SECRET_KEY, algorithms=["HS256"])
-        user_model = get_user_model()
-        return user_model.objects.get(id=decoded["user_id"])
+        user, _ = load_token_user(token)
+        return user
     except Exception:
         return AnonymousUser()
 
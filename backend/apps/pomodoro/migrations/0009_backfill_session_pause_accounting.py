@@ -0,0 +1,39 @@
+from django.db import migrations
+
+def backfill_pause_accounting(apps, schema_editor):
+    PomodoroSession = apps.get_model("pomodoro", "PomodoroSession")
+    PomodoroPause = apps.get_model("pomodoro", "PomodoroPause")
+
+    paused_totals = {}
+    open_pauses = {}
+
+    for pause in PomodoroPause.objects.order_by("session_id", "paused_at").iterator():
+        if pause.resumed_at:
+            paused_totals[pause.session_id] = paused_totals.get(pause.session_id, 0) + int(
+                (pause.resumed_at - pause.paused_at).total_seconds()
+            )
+        else:
+            # keep the latest open pause, same as `.last()` did before
+            open_pauses[pause.session_id] = pause.paused_at
+
+    sessions = []
+    for session in PomodoroSession.objects.iterator():
+        session.paused_duration_seconds = paused_totals.get(session.id, 0)
+        session.paused_at = None if session.completed else open_pauses.get(session.id)
+        sessions.append(session)
+
+    PomodoroSession.objects.bulk_update(
+        sessions,
+        ["paused_duration_seconds", "paused_at"],
+        batch_size=500,
+    )
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("pomodoro", "0008_alter_pomodorosession_started_at"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_pause_accounting, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 6.0 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+def backfill_state(apps, schema_editor):
+    PomodoroSession = apps.get_model("pomodoro", "PomodoroSession")
+
+    PomodoroSession.objects.filter(completed=True).update(state="TERMINATED")
+    active = PomodoroSession.objects.filter(completed=False)
+    active.filter(is_break=False, paused_at__isnull=True).update(state="FOCUS_RUNNING")
+    active.filter(is_break=False, paused_at__isnull=False).update(state="FOCUS_PAUSED")
+    active.filter(is_break=True, paused_at__isnull=True).update(state="BREAK_RUNNING")
+    active.filter(is_break=True, paused_at__isnull=False).update(state="BREAK_PAUSED")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pomodoro', '0009_backfill_session_pause_accounting'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pomodorosession',
+            name='state',
+            field=models.CharField(blank=True, max_length=20),
+        ),
+        migrations.RunPython(backfill_state, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 6.0 on 2026-10-18 20:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pomodoro', '0010_pomodorosession_state'),
+        ('tasks', '0004_task_tasks_owner_i_ffafae_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='pomodorosession',
+            index=models.Index(fields=['task', 'created_at', 'id'], name='pomodoro_po_task_id_206024_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-10-18 23:15
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pomodoro', '0011_pomodorosession_pomodoro_po_task_id_206024_idx'),
+        ('tasks', '0007_task_sync_seq'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pomodorosession',
+            name='sync_seq',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='pomodorosession',
+            index=models.Index(fields=['user', 'sync_seq'], name='pomodoro_po_user_id_658ecb_idx'),
+        ),
+    ]
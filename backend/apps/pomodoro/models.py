@@ -1,11 +1,11 @@
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
-from django.db.models import Sum, F, Q, ExpressionWrapper, DurationField
-from datetime import timedelta
+from django.db.models import Q
 from apps.tasks.models import Task
 from apps.accounts.models import User
 
 from apps.accounts.managers import UserTimezoneManager
+from apps.sync.sequence import ChangeSequence
 
 # Create your models here.
 class PomodoroSession(models.Model):
@@ -15,6 +15,8 @@ class PomodoroSession(models.Model):
     started_at = models.DateTimeField(default=timezone.now)
     ended_at = models.DateTimeField(null=True, blank=True)
     
+    # Denormalized pause accounting, kept in sync with PomodoroPause rows
+    # so elapsed/remaining can be computed without aggregating pauses.
     paused_at = models.DateTimeField(null=True, blank=True)
     paused_duration_seconds = models.IntegerField(default=0)
 
@@ -27,11 +29,22 @@ class PomodoroSession(models.Model):
     break_type = models.CharField(max_length=10, null=True, blank=True)
     completed = models.BooleanField(default=False)
 
+    # Persisted PomodoroFSM state, advanced with compare-and-set updates
+    # (see apps.pomodoro.transitions)
+    state = models.CharField(max_length=20, blank=True)
+
     created_at = models.DateTimeField(auto_now_add=True)
+    # User's change number of the last write to the session or its pauses, for /sync/
+    sync_seq = models.BigIntegerField(default=0)
     
     objects = UserTimezoneManager()
     
     class Meta:
+        indexes = [
+            # Keyset pagination of a task's session history
+            models.Index(fields=["task", "created_at", "id"]),
+            models.Index(fields=["user", "sync_seq"]),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=["user"],
@@ -40,30 +53,47 @@ class PomodoroSession(models.Model):
             )
         ]
         
+    def save(self, *args, **kwargs):
+        if not self.state:
+            self.state = self.initial_state()
+        with transaction.atomic(savepoint=False):
+            self.sync_seq = ChangeSequence.next(self.user_id)
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = {*kwargs["update_fields"], "sync_seq"}
+            super().save(*args, **kwargs)
+
+    def initial_state(self):
+        if self.completed:
+            return "TERMINATED"
+        if self.is_break:
+            return "BREAK_PAUSED" if self.paused_at else "BREAK_RUNNING"
+        return "FOCUS_PAUSED" if self.paused_at else "FOCUS_RUNNING"
+
+    @property
+    def is_paused(self):
+        return self.paused_at is not None and not self.completed
+
+    @property
+    def paused_seconds(self):
+        """
+        Total paused time in seconds, including the currently open pause.
+        """
+        return self.snapshot().paused_seconds
+
     @property
     def elapsed_seconds(self):
         """
         Total focused time in seconds (excluding pauses)
         """
-        end_time = self.ended_at or timezone.now()
-
-        total_seconds = (end_time - self.started_at).total_seconds()
-
-        paused = self.pauses.filter(resumed_at__isnull=False).aggregate(
-            total=Sum(
-                ExpressionWrapper(
-                    F("resumed_at") - F("paused_at"),
-                    output_field=DurationField(),
-                )
-            )
-        )["total"]
-
-        paused_seconds = paused.total_seconds() if paused else 0
-        return max(0, int(total_seconds - paused_seconds))
+        return self.snapshot().elapsed_seconds
 
     @property
     def remaining_seconds(self):
-        return max(0, int(self.duration_minutes * 60) - int(self.elapsed_seconds))
+        return self.snapshot().remaining_seconds
+
+    def snapshot(self, now=None):
+        from apps.pomodoro.snapshot import SessionSnapshot
+        return SessionSnapshot(self, now=now)
 
 class PomodoroPause(models.Model):
     session = models.ForeignKey(
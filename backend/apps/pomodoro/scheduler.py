@@ -0,0 +1,196 @@
+import asyncio
+import logging
+import math
+import time
+from collections import defaultdict
+
+from channels.db import database_sync_to_async
+from django.conf import settings
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+class SessionExpiryScheduler:
+    """
+    Hashed timer wheel of active session deadlines, driven by the ASGI
+    worker's event loop.
+
+    Every worker runs its own wheel. Deadlines are recovered from the
+    database on startup and re-synced periodically, so sessions started or
+    resumed in another worker are picked up too. Completion itself goes
+    through `PomodoroService.expire_session`, which claims the row with a
+    conditional update, so only one worker ever completes a given session.
+    """
+
+    def __init__(self, tick_seconds=1, resync_seconds=30):
+        self.tick_seconds = tick_seconds
+        self.resync_seconds = resync_seconds
+
+        self._buckets = defaultdict(set)  # tick -> session ids
+        self._ticks = {}                  # session id -> tick
+        self._cursor = None
+        self._loop = None
+        self._task = None
+
+    # Wheel bookkeeping, only touched from the event loop thread
+
+    def _tick_of(self, deadline):
+        # Round up so a session never fires before its deadline
+        return math.ceil(deadline.timestamp() / self.tick_seconds)
+
+    def _current_tick(self, now):
+        return math.floor(now.timestamp() / self.tick_seconds)
+
+    def track(self, session_id, deadline):
+        self.untrack(session_id)
+        if deadline is None:
+            return
+        tick = self._tick_of(deadline)
+        if self._cursor is not None and tick < self._cursor:
+            # Already overdue, fire on the next tick
+            tick = self._cursor
+        self._buckets[tick].add(session_id)
+        self._ticks[session_id] = tick
+
+    def untrack(self, session_id):
+        tick = self._ticks.pop(session_id, None)
+        if tick is None:
+            return
+        bucket = self._buckets.get(tick)
+        if bucket:
+            bucket.discard(session_id)
+            if not bucket:
+                del self._buckets[tick]
+
+    def pop_due(self, now):
+        """Remove and return the ids of every session due at or before `now`."""
+        now_tick = self._current_tick(now)
+        if self._cursor is None:
+            self._cursor = min(self._buckets, default=now_tick)
+
+        due = []
+        while self._cursor <= now_tick:
+            for session_id in self._buckets.pop(self._cursor, ()):
+                self._ticks.pop(session_id, None)
+                due.append(session_id)
+            self._cursor += 1
+        return due
+
+    def __len__(self):
+        return len(self._ticks)
+
+    def __contains__(self, session_id):
+        return session_id in self._ticks
+
+    # Database side
+
+    @database_sync_to_async
+    def _load_deadlines(self):
+        from apps.pomodoro.models import PomodoroSession
+
+        sessions = (
+            PomodoroSession.objects
+            .filter(completed=False, paused_at__isnull=True)
+            .only("id", "started_at", "duration_minutes", "paused_duration_seconds",
+                  "paused_at", "completed", "is_break", "ended_at")
+        )
+        return [(s.id, s.snapshot().deadline) for s in sessions]
+
+    @database_sync_to_async
+    def _expire(self, session_id):
+        from apps.pomodoro.services import PomodoroService
+        return PomodoroService.expire_session(session_id)
+
+    async def resync(self):
+        """Rebuild the wheel from every running session in the database."""
+        deadlines = await self._load_deadlines()
+        self._buckets.clear()
+        self._ticks.clear()
+        self._cursor = self._current_tick(timezone.now())
+        for session_id, deadline in deadlines:
+            self.track(session_id, deadline)
+        logger.debug("Expiry scheduler tracking %d sessions", len(self))
+
+    async def tick(self, now=None):
+        for session_id in self.pop_due(now or timezone.now()):
+            try:
+                deadline = await self._expire(session_id)
+            except Exception:
+                logger.exception("Failed to expire pomodoro session %s", session_id)
+                continue
+            # Still running (resumed elsewhere): track its new deadline
+            if deadline is not None:
+                self.track(session_id, deadline)
+
+    async def run(self):
+        last_resync = None
+        while True:
+            try:
+                if last_resync is None or time.monotonic() - last_resync >= self.resync_seconds:
+                    await self.resync()
+                    last_resync = time.monotonic()
+                await self.tick()
+            except Exception:
+                # Keep the worker's scheduler alive through transient DB errors
+                logger.exception("Pomodoro expiry scheduler iteration failed")
+            await asyncio.sleep(self.tick_seconds)
+
+    # Lifecycle and thread-safe entry points
+
+    @property
+    def running(self):
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._task = self._loop.create_task(self.run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._task = None
+        self._loop = None
+
+    def schedule(self, session):
+        """
+        Track (or drop) `session`'s deadline after a state change.
+        Safe to call from sync code running in another thread; a no-op when
+        the scheduler is not running in this process.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        deadline = session.snapshot().deadline
+        loop.call_soon_threadsafe(self.track, session.id, deadline)
+
+
+expiry_scheduler = SessionExpiryScheduler()
+
+
+class ExpirySchedulerLifespan:
+    """ASGI lifespan handler starting the expiry scheduler with the worker."""
+
+    async def __call__(self, scope, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                if getattr(settings, "POMODORO_EXPIRY_SCHEDULER", True):
+                    expiry_scheduler.tick_seconds = getattr(
+                        settings, "POMODORO_EXPIRY_TICK_SECONDS", expiry_scheduler.tick_seconds
+                    )
+                    expiry_scheduler.resync_seconds = getattr(
+                        settings, "POMODORO_EXPIRY_RESYNC_SECONDS", expiry_scheduler.resync_seconds
+                    )
+                    expiry_scheduler.start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await expiry_scheduler.stop()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
@@ -1,7 +1,7 @@
 from rest_framework import serializers
-from django.utils import timezone
-from django.db.models import F, ExpressionWrapper, DurationField, Sum
 from apps.pomodoro.models import PomodoroSession
+from apps.pomodoro.snapshot import SessionSnapshot
+from core.readers import ValuesReader
 
 class PomodoroSessionSerializer(serializers.ModelSerializer):
     ends_at = serializers.DateTimeField(read_only=True)
@@ -26,22 +26,21 @@ class PomodoroSessionSerializer(serializers.ModelSerializer):
         ]
 
     def get_elapsed_seconds(self, obj):
-        if not obj.started_at:
-            return 0
-        now = timezone.now()
-        paused = obj.pauses.filter(resumed_at__isnull=False).aggregate(
-            total=Sum(
-                ExpressionWrapper(
-                    F("resumed_at") - F("paused_at"),
-                    output_field=DurationField(),
-                )
-            )
-        )["total"]
-        paused_seconds = paused.total_seconds() if paused else 0
-        return int((now - obj.started_at).total_seconds() - paused_seconds)
+        return self._snapshot(obj).elapsed_seconds
 
     def get_remaining_seconds(self, obj):
-        total = obj.duration_minutes * 60
-        elapsed = self.get_elapsed_seconds(obj)
-        remaining = total - elapsed
-        return max(0, remaining)
+        return self._snapshot(obj).remaining_seconds
+
+    def _snapshot(self, obj):
+        # Views listing many sessions pass precomputed snapshots in the context
+        snapshots = self.context.get("snapshots") or {}
+        return snapshots.get(obj.id) or SessionSnapshot(obj)
+
+
+# List responses of PomodoroSessionSerializer, built from .values() rows
+session_reader = ValuesReader(
+    PomodoroSessionSerializer,
+    computed=("elapsed_seconds", "remaining_seconds"),
+    computed_from=SessionSnapshot.TIMING_FIELDS,
+    compute=SessionSnapshot.add_timing,
+)
@@ -1,13 +1,19 @@
 from django.utils import timezone
 from django.core.exceptions import ValidationError
-from django.db.models import F, ExpressionWrapper, DurationField, Sum
+from django.db import transaction
 
 from channels.layers import get_channel_layer
-from asgiref.sync import async_to_sync
-from apps.pomodoro.utils import broadcast_task_event
+from asgiref.sync import async_to_sync, sync_to_async
+from apps.pomodoro.utils import broadcast_task_event, pomodoro_event
+from apps.pomodoro.scheduler import expiry_scheduler
 
-from apps.pomodoro.models import PomodoroSession, PomodoroPause
+from apps.pomodoro.models import PomodoroSession
+from apps.pomodoro.transitions import SessionTransitions
+from apps.pomodoro.fsm import TransitionConflict
 from apps.pomodoro.constants import DEFAULT_POMODORO_SETTINGS
+from apps.analytics.services import DailyStatsService
+from apps.tasks.counters import TaskCounters
+from core.timing import span, timed_methods
 
 channel_layer = get_channel_layer()
 
@@ -18,11 +24,33 @@ def ensure_session_not_expired(session):
     if session.completed:
         return session
 
-    if session.remaining_seconds <= 0:
-        PomodoroService.complete_session(session)
+    snapshot = session.snapshot()
+    if snapshot.remaining_seconds <= 0 and snapshot.deadline:
+        try:
+            PomodoroService.complete_session(session, ended_at=snapshot.deadline)
+        except ValidationError:
+            # Completed concurrently (expiry scheduler or another request)
+            session.refresh_from_db()
 
     return session
 
+async def aensure_session_not_expired(session):
+    if not session:
+        return None
+
+    if session.completed:
+        return session
+
+    snapshot = session.snapshot()
+    if snapshot.remaining_seconds <= 0 and snapshot.deadline:
+        try:
+            await PomodoroService.acomplete_session(session, ended_at=snapshot.deadline)
+        except ValidationError:
+            await session.arefresh_from_db()
+
+    return session
+
+@timed_methods
 class PomodoroService:
 
     @staticmethod
@@ -59,6 +87,85 @@ class PomodoroService:
         task.started_at = task.started_at or timezone.now()
         task.save(update_fields=['status', 'started_at'])
 
+        expiry_scheduler.schedule(session)
+        return session
+
+    # Async counterparts for ASGI views. There are no transactions in the
+    # async ORM, so these rely on single-statement compare-and-set updates
+    # (SessionTransitions.aapply) and the one-active-session constraint.
+
+    @staticmethod
+    async def aget_active_session(user, task=None):
+        qs = PomodoroSession.objects.filter(user=user, completed=False)
+        if task:
+            qs = qs.filter(task=task)
+        session = await qs.select_related("task").afirst()
+        return await aensure_session_not_expired(session)
+
+    @staticmethod
+    async def astart_focus(task, user, duration_minutes=25):
+        if await PomodoroService.aget_active_session(user, task):
+            raise ValidationError("Active session already exists for this task")
+
+        session = await PomodoroSession.objects.acreate(
+            task=task,
+            user=user,
+            started_at=timezone.now(),
+            duration_minutes=duration_minutes,
+            is_break=False
+        )
+
+        task.status = 'in_progress'
+        task.started_at = task.started_at or timezone.now()
+        await task.asave(update_fields=['status', 'started_at'])
+
+        expiry_scheduler.schedule(session)
+        return session
+
+    @staticmethod
+    async def astart_break(user, break_type, duration_minutes):
+        if await PomodoroService.aget_active_session(user):
+            raise ValidationError("Active session already exists")
+
+        session = await PomodoroSession.objects.acreate(
+            user=user,
+            is_break=True,
+            break_type=break_type,
+            duration_minutes=duration_minutes,
+            started_at=timezone.now()
+        )
+        expiry_scheduler.schedule(session)
+        return session
+
+    @staticmethod
+    async def apause(session):
+        """Pause `session`; False when it was already paused."""
+        paused = await SessionTransitions.aapply(session, "PAUSE", idempotent=True)
+        if paused:
+            expiry_scheduler.schedule(session)
+        return paused
+
+    @staticmethod
+    async def aresume(session):
+        """Resume `session`; False when it was already running."""
+        resumed = await SessionTransitions.aapply(session, "RESUME", idempotent=True)
+        if resumed:
+            expiry_scheduler.schedule(session)
+        return resumed
+
+    @staticmethod
+    async def acomplete_session(session, *, manual=False, ended_at=None):
+        if session.completed:
+            raise TransitionConflict("COMPLETE", None, "TERMINATED")
+
+        await SessionTransitions.aapply(session, "COMPLETE", now=ended_at)
+        await TaskCounters.arecord_session(session)
+        await sync_to_async(DailyStatsService.record_session)(session)
+
+        if not manual:
+            # The break chain is rare and multi-step; run it in the sync pool
+            await sync_to_async(PomodoroFlowService.handle_session_completion)(session)
+
         return session
     
     @staticmethod
@@ -66,49 +173,69 @@ class PomodoroService:
         if PomodoroService.get_active_session(user):
             raise ValidationError("Active session already exists")
 
-        return PomodoroSession.objects.create(
+        session = PomodoroSession.objects.create(
             user=user,
             is_break=True,
             break_type=break_type,
             duration_minutes=duration_minutes,
             started_at=timezone.now()
         )
+        expiry_scheduler.schedule(session)
+        return session
         
     @staticmethod
-    def complete_session(session, *, manual=False):
+    def complete_session(session, *, manual=False, ended_at=None):
         if session.completed:
-            raise ValidationError("Session already completed")
-        
-         # close any open pause
-        ongoing_pause = session.pauses.filter(resumed_at__isnull=True).last()
-        if ongoing_pause:
-            ongoing_pause.resumed_at = timezone.now()
-            ongoing_pause.save(update_fields=["resumed_at"])
-
-        session.ended_at = timezone.now()
-        session.completed = True
-
-        paused = session.pauses.filter(resumed_at__isnull=False).aggregate(
-            total=Sum(
-                ExpressionWrapper(
-                    F("resumed_at") - F("paused_at"),
-                    output_field=DurationField(),
-                )
-            )
-        )["total"]
+            raise TransitionConflict("COMPLETE", None, "TERMINATED")
 
-        paused_seconds = paused.total_seconds() if paused else 0
-
-        session.actual_duration_seconds = int(
-            (timezone.now() - session.started_at).total_seconds() - paused_seconds
-        )
-        session.save()
+        # Compare-and-set: only one caller (request, expiry scheduler, other
+        # worker) can complete the session, so the break chain runs once.
+        SessionTransitions.apply(session, "COMPLETE", now=ended_at)
+        TaskCounters.record_session(session)
+        DailyStatsService.record_session(session)
 
         # Only trigger FSM flow if NOT manual
         if not manual:
             PomodoroFlowService.handle_session_completion(session)
 
         return session
+
+    @staticmethod
+    def expire_session(session_id):
+        """
+        Complete a session whose deadline has passed and run the FSM flow.
+        Called by the expiry scheduler; returns the new deadline when the
+        session turns out to still be running, otherwise None.
+        """
+        session = (
+            PomodoroSession.objects
+            .select_related("task", "user")
+            .filter(pk=session_id, completed=False)
+            .first()
+        )
+        if not session:
+            return None
+
+        snapshot = session.snapshot()
+        if snapshot.deadline is None:
+            return None
+        if snapshot.remaining_seconds > 0:
+            return snapshot.deadline
+
+        with transaction.atomic():
+            try:
+                PomodoroService.complete_session(
+                    session, manual=True, ended_at=snapshot.deadline
+                )
+            except ValidationError:
+                return None
+
+            # Tell clients the timer ended before the flow announces the next
+            # session; both go out once the transaction commits
+            transaction.on_commit(lambda: broadcast_task_event(session.user_id, session))
+            PomodoroFlowService.handle_session_completion(session)
+
+        return None
     
 class PomodoroFlowService:
     
@@ -117,25 +244,26 @@ class PomodoroFlowService:
         """
         Called whenever a NEW session is created or state changes.
         """
-        # Broadcast session state to all clients
-        broadcast_task_event(user.id, session)
+        expiry_scheduler.schedule(session)
+
+        # Broadcast session state to all clients, once it is committed
+        transaction.on_commit(lambda: broadcast_task_event(user.id, session))
 
     @staticmethod
     def emit_ready_for_focus(user, task):
         """
         No active session, but system expects next focus.
         """
-        async_to_sync(channel_layer.group_send)(
-            f"user_{user.id}",
-            {
-                "type": "pomodoro.event",
-                "payload": {
-                    "type": "READY_FOR_FOCUS",
-                    "task_id": task.id,
-                    "state": "IDLE",
-                },
-            }
-        )
+        event = pomodoro_event({
+            "type": "READY_FOR_FOCUS",
+            "task_id": task.id,
+            "state": "IDLE",
+        })
+
+        def send():
+            with span("group_send"):
+                async_to_sync(channel_layer.group_send)(f"user_{user.id}", event)
+        transaction.on_commit(send)
 
     @staticmethod
     def handle_session_completion(session):
@@ -153,15 +281,12 @@ class PomodoroFlowService:
         user = session.user
 
         # Task might already be completed manually
-        if task.status == "completed":
+        if not task or task.status == "completed":
             return
 
         settings = user.pomodoro_settings or DEFAULT_POMODORO_SETTINGS
 
-        completed_focus = task.pomodoro_sessions.filter(
-            completed=True,
-            is_break=False
-        ).count()
+        completed_focus = task.completed_pomodoros
 
         # Decide break type
         if completed_focus % settings["long_break_every"] == 0:
@@ -192,7 +317,7 @@ class PomodoroFlowService:
         user = session.user
 
         # Task may have been completed during break
-        if task.status == "completed":
+        if not task or task.status == "completed":
             return
 
         settings = user.pomodoro_settings or DEFAULT_POMODORO_SETTINGS
@@ -0,0 +1,115 @@
+from datetime import timedelta
+from django.utils import timezone
+
+from apps.pomodoro.fsm import PomodoroFSM
+from apps.pomodoro.models import PomodoroSession
+
+
+class SessionSnapshot:
+    """
+    Point-in-time view of a pomodoro session.
+
+    Everything is computed in Python from the session row (pause accounting
+    is denormalized on it), so building a snapshot costs no queries and all
+    values agree on the same `now`.
+    """
+
+    # Columns the timing is computed from
+    TIMING_FIELDS = (
+        "started_at", "ended_at", "paused_at", "paused_duration_seconds", "completed", "duration_minutes",
+    )
+
+    def __init__(self, session, now=None):
+        self.session = session
+        self.now = now or timezone.now()
+
+        (
+            self.paused_seconds, self.elapsed_seconds,
+            self.total_duration_seconds, self.remaining_seconds,
+        ) = self.timing(self.now, **{name: getattr(session, name) for name in self.TIMING_FIELDS})
+
+        self.fsm_state = self.derive_state(session)
+        self.allowed_actions = sorted(PomodoroFSM.TRANSITIONS.get(self.fsm_state, []))
+
+    @staticmethod
+    def timing(now, started_at, ended_at, paused_at, paused_duration_seconds, completed, duration_minutes):
+        """(paused, elapsed, total, remaining) seconds of a session at `now`."""
+        paused = paused_duration_seconds or 0
+        if paused_at and not completed:
+            paused += max(0, int((now - paused_at).total_seconds()))
+
+        elapsed = max(0, int(((ended_at or now) - started_at).total_seconds() - paused))
+        total = duration_minutes * 60
+        return paused, elapsed, total, max(0, total - elapsed)
+
+    @classmethod
+    def add_timing(cls, rows, now=None):
+        """Add elapsed and remaining seconds to `.values()` rows of sessions."""
+        now = now or timezone.now()
+        for row in rows:
+            _, row["elapsed_seconds"], _, row["remaining_seconds"] = cls.timing(
+                now, **{name: row[name] for name in cls.TIMING_FIELDS}
+            )
+
+    @staticmethod
+    def derive_state(session):
+        if not session:
+            return "IDLE"
+
+        return session.state or session.initial_state()
+
+    @property
+    def is_running(self):
+        return self.fsm_state in ("FOCUS_RUNNING", "BREAK_RUNNING")
+
+    @property
+    def deadline(self):
+        """When a running session expires; None while paused or finished."""
+        if not self.is_running:
+            return None
+        session = self.session
+        return session.started_at + timedelta(
+            seconds=self.total_duration_seconds + (session.paused_duration_seconds or 0)
+        )
+
+    @classmethod
+    def load(cls, **filters):
+        """Fetch a single session matching `filters` and snapshot it (one query)."""
+        session = PomodoroSession.objects.filter(**filters).order_by("-started_at").first()
+        if not session:
+            return None
+        return cls(session)
+
+    @classmethod
+    def load_active(cls, user_id, *, task_id=None, focus_only=False):
+        filters = {"user_id": user_id, "completed": False}
+        if task_id:
+            filters["task_id"] = task_id
+        if focus_only:
+            filters["is_break"] = False
+        return cls.load(**filters)
+
+    @classmethod
+    def load_many(cls, queryset):
+        """
+        Snapshot every session in `queryset`.
+        Costs a single query regardless of the number of sessions.
+        """
+        now = timezone.now()
+        return [cls(session, now=now) for session in queryset]
+
+    def to_payload(self):
+        session = self.session
+        return {
+            "type": "SESSION_UPDATE",
+            "fsm_state": self.fsm_state,
+            "allowed_actions": self.allowed_actions,
+            "task_id": session.task_id,
+            "session_id": session.id,
+            "is_break": session.is_break,
+            "remaining_seconds": self.remaining_seconds,
+            "total_duration_seconds": self.total_duration_seconds,
+            "paused_seconds": self.paused_seconds,
+            "started_at": session.started_at.isoformat(),
+            "ended": session.completed,
+        }
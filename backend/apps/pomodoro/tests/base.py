@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from rest_framework.test import APITestCase
 from django.contrib.auth import get_user_model
 from apps.tasks.models import Task
@@ -6,6 +7,7 @@ User = get_user_model()
 
 class BaseAPITestCase(APITestCase):
     def setUp(self):
+        cache.clear()
         self.user = User.objects.create_user(
             email="test@example.com",
             password="password123"
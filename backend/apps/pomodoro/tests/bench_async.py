@@ -0,0 +1,127 @@
+"""
+Sync vs async request path benchmark for the ASGI endpoints.
+
+Not collected by the default test run; invoke explicitly:
+
+    python manage.py test apps.pomodoro.tests.bench_async
+
+The sync path is driven by worker threads (one connection each, like a
+threaded server); the async path by concurrent tasks on one event loop.
+Both report requests/sec and p50/p99 latency in milliseconds. As with
+bench_transitions, write-path numbers are only meaningful against
+PostgreSQL; SQLite reports locked writers as OperationalError outcomes.
+"""
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.test import AsyncClient, Client, TransactionTestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.pomodoro.consumers import PomodoroConsumer
+from apps.pomodoro.models import PomodoroSession
+from apps.pomodoro.tests.test_consumer_commands import SocketClient
+from apps.tasks.models import Task
+from apps.tasks.tests.utils import ConcurrentRunner
+
+User = get_user_model()
+
+WORKERS = 8
+ITERATIONS = 25
+
+
+class AsyncPathBenchmark(TransactionTestCase):
+    def setUp(self):
+        self.users = []
+        for n in range(WORKERS):
+            user = User.objects.create_user(email=f"bench{n}@example.com", password="password123")
+            task = Task.objects.create(title=f"Bench {n}", owner=user)
+            PomodoroSession.objects.create(user=user, task=task)
+            self.users.append({"user": user, "task": task, "token": str(AccessToken.for_user(user))})
+
+    def _auth(self, worker):
+        return {"Authorization": f"Bearer {self.users[worker]['token']}"}
+
+    def _compare(self, label, sync_path, async_path, method="post"):
+        def sync_call(worker, i):
+            response = getattr(Client(), method)(sync_path(worker), headers=self._auth(worker))
+            return response.status_code
+
+        async def async_call(worker, i):
+            response = await getattr(AsyncClient(), method)(async_path(worker), headers=self._auth(worker))
+            return response.status_code
+
+        sync_report = ConcurrentRunner().benchmark(sync_call, workers=WORKERS, iterations=ITERATIONS)
+        async_report = async_to_sync(ConcurrentRunner().abenchmark)(
+            async_call, workers=WORKERS, iterations=ITERATIONS
+        )
+        print(f"\n{label} sync: ", sync_report)
+        print(f"{label} async:", async_report)
+
+        self.assertIn(200, sync_report["outcomes"])
+        self.assertIn(200, async_report["outcomes"])
+
+    def test_heartbeat(self):
+        self._compare(
+            "heartbeat",
+            lambda worker: "/pomodoro/heartbeat/",
+            lambda worker: "/pomodoro/async/heartbeat/",
+        )
+
+    def test_active_session(self):
+        self._compare(
+            "active-session",
+            lambda worker: f"/pomodoro/active-session/{self.users[worker]['task'].id}/",
+            lambda worker: f"/pomodoro/async/active-session/{self.users[worker]['task'].id}/",
+            method="get",
+        )
+
+    def test_pause(self):
+        # Repeated pauses are idempotent no-ops, so every call after the first is a read
+        def path(prefix):
+            return lambda worker: f"/tasks/{prefix}{self.users[worker]['task'].id}/pause/"
+
+        self._compare("pause", path(""), path("async/"))
+
+    def test_socket_commands_vs_http(self):
+        """Per-action cost of a PAUSE command on an open socket vs the async HTTP endpoint."""
+        async def run():
+            sockets = []
+            for entry in self.users:
+                client = SocketClient(PomodoroConsumer.as_asgi(), entry["user"])
+                await client.connect()
+                await client.receive_json_from()  # active session sent on connect
+                sockets.append(client)
+
+            async def socket_call(worker, i):
+                client = sockets[worker]
+                await client.send_json_to({
+                    "type": "PAUSE",
+                    "task_id": self.users[worker]["task"].id,
+                    "request_id": str(i),
+                })
+                while True:
+                    reply = await client.receive_json_from(timeout=5)
+                    if reply["type"] != "SESSION_UPDATE":
+                        return reply["type"]
+
+            async def http_call(worker, i):
+                response = await AsyncClient().post(
+                    f"/tasks/async/{self.users[worker]['task'].id}/pause/",
+                    headers=self._auth(worker),
+                )
+                return response.status_code
+
+            socket_report = await ConcurrentRunner().abenchmark(
+                socket_call, workers=WORKERS, iterations=ITERATIONS
+            )
+            http_report = await ConcurrentRunner().abenchmark(
+                http_call, workers=WORKERS, iterations=ITERATIONS
+            )
+            for client in sockets:
+                await client.disconnect()
+            return socket_report, http_report
+
+        socket_report, http_report = async_to_sync(run)()
+        print("\npause socket:", socket_report)
+        print("pause http:  ", http_report)
+
+        self.assertIn("COMMAND_RESULT", socket_report["outcomes"])
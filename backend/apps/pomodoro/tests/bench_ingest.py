@@ -0,0 +1,77 @@
+"""
+Offline session ingestion benchmark.
+
+Not collected by the default test run; invoke explicitly:
+
+    python manage.py test apps.pomodoro.tests.bench_ingest
+
+Compares replaying sessions as start/pause/resume/complete requests with
+posting them to /pomodoro/sessions/bulk/ in batches, in sessions per
+second.
+"""
+import time
+from datetime import timedelta
+
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from django.contrib.auth import get_user_model
+
+from apps.analytics.models import UserDailyStats
+from apps.pomodoro.ingest import SessionIngestService
+from apps.pomodoro.models import PomodoroSession
+from apps.tasks.models import Task
+
+User = get_user_model()
+
+REPLAYED = 50
+BATCH_SIZES = (100, 1000, SessionIngestService.MAX_BATCH_SIZE)
+
+
+class IngestBenchmark(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="offline@example.com", password="password123")
+        self.client.force_authenticate(self.user)
+
+    def test_replay_against_bulk(self):
+        tasks = [Task.objects.create(title=f"Replay {n}", owner=self.user) for n in range(REPLAYED)]
+        started = time.perf_counter()
+        for task in tasks:
+            for action in ("start", "pause", "resume", "complete"):
+                self.client.post(f"/tasks/{task.id}/{action}/")
+        replay_rate = REPLAYED / (time.perf_counter() - started)
+        print(f"\nreplayed one by one: {replay_rate:.0f} sessions/s")
+
+        task = Task.objects.create(title="Offline", owner=self.user)
+        origin = timezone.now() - timedelta(days=400)
+        offset = 0
+        for size in BATCH_SIZES:
+            sessions = []
+            for n in range(size):
+                begin = origin + timedelta(minutes=30 * (offset + n))
+                sessions.append({
+                    "task_id": task.id,
+                    "started_at": begin.isoformat(),
+                    "ended_at": (begin + timedelta(minutes=25)).isoformat(),
+                    "pauses": [{
+                        "paused_at": (begin + timedelta(minutes=10)).isoformat(),
+                        "resumed_at": (begin + timedelta(minutes=12)).isoformat(),
+                    }],
+                })
+            offset += size
+
+            started = time.perf_counter()
+            response = self.client.post("/pomodoro/sessions/bulk/", {"sessions": sessions}, format="json")
+            elapsed = time.perf_counter() - started
+            print(f"bulk batch of {size:>4}: {elapsed * 1000:.0f} ms, {size / elapsed:.0f} sessions/s")
+
+            self.assertEqual(response.status_code, 201)
+
+        task.refresh_from_db()
+        self.assertEqual(task.total_focus_seconds, sum(BATCH_SIZES) * 23 * 60)
+        self.assertEqual(
+            PomodoroSession.objects.filter(task=task).count(), sum(BATCH_SIZES)
+        )
+        self.assertEqual(
+            sum(UserDailyStats.objects.filter(user=self.user).values_list("pomodoros_completed", flat=True)),
+            sum(BATCH_SIZES) + REPLAYED,
+        )
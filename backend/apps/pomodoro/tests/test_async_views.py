@@ -0,0 +1,84 @@
+from datetime import timedelta
+from asgiref.sync import async_to_sync
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.pomodoro.fsm import TransitionConflict
+from apps.pomodoro.models import PomodoroSession
+from apps.pomodoro.services import PomodoroService
+from apps.pomodoro.tests.base import BaseAPITestCase
+
+
+class TestAsyncTaskFlow(BaseAPITestCase):
+    def test_start_pause_resume_complete(self):
+        response = self.client.post(f"/tasks/async/{self.task.id}/start/")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["task"]["status"], "in_progress")
+
+        response = self.client.post(f"/tasks/async/{self.task.id}/pause/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["status"], "paused")
+
+        response = self.client.post(f"/tasks/async/{self.task.id}/resume/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["status"], "in_progress")
+
+        response = self.client.post(f"/tasks/async/{self.task.id}/complete/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["status"], "completed")
+
+        session = PomodoroSession.objects.get(task=self.task)
+        self.assertTrue(session.completed)
+        self.assertEqual(session.pauses.filter(resumed_at__isnull=True).count(), 0)
+
+    def test_pause_without_session_conflicts(self):
+        response = self.client.post(f"/tasks/async/{self.task.id}/pause/")
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data["fsm_state"], "IDLE")
+
+    def test_other_users_task_is_not_found(self):
+        response = self.client.post("/tasks/async/9999/start/")
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_requires_authentication(self):
+        response = APIClient().post("/pomodoro/async/heartbeat/")
+
+        self.assertIn(response.status_code, (401, 403))
+
+
+class TestAsyncSessionReads(BaseAPITestCase):
+    def test_heartbeat_matches_sync_endpoint(self):
+        PomodoroSession.objects.create(user=self.user, task=self.task)
+
+        sync = self.client.post("/pomodoro/heartbeat/").data
+        asynchronous = self.client.post("/pomodoro/async/heartbeat/").data
+
+        self.assertEqual(asynchronous["session_id"], sync["session_id"])
+        self.assertEqual(asynchronous["fsm_state"], "FOCUS_RUNNING")
+
+    def test_active_session_expires_past_deadline(self):
+        session = PomodoroSession.objects.create(
+            user=self.user,
+            task=self.task,
+            started_at=timezone.now() - timedelta(minutes=30),
+            duration_minutes=25,
+        )
+
+        response = self.client.get(f"/pomodoro/async/active-session/{self.task.id}/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data["completed"])
+        session.refresh_from_db()
+        self.assertEqual(session.actual_duration_seconds, 25 * 60)
+        self.assertTrue(
+            PomodoroSession.objects.filter(user=self.user, is_break=True).exists()
+        )
+
+    def test_acomplete_session_rejects_completed(self):
+        session = PomodoroSession.objects.create(user=self.user, task=self.task)
+        async_to_sync(PomodoroService.acomplete_session)(session, manual=True)
+
+        with self.assertRaises(TransitionConflict):
+            async_to_sync(PomodoroService.acomplete_session)(session, manual=True)
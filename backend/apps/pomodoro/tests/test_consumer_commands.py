@@ -0,0 +1,153 @@
+import json
+from unittest import mock
+
+from asgiref.testing import ApplicationCommunicator
+from django.contrib.auth import get_user_model
+from django.test import TransactionTestCase
+
+from apps.pomodoro.commands import SessionCommands
+from apps.pomodoro.consumers import PomodoroConsumer
+from apps.pomodoro.models import PomodoroSession
+from apps.tasks.models import Task
+
+User = get_user_model()
+
+
+class SocketClient(ApplicationCommunicator):
+    """
+    Minimal websocket test client. channels.testing.WebsocketCommunicator
+    needs daphne, which this project does not depend on.
+    """
+
+    def __init__(self, application, user):
+        super().__init__(application, {
+            "type": "websocket",
+            "path": "/ws/pomodoro/",
+            "headers": [],
+            "subprotocols": [],
+            "user": user,
+        })
+
+    async def connect(self):
+        await self.send_input({"type": "websocket.connect"})
+        return (await self.receive_output())["type"] == "websocket.accept"
+
+    async def send_json_to(self, data):
+        await self.send_to(json.dumps(data))
+
+    async def send_to(self, text_data):
+        await self.send_input({"type": "websocket.receive", "text": text_data})
+
+    async def receive_json_from(self, timeout=1):
+        return json.loads((await self.receive_output(timeout))["text"])
+
+    async def disconnect(self):
+        await self.send_input({"type": "websocket.disconnect", "code": 1000})
+        await self.wait(1)
+
+
+class TestConsumerCommands(TransactionTestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="test@example.com", password="password123")
+        self.task = Task.objects.create(title="Write blog post", owner=self.user)
+
+    async def connect(self):
+        communicator = SocketClient(PomodoroConsumer.as_asgi(), self.user)
+        self.assertTrue(await communicator.connect())
+        return communicator
+
+    async def command(self, communicator, **message):
+        """Send a command and return its reply, skipping group broadcasts."""
+        await communicator.send_json_to(message)
+        while True:
+            reply = await communicator.receive_json_from()
+            if reply["type"] != "SESSION_UPDATE":
+                return reply
+
+    async def test_focus_lifecycle_over_socket(self):
+        communicator = await self.connect()
+
+        reply = await self.command(communicator, type="START_FOCUS", task_id=self.task.id, request_id="1")
+        self.assertEqual(reply["type"], "COMMAND_RESULT")
+        self.assertEqual(reply["request_id"], "1")
+        self.assertEqual(reply["session"]["fsm_state"], "FOCUS_RUNNING")
+
+        reply = await self.command(communicator, type="PAUSE", request_id="2")
+        self.assertEqual(reply["session"]["fsm_state"], "FOCUS_PAUSED")
+
+        reply = await self.command(communicator, type="RESUME", task_id=self.task.id, request_id="3")
+        self.assertEqual(reply["session"]["fsm_state"], "FOCUS_RUNNING")
+
+        reply = await self.command(communicator, type="COMPLETE", task_id=self.task.id, request_id="4")
+        self.assertEqual(reply["session"]["fsm_state"], "TERMINATED")
+
+        await communicator.disconnect()
+
+        task = await Task.objects.aget(pk=self.task.pk)
+        self.assertEqual(task.status, "completed")
+
+    async def test_complete_without_task_id_ends_only_the_session(self):
+        communicator = await self.connect()
+        await self.command(communicator, type="START_FOCUS", task_id=self.task.id)
+
+        reply = await self.command(communicator, type="COMPLETE", request_id="c")
+
+        self.assertEqual(reply["type"], "COMMAND_RESULT")
+        self.assertEqual(reply["session"]["fsm_state"], "TERMINATED")
+        await communicator.disconnect()
+
+        task = await Task.objects.aget(pk=self.task.pk)
+        self.assertNotEqual(task.status, "completed")
+
+    async def test_command_invalid_for_state_is_rejected(self):
+        communicator = await self.connect()
+
+        reply = await self.command(communicator, type="RESUME", request_id="r")
+
+        self.assertEqual(reply["type"], "COMMAND_ERROR")
+        self.assertEqual(reply["error"], "TRANSITION_CONFLICT")
+        self.assertEqual(reply["fsm_state"], "IDLE")
+        self.assertEqual(reply["request_id"], "r")
+        await communicator.disconnect()
+
+    async def test_break_blocked_while_focus_runs(self):
+        await PomodoroSession.objects.acreate(user=self.user, task=self.task)
+        communicator = await self.connect()
+        await communicator.receive_json_from()  # active session sent on connect
+
+        reply = await self.command(communicator, type="START_BREAK", break_type="short")
+
+        self.assertEqual(reply["error"], "TRANSITION_CONFLICT")
+        self.assertEqual(reply["fsm_state"], "FOCUS_RUNNING")
+        await communicator.disconnect()
+
+    async def test_unknown_and_malformed_messages(self):
+        communicator = await self.connect()
+
+        reply = await self.command(communicator, type="SKIP", request_id="x")
+        self.assertEqual(reply["error"], "UNKNOWN_COMMAND")
+
+        await communicator.send_to("not json")
+        reply = await communicator.receive_json_from()
+        self.assertEqual(reply["error"], "INVALID_MESSAGE")
+
+        reply = await self.command(communicator, type=["PAUSE"])
+        self.assertEqual(reply["error"], "UNKNOWN_COMMAND")
+
+        for task_id in ("abc", True, 1.5):
+            reply = await self.command(communicator, type="PAUSE", task_id=task_id)
+            self.assertEqual(reply["error"], "INVALID_COMMAND", task_id)
+        await communicator.disconnect()
+
+    async def test_failing_command_keeps_socket_open(self):
+        communicator = await self.connect()
+
+        with mock.patch.object(SessionCommands, "execute", side_effect=RuntimeError), \
+                self.assertLogs("apps.pomodoro.consumers", "ERROR"):
+            reply = await self.command(communicator, type="PAUSE", request_id="p")
+        self.assertEqual(reply["error"], "SERVER_ERROR")
+        self.assertEqual(reply["request_id"], "p")
+
+        reply = await self.command(communicator, type="PAUSE")
+        self.assertEqual(reply["error"], "TRANSITION_CONFLICT")
+        await communicator.disconnect()
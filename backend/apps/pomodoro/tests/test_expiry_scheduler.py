@@ -0,0 +1,119 @@
+from datetime import timedelta
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TransactionTestCase
+from django.utils import timezone
+
+from apps.pomodoro.models import PomodoroSession
+from apps.pomodoro.scheduler import SessionExpiryScheduler
+from apps.pomodoro.services import PomodoroService
+from apps.pomodoro.tests.base import BaseAPITestCase
+from apps.tasks.models import Task
+
+User = get_user_model()
+
+
+class TestTimerWheel(SimpleTestCase):
+    def test_sessions_fire_at_their_deadline(self):
+        wheel = SessionExpiryScheduler()
+        now = timezone.now()
+        wheel.track(1, now + timedelta(seconds=5))
+        wheel.track(2, now + timedelta(seconds=60))
+
+        self.assertEqual(wheel.pop_due(now), [])
+        self.assertEqual(wheel.pop_due(now + timedelta(seconds=6)), [1])
+        self.assertEqual(wheel.pop_due(now + timedelta(seconds=61)), [2])
+        self.assertEqual(len(wheel), 0)
+
+    def test_retracking_moves_the_deadline(self):
+        wheel = SessionExpiryScheduler()
+        now = timezone.now()
+        wheel.track(1, now + timedelta(seconds=5))
+        wheel.track(1, now + timedelta(seconds=30))
+
+        self.assertEqual(wheel.pop_due(now + timedelta(seconds=10)), [])
+        self.assertEqual(wheel.pop_due(now + timedelta(seconds=31)), [1])
+
+    def test_paused_sessions_are_untracked(self):
+        wheel = SessionExpiryScheduler()
+        wheel.track(1, timezone.now() + timedelta(seconds=5))
+        wheel.track(1, None)
+
+        self.assertNotIn(1, wheel)
+
+
+class TestExpireSession(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.session = PomodoroSession.objects.create(
+            user=self.user,
+            task=self.task,
+            started_at=timezone.now() - timedelta(minutes=30),
+            duration_minutes=25,
+        )
+
+    def test_expired_focus_completes_at_deadline_and_starts_break(self):
+        PomodoroService.expire_session(self.session.id)
+
+        self.session.refresh_from_db()
+        self.assertTrue(self.session.completed)
+        self.assertEqual(self.session.actual_duration_seconds, 25 * 60)
+        self.assertTrue(
+            PomodoroSession.objects.filter(user=self.user, is_break=True, completed=False).exists()
+        )
+
+    def test_expiry_runs_flow_only_once(self):
+        PomodoroService.expire_session(self.session.id)
+        PomodoroService.expire_session(self.session.id)
+
+        self.assertEqual(
+            PomodoroSession.objects.filter(user=self.user, is_break=True).count(), 1
+        )
+
+    def test_broadcasts_wait_for_commit(self):
+        with mock.patch("apps.pomodoro.services.broadcast_task_event") as broadcast:
+            with self.captureOnCommitCallbacks() as callbacks:
+                PomodoroService.expire_session(self.session.id)
+            self.assertFalse(broadcast.called)
+
+            for callback in callbacks:
+                callback()
+
+        ended, started = [call.args[1] for call in broadcast.call_args_list]
+        self.assertEqual(ended.pk, self.session.pk)
+        self.assertTrue(started.is_break)
+
+    def test_running_session_returns_new_deadline(self):
+        PomodoroSession.objects.filter(pk=self.session.pk).update(paused_duration_seconds=600)
+
+        deadline = PomodoroService.expire_session(self.session.id)
+
+        self.assertIsNotNone(deadline)
+        self.session.refresh_from_db()
+        self.assertFalse(self.session.completed)
+
+
+class TestSchedulerRecovery(TransactionTestCase):
+    # database_sync_to_async closes the connection, which a TestCase
+    # transaction would not survive on a file database
+    def setUp(self):
+        user = User.objects.create_user(email="test@example.com", password="password123")
+        task = Task.objects.create(title="Write blog post", owner=user)
+        self.session = PomodoroSession.objects.create(
+            user=user,
+            task=task,
+            started_at=timezone.now() - timedelta(minutes=30),
+            duration_minutes=25,
+        )
+
+    def test_scheduler_recovers_deadlines_and_expires(self):
+        scheduler = SessionExpiryScheduler()
+        async_to_sync(scheduler.resync)()
+        self.assertIn(self.session.id, scheduler)
+
+        async_to_sync(scheduler.tick)(timezone.now() + timedelta(seconds=1))
+
+        self.session.refresh_from_db()
+        self.assertTrue(self.session.completed)
@@ -0,0 +1,149 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest import mock
+
+import pytz
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TransactionTestCase
+
+from apps.analytics.models import UserDailyStats
+from apps.analytics.services import DailyStatsService
+from apps.pomodoro.ingest import SessionIngestError, SessionIngestService
+from apps.pomodoro.models import PomodoroSession, PomodoroPause
+from apps.pomodoro.tests.base import BaseAPITestCase
+
+START = datetime(2026, 3, 10, 9, tzinfo=pytz.UTC)
+URL = "/pomodoro/sessions/bulk/"
+
+
+def item(offset_minutes, minutes=25, **extra):
+    started = START + timedelta(minutes=offset_minutes)
+    return {
+        "started_at": started.isoformat(),
+        "ended_at": (started + timedelta(minutes=minutes)).isoformat(),
+        **extra,
+    }
+
+
+class TestSessionIngest(BaseAPITestCase):
+    def test_batch_is_written_with_pauses_totals_and_rollups(self):
+        pause = {
+            "paused_at": (START + timedelta(minutes=10)).isoformat(),
+            "resumed_at": (START + timedelta(minutes=15)).isoformat(),
+        }
+        payload = {"sessions": [
+            item(0, 30, task_id=self.task.id, pauses=[pause]),
+            item(30, 5, is_break=True, break_type="short"),
+            item(40, 25, task_id=self.task.id),
+        ]}
+
+        response = self.client.post(URL, payload, format="json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["created"], 3)
+        self.assertEqual(PomodoroPause.objects.filter(session__user=self.user).count(), 1)
+        self.assertEqual(
+            PomodoroSession.objects.get(pk=response.data["session_ids"][0]).actual_duration_seconds, 25 * 60
+        )
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.total_focus_seconds, 50 * 60)
+
+        stats = UserDailyStats.objects.get(user=self.user, date=START.date())
+        self.assertEqual(stats.focus_seconds, 50 * 60)
+        self.assertEqual(stats.pomodoros_completed, 2)
+        self.assertEqual(stats.breaks_completed, 1)
+        self.assertEqual(sum(stats.hourly_focus_seconds), 50 * 60)
+
+    def test_matches_incremental_rollups(self):
+        # Crosses midnight UTC and has a pause
+        payload = {"sessions": [item(14 * 60 + 50, 30, pauses=[{
+            "paused_at": (START + timedelta(hours=15)).isoformat(),
+            "resumed_at": (START + timedelta(hours=15, minutes=2)).isoformat(),
+        }])]}
+        self.client.post(URL, payload, format="json")
+        march = UserDailyStats.objects.filter(user=self.user, date__month=3).order_by("date")
+        ingested = list(march.values())
+
+        DailyStatsService.rebuild(self.user)
+        rebuilt = list(march.values())
+
+        self.assertEqual(len(ingested), 2)
+        fields = ("date", "focus_seconds", "pomodoros_completed", "hourly_focus_seconds")
+        self.assertEqual(
+            [{f: row[f] for f in fields} for row in ingested],
+            [{f: row[f] for f in fields} for row in rebuilt],
+        )
+
+    def test_overlaps_reject_the_whole_batch(self):
+        PomodoroSession.objects.create(
+            user=self.user, started_at=START + timedelta(hours=2),
+            ended_at=START + timedelta(hours=2, minutes=25), completed=True,
+        )
+        payload = {"sessions": [
+            item(0),
+            item(10),          # overlaps item 0
+            item(2 * 60 + 5),  # overlaps the stored session
+        ]}
+
+        response = self.client.post(URL, payload, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([error["index"] for error in response.data["errors"]], [1, 2])
+        self.assertEqual(PomodoroSession.objects.filter(user=self.user).count(), 1)
+
+    def test_invalid_items(self):
+        other_task = self.task.__class__.objects.create(
+            title="Other", owner=type(self.user).objects.create_user(email="o@example.com", password="password123")
+        )
+        cases = [
+            item(0, minutes=-5),
+            {"started_at": "2026-03-10T09:00:00", "ended_at": "2026-03-10T09:25:00"},
+            item(0, is_break=True),
+            item(0, task_id=other_task.id),
+            item(0, pauses=[{"paused_at": START.isoformat(), "resumed_at": (START + timedelta(hours=1)).isoformat()}]),
+            {"started_at": datetime.now(pytz.UTC).isoformat(), "ended_at": (datetime.now(pytz.UTC) + timedelta(hours=1)).isoformat()},
+        ]
+        for case in cases:
+            response = self.client.post(URL, {"sessions": [case]}, format="json")
+            self.assertEqual(response.status_code, 400, case)
+
+        self.assertEqual(self.client.post(URL, {"sessions": []}, format="json").status_code, 400)
+
+
+class TestConcurrentIngest(TransactionTestCase):
+    def setUp(self):
+        if connection.vendor == "sqlite" and connection.is_in_memory_db():
+            self.skipTest("needs a test database that separate connections can share")
+        self.user = get_user_model().objects.create_user(email="ingest@example.com", password="password123")
+
+    def test_overlapping_batches_cannot_both_pass(self):
+        overlaps = SessionIngestService._overlaps
+
+        def slow_overlaps(user, parsed):
+            # Hold the window between the check and the insert open
+            errors = overlaps(user, parsed)
+            time.sleep(0.2)
+            return errors
+
+        outcomes = []
+
+        def ingest(offset):
+            try:
+                SessionIngestService.ingest(self.user, [item(offset)])
+                outcomes.append("stored")
+            except SessionIngestError:
+                outcomes.append("rejected")
+            finally:
+                connection.close()
+
+        with mock.patch.object(SessionIngestService, "_overlaps", staticmethod(slow_overlaps)):
+            threads = [threading.Thread(target=ingest, args=(offset,)) for offset in (0, 10)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(sorted(outcomes), ["rejected", "stored"])
+        self.assertEqual(PomodoroSession.objects.filter(user=self.user).count(), 1)
@@ -0,0 +1,55 @@
+from datetime import timedelta
+from django.utils import timezone
+
+from apps.pomodoro.models import PomodoroSession, PomodoroPause
+from apps.pomodoro.tests.base import BaseAPITestCase
+from apps.pomodoro.utils import build_session_payload
+
+
+class TestPauseAccounting(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.post(f"/tasks/{self.task.id}/start/")
+        self.session = PomodoroSession.objects.get(user=self.user)
+
+    def test_pause_sets_open_pause_marker(self):
+        self.client.post(f"/tasks/{self.task.id}/pause/")
+
+        self.session.refresh_from_db()
+        pause = PomodoroPause.objects.get(session=self.session)
+        self.assertEqual(self.session.paused_at, pause.paused_at)
+        self.assertEqual(self.session.paused_duration_seconds, 0)
+
+    def test_resume_accumulates_paused_seconds(self):
+        self.client.post(f"/tasks/{self.task.id}/pause/")
+        # Pretend the pause started a minute ago
+        earlier = timezone.now() - timedelta(seconds=60)
+        PomodoroSession.objects.filter(pk=self.session.pk).update(paused_at=earlier)
+        PomodoroPause.objects.filter(session=self.session).update(paused_at=earlier)
+
+        self.client.post(f"/tasks/{self.task.id}/resume/")
+
+        self.session.refresh_from_db()
+        self.assertIsNone(self.session.paused_at)
+        self.assertGreaterEqual(self.session.paused_duration_seconds, 60)
+
+    def test_payload_needs_no_queries(self):
+        self.client.post(f"/tasks/{self.task.id}/pause/")
+        session = PomodoroSession.objects.get(pk=self.session.pk)
+
+        with self.assertNumQueries(0):
+            payload = build_session_payload(session)
+
+        self.assertEqual(payload["fsm_state"], "FOCUS_PAUSED")
+        self.assertIn("RESUME", payload["allowed_actions"])
+
+    def test_complete_while_paused_closes_marker(self):
+        self.client.post(f"/tasks/{self.task.id}/pause/")
+        self.client.post(f"/tasks/{self.task.id}/complete/")
+
+        self.session.refresh_from_db()
+        self.assertTrue(self.session.completed)
+        self.assertIsNone(self.session.paused_at)
+        self.assertIsNotNone(
+            PomodoroPause.objects.get(session=self.session).resumed_at
+        )
@@ -0,0 +1,66 @@
+from datetime import timedelta
+from django.utils import timezone
+
+from apps.pomodoro.models import PomodoroSession
+from apps.pomodoro.snapshot import SessionSnapshot
+from apps.pomodoro.tests.base import BaseAPITestCase
+
+
+class TestSessionSnapshot(BaseAPITestCase):
+    def _session(self, **kwargs):
+        defaults = {
+            "user": self.user,
+            "task": self.task,
+            "started_at": timezone.now() - timedelta(minutes=10),
+            "duration_minutes": 25,
+        }
+        defaults.update(kwargs)
+        return PomodoroSession.objects.create(**defaults)
+
+    def test_running_focus_snapshot(self):
+        session = self._session(paused_duration_seconds=120)
+        snapshot = SessionSnapshot(session)
+
+        self.assertEqual(snapshot.fsm_state, "FOCUS_RUNNING")
+        self.assertEqual(snapshot.allowed_actions, ["COMPLETE", "PAUSE"])
+        self.assertEqual(snapshot.paused_seconds, 120)
+        self.assertAlmostEqual(snapshot.elapsed_seconds, 8 * 60, delta=2)
+        self.assertAlmostEqual(snapshot.remaining_seconds, 17 * 60, delta=2)
+
+    def test_paused_break_counts_open_pause(self):
+        now = timezone.now()
+        session = self._session(
+            is_break=True,
+            break_type="short",
+            paused_at=now - timedelta(minutes=1),
+        )
+        snapshot = SessionSnapshot(session, now=now)
+
+        self.assertEqual(snapshot.fsm_state, "BREAK_PAUSED")
+        self.assertEqual(snapshot.paused_seconds, 60)
+        self.assertFalse(snapshot.is_running)
+
+    def test_load_active_is_single_query(self):
+        self._session()
+
+        with self.assertNumQueries(1):
+            snapshot = SessionSnapshot.load_active(self.user.id)
+            snapshot.to_payload()
+
+        self.assertEqual(snapshot.session.task_id, self.task.id)
+
+    def test_task_sessions_listing_is_constant_queries(self):
+        for minutes in range(5):
+            self._session(
+                started_at=timezone.now() - timedelta(hours=minutes + 1),
+                ended_at=timezone.now() - timedelta(hours=minutes),
+                completed=True,
+                is_break=True,
+            )
+
+        with self.assertNumQueries(1):
+            response = self.client.get(f"/pomodoro/sessions/{self.task.id}/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 5)
+        self.assertEqual(response.data[0]["remaining_seconds"], 0)
@@ -0,0 +1,75 @@
+from datetime import timedelta
+from django.utils import timezone
+
+from apps.pomodoro.fsm import PomodoroFSM, TransitionConflict
+from apps.pomodoro.models import PomodoroSession
+from apps.pomodoro.services import PomodoroService
+from apps.pomodoro.tests.base import BaseAPITestCase
+from apps.pomodoro.transitions import SessionTransitions
+
+
+class TestSessionTransitions(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.session = PomodoroSession.objects.create(
+            user=self.user,
+            task=self.task,
+            started_at=timezone.now() - timedelta(minutes=5),
+        )
+
+    def test_new_sessions_get_initial_state(self):
+        self.assertEqual(self.session.state, "FOCUS_RUNNING")
+
+    def test_transition_table_matches_allowed_events(self):
+        for (state, event) in PomodoroFSM.NEXT_STATE:
+            self.assertTrue(PomodoroFSM.can_transition(state, event))
+
+    def test_pause_is_a_single_update(self):
+        with self.assertNumQueries(3):  # change number + conditional UPDATE + pause log insert
+            SessionTransitions.apply(self.session, "PAUSE")
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.state, "FOCUS_PAUSED")
+        self.assertIsNotNone(self.session.paused_at)
+
+    def test_stale_copy_loses_the_race(self):
+        stale = PomodoroSession.objects.get(pk=self.session.pk)
+        SessionTransitions.apply(self.session, "PAUSE")
+
+        with self.assertRaises(TransitionConflict) as ctx:
+            SessionTransitions.apply(stale, "COMPLETE")
+
+        self.assertEqual(ctx.exception.expected, "FOCUS_RUNNING")
+        self.assertEqual(ctx.exception.actual, "FOCUS_PAUSED")
+
+    def test_double_completion_creates_one_break(self):
+        other = PomodoroSession.objects.get(pk=self.session.pk)
+        PomodoroService.complete_session(self.session)
+
+        with self.assertRaises(TransitionConflict):
+            PomodoroService.complete_session(other)
+
+        self.assertEqual(
+            PomodoroSession.objects.filter(user=self.user, is_break=True).count(), 1
+        )
+
+    def test_repeated_pause_is_idempotent(self):
+        self.assertTrue(SessionTransitions.apply(self.session, "PAUSE", idempotent=True))
+        self.assertFalse(SessionTransitions.apply(self.session, "PAUSE", idempotent=True))
+        self.assertEqual(self.session.pauses.count(), 1)
+
+
+class TestTransitionConflictResponse(BaseAPITestCase):
+    def test_completing_a_paused_break_is_rejected(self):
+        PomodoroSession.objects.create(
+            user=self.user,
+            task=self.task,
+            is_break=True,
+            break_type="short",
+            paused_at=timezone.now(),
+        )
+
+        response = self.client.post(f"/tasks/{self.task.id}/complete/")
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data["fsm_state"], "BREAK_PAUSED")
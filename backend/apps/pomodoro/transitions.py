@@ -0,0 +1,166 @@
+from django.db import transaction
+from django.utils import timezone
+
+from apps.sync.sequence import ChangeSequence
+from apps.pomodoro.fsm import PomodoroFSM, TransitionConflict
+from apps.pomodoro.models import PomodoroSession, PomodoroPause
+
+
+class SessionTransitions:
+    """
+    PomodoroFSM transitions for persisted sessions, without session row locks.
+
+    Each transition is a conditional UPDATE guarded by the state and pause
+    accounting the caller read (compare-and-set). Two tabs racing on the
+    same session cannot both win: the loser gets a TransitionConflict
+    instead of waiting on the session row, and a session can only be
+    completed once.
+
+    Delta sync takes part of that back. apply() also takes the user's change
+    number (ChangeSequence.next), an UPDATE of the user's SyncCounter row
+    that stays locked until the transaction commits. A transition is
+    therefore two statements, and all of a user's concurrent writes
+    (transitions, task saves, ingest batches) queue on that row one
+    transaction at a time, much as they did on select_for_update before.
+    The conditional UPDATE still decides who wins; the counter only orders
+    them. aapply() runs without a transaction and holds the counter only
+    for the stamp after its writes.
+    """
+
+    @staticmethod
+    def apply(session, event, *, now=None, idempotent=False):
+        """
+        Move `session` through `event` and update the instance in place.
+
+        Returns True when the transition happened. With `idempotent=True`,
+        a session already in the state `event` leads to is left alone and
+        False is returned; any other mismatch raises TransitionConflict.
+        """
+        now = now or timezone.now()
+        current = session.state or session.initial_state()
+
+        if idempotent and PomodoroFSM.is_settled(current, event):
+            return False
+
+        target = PomodoroFSM.next_state(current, event)
+        if target is None:
+            raise TransitionConflict(event, None, current)
+
+        changes = SessionTransitions._changes(session, event, now)
+        # The session row and its pause history change together, under one change number
+        with transaction.atomic(savepoint=False):
+            updated = ChangeSequence.update(
+                PomodoroSession.objects.filter(
+                    pk=session.pk,
+                    state=current,
+                    paused_at=session.paused_at,
+                    paused_duration_seconds=session.paused_duration_seconds,
+                ),
+                session.user_id,
+                state=target,
+                **changes,
+            )
+            if updated:
+                SessionTransitions._record_pause(session, event, now)
+
+        if not updated:
+            actual = (
+                PomodoroSession.objects
+                .filter(pk=session.pk)
+                .values_list("state", flat=True)
+                .first()
+            )
+            if idempotent and PomodoroFSM.is_settled(actual, event):
+                session.refresh_from_db()
+                return False
+            raise TransitionConflict(event, current, actual)
+
+        for field, value in changes.items():
+            setattr(session, field, value)
+        session.state = target
+        return True
+
+    @staticmethod
+    async def aapply(session, event, *, now=None, idempotent=False):
+        """Async counterpart of apply() built on the async ORM."""
+        now = now or timezone.now()
+        current = session.state or session.initial_state()
+
+        if idempotent and PomodoroFSM.is_settled(current, event):
+            return False
+
+        target = PomodoroFSM.next_state(current, event)
+        if target is None:
+            raise TransitionConflict(event, None, current)
+
+        changes = SessionTransitions._changes(session, event, now)
+        updated = await PomodoroSession.objects.filter(
+            pk=session.pk,
+            state=current,
+            paused_at=session.paused_at,
+            paused_duration_seconds=session.paused_duration_seconds,
+        ).aupdate(state=target, **changes)
+
+        if not updated:
+            actual = await (
+                PomodoroSession.objects
+                .filter(pk=session.pk)
+                .values_list("state", flat=True)
+                .afirst()
+            )
+            if idempotent and PomodoroFSM.is_settled(actual, event):
+                await session.arefresh_from_db()
+                return False
+            raise TransitionConflict(event, current, actual)
+
+        if event == "PAUSE":
+            await PomodoroPause.objects.acreate(session=session, paused_at=now)
+        elif session.paused_at:
+            await PomodoroPause.objects.filter(
+                session=session, resumed_at__isnull=True
+            ).aupdate(resumed_at=now)
+        # Stamped last, once the row and its pauses are written
+        await ChangeSequence.astamp(PomodoroSession.objects.filter(pk=session.pk), session.user_id)
+
+        for field, value in changes.items():
+            setattr(session, field, value)
+        session.state = target
+        return True
+
+    @staticmethod
+    def _changes(session, event, now):
+        if event == "PAUSE":
+            return {"paused_at": now}
+
+        paused_duration_seconds = session.paused_duration_seconds or 0
+        if session.paused_at:
+            paused_duration_seconds += max(0, int((now - session.paused_at).total_seconds()))
+
+        if event == "RESUME":
+            return {
+                "paused_at": None,
+                "paused_duration_seconds": paused_duration_seconds,
+            }
+
+        if event == "COMPLETE":
+            return {
+                "completed": True,
+                "ended_at": now,
+                "paused_at": None,
+                "paused_duration_seconds": paused_duration_seconds,
+                "actual_duration_seconds": int(
+                    (now - session.started_at).total_seconds() - paused_duration_seconds
+                ),
+            }
+
+        raise ValueError(f"Unsupported session event: {event}")
+
+    @staticmethod
+    def _record_pause(session, event, now):
+        """Keep the PomodoroPause history in step with the session row."""
+        if event == "PAUSE":
+            PomodoroPause.objects.create(session=session, paused_at=now)
+        elif session.paused_at:
+            PomodoroPause.objects.filter(
+                session=session, resumed_at__isnull=True
+            ).update(resumed_at=now)
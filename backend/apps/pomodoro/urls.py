@@ -1,11 +1,15 @@
 from django.urls import path
-from apps.pomodoro import views
+from apps.pomodoro import views, async_views
 
 urlpatterns = [
     path('active-session/', views.ActiveSessionAPIView.as_view()),
     path('active-session/<int:task_id>/', views.ActiveSessionAPIView.as_view()),
     path('sessions/<int:pk>/complete/', views.CompleteSessionAPIView.as_view()),
     path("break/start/", views.StartBreakAPIView.as_view()),
+    path('sessions/bulk/', views.BulkSessionIngestAPIView.as_view()),
     path('sessions/<int:task_id>/', views.TaskSessionsView.as_view(), name='task-sessions'),
     path('heartbeat/', views.PomodoroHeartbeatAPIView.as_view()),
+    path('async/active-session/', async_views.AsyncActiveSessionAPIView.as_view()),
+    path('async/active-session/<int:task_id>/', async_views.AsyncActiveSessionAPIView.as_view()),
+    path('async/heartbeat/', async_views.AsyncPomodoroHeartbeatAPIView.as_view()),
 ]
\ No newline at end of file
@@ -1,82 +1,63 @@
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
-from django.utils import timezone
-from django.db.models import Sum, F, DurationField, ExpressionWrapper
+from rest_framework import status
+from rest_framework.response import Response
 
-from apps.pomodoro.fsm import PomodoroFSM
+from apps.pomodoro.snapshot import SessionSnapshot
+from core import fastjson
+from core.timing import span, timed
 
 channel_layer = get_channel_layer()
 
     
 def build_session_payload(session):
-    now = timezone.now()
+    return SessionSnapshot(session).to_payload()
 
-    elapsed = session.elapsed_seconds
-    remaining = max(0, session.duration_minutes * 60 - elapsed)
 
-    paused_seconds = 0
-    paused = session.pauses.filter(resumed_at__isnull=False).aggregate(
-        total=Sum(
-            ExpressionWrapper(
-                F("resumed_at") - F("paused_at"),
-                output_field=DurationField()
-            )
-        )
-    )["total"]
-
-    if paused:
-        paused_seconds += paused.total_seconds()
+def _task_event(session, manual_completion):
+    payload = build_session_payload(session)
+    
+    if manual_completion:
+        payload["fsm_state"] = "TERMINATED"
+        payload["ended"] = True
 
-    ongoing_pause = session.pauses.filter(resumed_at__isnull=True).last()
-    if ongoing_pause:
-        paused_seconds += (now - ongoing_pause.paused_at).total_seconds()
+    return pomodoro_event(payload)
 
-    fsm_state = derive_session_state(session)
-    allowed_actions = list(
-        PomodoroFSM.TRANSITIONS.get(fsm_state, [])
-    )
 
+def pomodoro_event(payload):
+    """A group message for PomodoroConsumer.pomodoro_event, encoded once for all sockets."""
     return {
-        "type": "SESSION_UPDATE",
-        "fsm_state": fsm_state,
-        "allowed_actions": allowed_actions,
-        "task_id": session.task_id,
-        "session_id": session.id,
-        "is_break": session.is_break,
-        "remaining_seconds": int(remaining),
-        "total_duration_seconds": session.duration_minutes * 60,
-        "paused_seconds": int(paused_seconds),
-        "started_at": session.started_at.isoformat(),
-        "ended": session.completed,
+        "type": "pomodoro.event",
+        "text": fastjson.dumps_text(payload),
     }
 
 
+@timed("broadcast_task_event")
 def broadcast_task_event(user_id, session, *, manual_completion=False):
-    payload = build_session_payload(session)
-    
-    if manual_completion:
-        payload["fsm_state"] = "TERMINATED"
-        payload["ended"] = True
+    event = _task_event(session, manual_completion)
+    with span("group_send"):
+        async_to_sync(channel_layer.group_send)(f"user_{user_id}", event)
 
-    async_to_sync(channel_layer.group_send)(
-        f"user_{user_id}",
-        {
-            "type": "pomodoro.event",
-            "payload": payload,
-        }
-    )
+
+@timed("broadcast_task_event")
+async def abroadcast_task_event(user_id, session, *, manual_completion=False):
+    """broadcast_task_event for async callers: awaits the channel layer directly."""
+    event = _task_event(session, manual_completion)
+    with span("group_send"):
+        await channel_layer.group_send(f"user_{user_id}", event)
 
 def derive_session_state(session):
     """State derivation helper, used by API, Websocket and FSM Validation.."""
-    if not session:
-        return "IDLE"
+    return SessionSnapshot.derive_state(session)
 
-    if session.completed:
-        return "TERMINATED"
-
-    is_paused = session.pauses.filter(resumed_at__isnull=True).exists()
-
-    if session.is_break:
-        return "BREAK_PAUSED" if is_paused else "BREAK_RUNNING"
-
-    return "FOCUS_PAUSED" if is_paused else "FOCUS_RUNNING"
+def transition_conflict_response(exc):
+    """409 response for a TransitionConflict lost to a concurrent request."""
+    return Response(
+        {
+            "error": "TRANSITION_CONFLICT",
+            "message": exc.messages[0],
+            "event": exc.event,
+            "fsm_state": exc.actual,
+        },
+        status=status.HTTP_409_CONFLICT,
+    )
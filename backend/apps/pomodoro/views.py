@@ -3,14 +3,34 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
 from django.utils import timezone
-from django.db.models import F, Sum, ExpressionWrapper, DurationField
 
 from apps.tasks.models import Task
 
-from apps.pomodoro.serializers import PomodoroSessionSerializer
+from apps.pomodoro.serializers import PomodoroSessionSerializer, session_reader
 from apps.pomodoro.models import PomodoroSession
 from apps.pomodoro.services import PomodoroService
-from apps.pomodoro.utils import build_session_payload, derive_session_state
+from apps.pomodoro.snapshot import SessionSnapshot
+from apps.pomodoro.scheduler import expiry_scheduler
+from apps.pomodoro.fsm import TransitionConflict
+from apps.pomodoro.ingest import SessionIngestService, SessionIngestError
+from core.pagination import KeysetPagination
+from apps.pomodoro.utils import transition_conflict_response
+
+def active_session_data(session):
+    snapshot = SessionSnapshot(session)
+
+    return {
+        "id": session.id,
+        "task_id": session.task_id,
+        "fsm_state": snapshot.fsm_state,
+        "started_at": session.started_at,
+        "ended_at": session.ended_at,
+        "is_running": snapshot.is_running,
+        "completed": session.completed,
+        "duration_minutes": session.duration_minutes,
+        "total_duration_seconds": snapshot.total_duration_seconds,
+        "paused_seconds": snapshot.paused_seconds,
+    }
 
 class ActiveSessionAPIView(APIView):
     permission_classes = [IsAuthenticated]
@@ -31,31 +51,11 @@ class ActiveSessionAPIView(APIView):
         if not session:
             return Response({"active": False}, status=status.HTTP_200_OK)
 
-        # Calculate paused duration
-        paused = session.pauses.filter(resumed_at__isnull=False).aggregate(
-            total=Sum(
-                ExpressionWrapper(F("resumed_at") - F("paused_at"), output_field=DurationField())
-            )
-        )["total"]
-        paused_seconds = paused.total_seconds() if paused else 0
-        
-        fsm_state = derive_session_state(session)
-
-        # Prepare the response dict
-        data = {
-            "id": session.id,
-            "task_id": session.task.id if session.task else None,
-            "fsm_state": fsm_state,
-            "started_at": session.started_at,
-            "ended_at": session.ended_at,
-            "is_running": not session.pauses.filter(resumed_at__isnull=True).exists() and not session.completed,
-            "completed": session.completed,
-            "duration_minutes": session.duration_minutes,
-            "total_duration_seconds": session.duration_minutes * 60,
-            "paused_seconds": paused_seconds,
-        }
-
-        return Response(data, status=status.HTTP_200_OK)
+        return Response(active_session_data(session), status=status.HTTP_200_OK)
+
+class SessionPagination(KeysetPagination):
+    ordering = ("created_at", "id")
+    page_number_query_param = None
 
 class TaskSessionsView(APIView):
     permission_classes = [IsAuthenticated]
@@ -63,23 +63,35 @@ class TaskSessionsView(APIView):
     def get(self, request, task_id):
         """
         Return all sessions for a task belonging to the current user.
+        `?fields=id,started_at` returns only those fields.
         """
         user = request.user
-        sessions_qs = PomodoroService.get_task_sessions(user=user, task_id=task_id)
-        serializer = PomodoroSessionSerializer(sessions_qs, many=True)
-        return Response(serializer.data)
+        fields = session_reader.requested_fields(request)
+        sessions_qs = session_reader.values(
+            PomodoroService.get_task_sessions(user=user, task_id=task_id), fields,
+            extra=[name.lstrip("-") for name in SessionPagination.ordering],
+        )
+
+        # Plain list unless the client asks for cursor pages
+        paginator = None
+        if {"cursor", "page_size"} & set(request.query_params):
+            paginator = SessionPagination()
+            sessions_qs = paginator.paginate_queryset(sessions_qs, request, view=self)
+
+        data = session_reader.serialize(sessions_qs, fields)
+        if paginator is not None:
+            return paginator.get_paginated_response(data)
+        return Response(data)
     
 class CompleteSessionAPIView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request, pk):
         session = PomodoroSession.objects.get(pk=pk, user=request.user)
-        session.ended_at = timezone.now()
-        session.completed = True
-        session.actual_duration_seconds = int(
-            (session.ended_at - session.started_at).total_seconds()
-        )
-        session.save()
+        try:
+            PomodoroService.complete_session(session, manual=True)
+        except TransitionConflict as e:
+            return transition_conflict_response(e)
 
         return Response(PomodoroSessionSerializer(session).data)
     
@@ -97,7 +109,7 @@ class PomodoroHeartbeatAPIView(APIView):
 
         return Response({
             "active": True,
-            **build_session_payload(session),
+            **SessionSnapshot(session).to_payload(),
         })
 
 class StartBreakAPIView(APIView):
@@ -145,7 +157,30 @@ class StartBreakAPIView(APIView):
             duration_minutes=duration,
             started_at=timezone.now()
         )
+        expiry_scheduler.schedule(session)
 
         serializer = PomodoroSessionSerializer(session)
 
         return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+class BulkSessionIngestAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        """
+        Store completed sessions recorded offline, with their pauses, in one
+        transaction. The whole batch is rejected if any session is invalid.
+        """
+        try:
+            items = request.data.get("sessions") if isinstance(request.data, dict) else request.data
+            sessions = SessionIngestService.ingest(request.user, items)
+        except SessionIngestError as e:
+            return Response(
+                {"detail": "Invalid sessions", "errors": e.errors},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response(
+            {"created": len(sessions), "session_ids": [session.id for session in sessions]},
+            status=status.HTTP_201_CREATED
+        )
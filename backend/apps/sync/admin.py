@@ -0,0 +1,6 @@
+from django.contrib import admin
+from apps.sync.models import SyncCounter, SyncTombstone
+
+# Register your models here.
+admin.site.register(SyncCounter)
+admin.site.register(SyncTombstone)
@@ -0,0 +1,17 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.sync.services import SyncService
+
+
+class Command(BaseCommand):
+    help = "Delete sync tombstones older than --days; clients with older cursors get a full snapshot."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=90, help="Tombstone retention in days (default 90)")
+
+    def handle(self, *args, **options):
+        deleted = SyncService.prune(timezone.now() - timedelta(days=options["days"]))
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} tombstone(s)"))
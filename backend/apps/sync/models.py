@@ -0,0 +1,45 @@
+from django.db import models
+
+from apps.accounts.models import User
+
+
+class SyncCounter(models.Model):
+    """
+    A user's change sequence for delta sync (see ChangeSequence).
+
+    `seq` is the last number handed out; every synced row and tombstone
+    carries the number of the write that last touched it. Tombstones at or
+    below `pruned_seq` have been deleted, so older cursors must resync.
+    """
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='sync_counter')
+    seq = models.BigIntegerField(default=0)
+    pruned_seq = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = 'sync_counters'
+
+    def __str__(self):
+        return f"{self.user_id} @{self.seq}"
+
+
+class SyncTombstone(models.Model):
+    """A deleted row, kept so clients syncing from a cursor learn about it."""
+    KIND_CHOICES = [
+        ('task', 'Task'),
+    ]
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='sync_tombstones')
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    object_id = models.BigIntegerField()
+    seq = models.BigIntegerField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'sync_tombstones'
+        indexes = [
+            models.Index(fields=['user', 'seq']),
+            models.Index(fields=['deleted_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id} @{self.seq}"
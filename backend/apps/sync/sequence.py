@@ -0,0 +1,89 @@
+from asgiref.sync import sync_to_async
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.db.transaction import TransactionManagementError
+
+from apps.sync.models import SyncCounter, SyncTombstone
+
+
+class ChangeSequence:
+    """
+    Per-user, monotonically increasing change numbers for delta sync.
+
+    Writers take a number with `next()` inside the transaction that writes
+    the rows and stamp them with it (`sync_seq`). Taking a number is an
+    UPDATE of the user's counter row, which stays locked until that
+    transaction ends, so a user's numbers are handed out in commit order:
+    once a reader sees the counter at N, every write numbered N or lower is
+    committed and visible. Numbers of rolled-back writes are rolled back
+    with them.
+
+    The async ORM has no transactions, so async writers stamp their rows
+    after writing them (`astamp`). A reader that runs in between still
+    sees the row's older number and picks the change up on its next pull.
+    """
+
+    @staticmethod
+    def next(user_id):
+        """Take the user's next change number. Must run inside the writing transaction."""
+        connection = transaction.get_connection()
+        if not connection.in_atomic_block:
+            raise TransactionManagementError("ChangeSequence.next() must be called inside the writing transaction.")
+
+        seq = ChangeSequence._increment(connection, user_id)
+        if seq is None:
+            try:
+                with transaction.atomic():
+                    SyncCounter.objects.create(user_id=user_id, seq=1)
+                return 1
+            except IntegrityError:
+                # Another writer created the counter first
+                seq = ChangeSequence._increment(connection, user_id)
+        return seq
+
+    @staticmethod
+    def current(user_id):
+        """The user's latest change number; 0 before their first write."""
+        return SyncCounter.objects.filter(user_id=user_id).values_list("seq", flat=True).first() or 0
+
+    @staticmethod
+    def update(queryset, user_id, **changes):
+        """queryset.update(**changes), stamping the rows with a new change number."""
+        with transaction.atomic(savepoint=False):
+            return queryset.update(sync_seq=ChangeSequence.next(user_id), **changes)
+
+    @staticmethod
+    async def aupdate(queryset, user_id, **changes):
+        return await sync_to_async(ChangeSequence.update)(queryset, user_id, **changes)
+
+    @staticmethod
+    async def astamp(queryset, user_id):
+        """Stamp rows an async writer has just changed."""
+        return await ChangeSequence.aupdate(queryset, user_id)
+
+    @staticmethod
+    def tombstone(user_id, kind, object_ids, seq=None):
+        """Record deleted rows. Must run inside the deleting transaction."""
+        seq = seq or ChangeSequence.next(user_id)
+        SyncTombstone.objects.bulk_create([
+            SyncTombstone(user_id=user_id, kind=kind, object_id=object_id, seq=seq)
+            for object_id in object_ids
+        ])
+        return seq
+
+    @staticmethod
+    def _increment(connection, user_id):
+        """The incremented counter, or None when the user has none yet."""
+        if connection.vendor in ("postgresql", "sqlite") and connection.features.can_return_columns_from_insert:
+            # One round trip where UPDATE ... RETURNING is available
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"UPDATE {SyncCounter._meta.db_table} SET seq = seq + 1 WHERE user_id = %s RETURNING seq",
+                    [user_id],
+                )
+                row = cursor.fetchone()
+            return row[0] if row else None
+
+        if not SyncCounter.objects.filter(user_id=user_id).update(seq=F("seq") + 1):
+            return None
+        return SyncCounter.objects.filter(user_id=user_id).values_list("seq", flat=True).get()
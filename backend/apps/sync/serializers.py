@@ -0,0 +1,23 @@
+from rest_framework import serializers
+
+from apps.pomodoro.models import PomodoroPause
+from apps.pomodoro.serializers import PomodoroSessionSerializer
+
+
+class SyncSessionSerializer(PomodoroSessionSerializer):
+    """Sessions with the state a client needs to rebuild timers offline."""
+
+    class Meta(PomodoroSessionSerializer.Meta):
+        fields = PomodoroSessionSerializer.Meta.fields + [
+            "break_type",
+            "state",
+            "paused_at",
+            "paused_duration_seconds",
+            "created_at",
+        ]
+
+
+class SyncPauseSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = PomodoroPause
+        fields = ["id", "session", "paused_at", "resumed_at"]
@@ -0,0 +1,106 @@
+import base64
+import json
+
+from django.db.models import Max
+
+from apps.tasks.models import Task
+from apps.pomodoro.models import PomodoroSession, PomodoroPause
+from apps.sync.models import SyncCounter, SyncTombstone
+from apps.sync.sequence import ChangeSequence
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+class SyncService:
+    """
+    Delta sync of a user's tasks, sessions and pauses.
+
+    A cursor is an opaque token holding a change number. A pull reads the
+    user's counter first and then returns the rows stamped after the cursor
+    and up to that counter, plus tombstones for deleted tasks. Because the
+    counter only moves past a number once the write holding it has
+    committed (see ChangeSequence), every change up to the new cursor is
+    in the response. Changes committed while the pull runs carry higher
+    numbers and come with the next pull.
+
+    Pauses have no number of their own: every pause write also stamps its
+    session, and a changed session is returned with all of its pauses.
+    Deleting a task deletes its sessions and pauses, so a task tombstone
+    covers them too.
+    """
+
+    @staticmethod
+    def encode_cursor(seq):
+        token = json.dumps({"s": seq}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(token.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(encoded):
+        """The change number in `encoded`, or None for a first pull."""
+        if not encoded:
+            return None
+        try:
+            seq = json.loads(base64.urlsafe_b64decode(encoded.encode()))["s"]
+        except (TypeError, ValueError, KeyError, UnicodeDecodeError):
+            raise InvalidCursor("Invalid cursor")
+        if isinstance(seq, bool) or not isinstance(seq, int) or seq < 0:
+            raise InvalidCursor("Invalid cursor")
+        return seq
+
+    @staticmethod
+    def pull(user, since=None):
+        """
+        Changes after change number `since` (everything when None):
+        {"seq", "reset", "tasks", "sessions", "pauses", "deleted_tasks"}.
+        `reset` means the tombstones the cursor needs were pruned, so the
+        result is a full snapshot that replaces the client's data.
+        """
+        # Counter first: everything numbered up to it is already committed
+        seq = ChangeSequence.current(user.pk)
+
+        window = {"sync_seq__lte": seq}
+        if since is not None:
+            window["sync_seq__gt"] = since
+
+        tasks = list(Task.objects.filter(owner=user, **window).order_by("id"))
+        sessions = list(PomodoroSession.objects.filter(user=user, **window).order_by("id"))
+        pauses = PomodoroPause.objects.filter(session__user=user).order_by("id")
+        if since is not None:
+            pauses = pauses.filter(session__in=[session.id for session in sessions])
+
+        deleted_tasks = []
+        if since is not None:
+            deleted_tasks = list(
+                SyncTombstone.objects.filter(user=user, kind="task", seq__gt=since, seq__lte=seq)
+                .order_by("seq", "object_id")
+                .values_list("object_id", flat=True)
+            )
+            # Read after the tombstones: prune() raises pruned_seq before deleting any
+            pruned_seq = SyncCounter.objects.filter(user=user).values_list("pruned_seq", flat=True).first() or 0
+            if since < pruned_seq:
+                return {**SyncService.pull(user), "reset": True}
+
+        return {
+            "seq": max(seq, since or 0),
+            "reset": False,
+            "tasks": tasks,
+            "sessions": sessions,
+            "pauses": list(pauses),
+            "deleted_tasks": deleted_tasks,
+        }
+
+    @staticmethod
+    def prune(before):
+        """
+        Delete tombstones recorded before `before`; clients still holding a
+        cursor from that far back get a full snapshot. Returns the number of
+        tombstones deleted.
+        """
+        expired = SyncTombstone.objects.filter(deleted_at__lt=before)
+        last_seqs = expired.values_list("user_id").annotate(last_seq=Max("seq")).order_by()
+        for user_id, last_seq in last_seqs:
+            SyncCounter.objects.filter(user_id=user_id, pruned_seq__lt=last_seq).update(pruned_seq=last_seq)
+        deleted, _ = SyncTombstone.objects.filter(deleted_at__lt=before).delete()
+        return deleted
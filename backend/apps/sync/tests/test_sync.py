@@ -0,0 +1,304 @@
+import asyncio
+import random
+import threading
+import time
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test import TransactionTestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.pomodoro.fsm import TransitionConflict
+from apps.pomodoro.models import PomodoroSession, PomodoroPause
+from apps.sync.models import SyncTombstone
+from apps.sync.services import SyncService
+from apps.sync.tests.base import BaseAPITestCase
+from apps.tasks.models import Task
+from apps.tasks.services import TaskService
+
+User = get_user_model()
+
+
+def pull(client, cursor=None):
+    response = client.get("/sync/", {"cursor": cursor} if cursor else {})
+    assert response.status_code == 200, response.data
+    return response.data
+
+
+class TestSync(BaseAPITestCase):
+    def pull(self, cursor=None):
+        return pull(self.client, cursor)
+
+    def ids(self, rows):
+        return sorted(row["id"] for row in rows)
+
+    def test_first_pull_is_a_snapshot(self):
+        self.client.post(f"/tasks/{self.task.id}/start/")
+        self.client.post(f"/tasks/{self.task.id}/pause/")
+        session = PomodoroSession.objects.get(task=self.task)
+
+        data = self.pull()
+
+        self.assertTrue(data["reset"])
+        self.assertEqual(self.ids(data["tasks"]), [self.task.id])
+        self.assertEqual(self.ids(data["sessions"]), [session.id])
+        self.assertEqual(data["sessions"][0]["state"], "FOCUS_PAUSED")
+        self.assertEqual(len(data["pauses"]), 1)
+        self.assertEqual(data["deleted"], {"tasks": []})
+
+    def test_later_pulls_only_return_changes(self):
+        Task.objects.create(owner=self.user, title="Untouched")
+        cursor = self.pull()["cursor"]
+
+        empty = self.pull(cursor)
+        self.assertFalse(empty["reset"])
+        self.assertEqual((empty["tasks"], empty["sessions"], empty["pauses"]), ([], [], []))
+        self.assertEqual(empty["cursor"], cursor)
+
+        self.client.patch(f"/tasks/{self.task.id}/", {"priority": "high"}, format="json")
+        data = self.pull(cursor)
+        self.assertEqual(self.ids(data["tasks"]), [self.task.id])
+        self.assertEqual(data["tasks"][0]["priority"], "high")
+        self.assertEqual(self.pull(data["cursor"])["tasks"], [])
+
+    def test_session_lifecycle(self):
+        cursor = self.pull()["cursor"]
+        self.client.post(f"/tasks/{self.task.id}/start/")
+        data = self.pull(cursor)
+        self.assertEqual(self.ids(data["tasks"]), [self.task.id])
+        self.assertEqual(len(data["sessions"]), 1)
+
+        self.client.post(f"/tasks/{self.task.id}/pause/")
+        self.client.post(f"/tasks/{self.task.id}/resume/")
+        data = self.pull(data["cursor"])
+        self.assertEqual(data["tasks"][0]["status"], "in_progress")
+        self.assertEqual(data["sessions"][0]["state"], "FOCUS_RUNNING")
+        self.assertIsNotNone(data["pauses"][0]["resumed_at"])
+
+        self.client.post(f"/tasks/{self.task.id}/complete/")
+        data = self.pull(data["cursor"])
+        self.assertEqual(data["tasks"][0]["status"], "completed")
+        self.assertEqual(data["tasks"][0]["completed_pomodoros"], 1)
+        self.assertTrue(data["sessions"][0]["completed"])
+
+    def test_deletes_leave_tombstones(self):
+        doomed = [Task.objects.create(owner=self.user, title=f"Chore {n}") for n in range(3)]
+        cursor = self.pull()["cursor"]
+
+        self.client.delete(f"/tasks/{doomed[0].id}/")
+        self.client.post("/tasks/bulk/", {"operations": [
+            {"op": "delete", "id": doomed[1].id},
+            {"op": "update", "id": doomed[2].id, "data": {"title": "Kept"}},
+            {"op": "create", "data": {"title": "New"}},
+        ]}, format="json")
+
+        data = self.pull(cursor)
+        self.assertEqual(data["deleted"], {"tasks": [doomed[0].id, doomed[1].id]})
+        self.assertEqual(sorted(task["title"] for task in data["tasks"]), ["Kept", "New"])
+
+    def test_ingested_sessions_and_their_tasks(self):
+        cursor = self.pull()["cursor"]
+        started = timezone.now() - timedelta(hours=2)
+        self.client.post("/pomodoro/sessions/bulk/", {"sessions": [{
+            "task_id": self.task.id,
+            "started_at": started.isoformat(),
+            "ended_at": (started + timedelta(minutes=25)).isoformat(),
+            "pauses": [{
+                "paused_at": (started + timedelta(minutes=5)).isoformat(),
+                "resumed_at": (started + timedelta(minutes=6)).isoformat(),
+            }],
+        }]}, format="json")
+
+        data = self.pull(cursor)
+        self.assertEqual(data["tasks"][0]["focus_duration_seconds"], 24 * 60)
+        self.assertEqual(len(data["sessions"]), 1)
+        self.assertEqual(len(data["pauses"]), 1)
+
+    def test_other_users_changes_are_not_visible(self):
+        other = User.objects.create_user(email="other@example.com", password="password123")
+        cursor = self.pull()["cursor"]
+        task = Task.objects.create(owner=other, title="Theirs")
+        task.delete()
+
+        data = self.pull(cursor)
+        self.assertEqual((data["tasks"], data["deleted"]["tasks"]), ([], []))
+
+    def test_invalid_cursor(self):
+        for cursor in ("nope", SyncService.encode_cursor(-1), "eyJ4IjoxfQ=="):
+            response = self.client.get("/sync/", {"cursor": cursor})
+            self.assertEqual(response.status_code, 400)
+
+    def test_pruned_tombstones_force_a_snapshot(self):
+        cursor = self.pull()["cursor"]
+        Task.objects.create(owner=self.user, title="Gone").delete()
+        SyncTombstone.objects.update(deleted_at=timezone.now() - timedelta(days=100))
+
+        self.assertEqual(SyncService.prune(timezone.now() - timedelta(days=90)), 1)
+
+        data = self.pull(cursor)
+        self.assertTrue(data["reset"])
+        self.assertEqual(self.ids(data["tasks"]), [self.task.id])
+        self.assertEqual(self.pull(data["cursor"])["reset"], False)
+
+    def test_write_landing_during_a_pull_comes_with_the_next_one(self):
+        cursor = self.pull()["cursor"]
+        state = {"written": False}
+
+        def write_before_task_query(execute, sql, params, many, context):
+            if not state["written"] and sql.startswith("SELECT") and 'FROM "tasks"' in sql:
+                state["written"] = True
+                # Committed after the pull read the counter, before it reads tasks
+                self.task.title = "Renamed mid-pull"
+                self.task.save()
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(write_before_task_query):
+            racing = self.pull(cursor)
+
+        self.assertTrue(state["written"])
+        self.assertNotIn("Renamed mid-pull", [task["title"] for task in racing["tasks"]])
+        data = self.pull(racing["cursor"])
+        self.assertEqual([task["title"] for task in data["tasks"]], ["Renamed mid-pull"])
+
+
+class TestSyncUnderConcurrentWrites(TransactionTestCase):
+    """
+    Writers create, rename and delete tasks from several threads, holding
+    their transactions open for random lengths of time, while two more run
+    focus sessions through TaskService, one with the sync services and one
+    with the async ones (which stamp rows outside a transaction). A client
+    keeps pulling deltas meanwhile; its copy of tasks, sessions and pauses,
+    built only from deltas, must end up equal to the database.
+    """
+
+    WRITERS = 4
+    WRITES = 25
+    SESSIONS = 8
+
+    def setUp(self):
+        if connection.vendor == "sqlite" and connection.is_in_memory_db():
+            self.skipTest("needs a test database that separate connections can share")
+        self.user = User.objects.create_user(email="sync@example.com", password="password123")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def write(self, writer, errors):
+        rng = random.Random(writer)
+        mine = {}
+        try:
+            for n in range(self.WRITES):
+                choice = rng.random()
+                # Rows are loaded before the transaction, so each one starts
+                # by taking a change number (a write) even on SQLite
+                if mine and choice < 0.2:
+                    task = mine.pop(rng.choice(sorted(mine)))
+                    with transaction.atomic():
+                        task.delete()
+                        time.sleep(rng.random() / 200)
+                elif mine and choice < 0.5:
+                    task = mine[rng.choice(sorted(mine))]
+                    task.title = f"w{writer} rename {n}"
+                    with transaction.atomic():
+                        task.save()
+                        time.sleep(rng.random() / 200)
+                else:
+                    with transaction.atomic():
+                        task = Task.objects.create(owner=self.user, title=f"w{writer} task {n}")
+                        time.sleep(rng.random() / 200)
+                    mine[task.pk] = task
+        except Exception as e:
+            errors.append(e)
+        finally:
+            connection.close()
+
+    def run_sessions(self, errors):
+        """Start, pause, resume and complete focus sessions with the sync services."""
+        try:
+            for n in range(self.SESSIONS):
+                task = Task.objects.create(owner=self.user, title=f"sync focus {n}")
+                # The async writer may hold the user's one active session
+                for step in (
+                    lambda: TaskService.start_task(task, self.user, 25),
+                    lambda: TaskService.pause_task(task, self.user),
+                    lambda: TaskService.resume_task(task, self.user),
+                    lambda: TaskService.complete_task(task, self.user),
+                ):
+                    try:
+                        step()
+                    except TransitionConflict:
+                        pass
+        except Exception as e:
+            errors.append(e)
+        finally:
+            connection.close()
+
+    async def arun_sessions(self, errors):
+        """run_sessions() with the async services."""
+        try:
+            for n in range(self.SESSIONS):
+                task = await Task.objects.acreate(owner=self.user, title=f"async focus {n}")
+                for step in (
+                    lambda: TaskService.astart_task(task, self.user, 25),
+                    lambda: TaskService.apause_task(task, self.user),
+                    lambda: TaskService.aresume_task(task, self.user),
+                    lambda: TaskService.acomplete_task(task, self.user),
+                ):
+                    try:
+                        await step()
+                    except TransitionConflict:
+                        pass
+        except Exception as e:
+            errors.append(e)
+        finally:
+            await sync_to_async(lambda: connection.close())()
+
+    def test_no_change_is_missed(self):
+        mirror = {"tasks": {}, "sessions": {}, "pauses": {}}
+        cursor = None
+
+        def apply(data):
+            if data["reset"]:
+                for rows in mirror.values():
+                    rows.clear()
+            for task in data["tasks"]:
+                mirror["tasks"][task["id"]] = task["title"]
+            for session in data["sessions"]:
+                mirror["sessions"][session["id"]] = (
+                    session["task"], session["state"], session["completed"], session["paused_duration_seconds"],
+                )
+            for pause in data["pauses"]:
+                mirror["pauses"][pause["id"]] = (pause["session"], pause["resumed_at"] is not None)
+            for task_id in data["deleted"]["tasks"]:
+                mirror["tasks"].pop(task_id, None)
+            return data["cursor"]
+
+        errors = []
+        writers = [threading.Thread(target=self.write, args=(writer, errors)) for writer in range(self.WRITERS)]
+        writers.append(threading.Thread(target=self.run_sessions, args=(errors,)))
+        writers.append(threading.Thread(target=lambda: asyncio.run(self.arun_sessions(errors))))
+        for thread in writers:
+            thread.start()
+        while any(thread.is_alive() for thread in writers):
+            cursor = apply(pull(self.client, cursor))
+        for thread in writers:
+            thread.join()
+        cursor = apply(pull(self.client, cursor))
+
+        self.assertEqual(errors, [])
+        self.assertEqual(mirror["tasks"], dict(Task.objects.filter(owner=self.user).values_list("id", "title")))
+
+        sessions = PomodoroSession.objects.filter(user=self.user)
+        self.assertGreater(sessions.count(), 0)
+        self.assertEqual(mirror["sessions"], {
+            session_id: tuple(rest) for session_id, *rest in sessions.values_list(
+                "id", "task_id", "state", "completed", "paused_duration_seconds",
+            )
+        })
+        self.assertEqual(mirror["pauses"], {
+            pause.id: (pause.session_id, pause.resumed_at is not None)
+            for pause in PomodoroPause.objects.filter(session__user=self.user)
+        })
+        self.assertGreater(len(mirror["pauses"]), 0)
@@ -0,0 +1,6 @@
+from django.urls import path
+from apps.sync import views
+
+urlpatterns = [
+    path('', views.SyncView.as_view(), name='sync'),
+]
@@ -0,0 +1,34 @@
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.tasks.serializers import TaskSerializer
+from apps.sync.serializers import SyncSessionSerializer, SyncPauseSerializer
+from apps.sync.services import SyncService, InvalidCursor
+
+
+class SyncView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """
+        Tasks, sessions and pauses changed since `cursor`, and the ids of
+        deleted tasks (their sessions and pauses are gone with them). Without
+        a cursor, or with `reset: true`, the response is a full snapshot.
+        Pass the returned `cursor` on the next call.
+        """
+        try:
+            since = SyncService.decode_cursor(request.query_params.get("cursor"))
+        except InvalidCursor as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        changes = SyncService.pull(request.user, since)
+        return Response({
+            "cursor": SyncService.encode_cursor(changes["seq"]),
+            "reset": changes["reset"] or since is None,
+            "tasks": TaskSerializer(changes["tasks"], many=True).data,
+            "sessions": SyncSessionSerializer(changes["sessions"], many=True).data,
+            "pauses": SyncPauseSerializer(changes["pauses"], many=True).data,
+            "deleted": {"tasks": changes["deleted_tasks"]},
+        })
@@ -0,0 +1,89 @@
+from django.shortcuts import aget_object_or_404
+from django.utils import timezone
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+
+from apps.tasks.models import Task
+from apps.tasks.serializers import TaskStatusSerializer
+from apps.tasks.services import TaskService
+
+from apps.pomodoro.async_views import AsyncAPIView
+from apps.pomodoro.serializers import PomodoroSessionSerializer
+from apps.pomodoro.fsm import TransitionConflict
+from apps.pomodoro.utils import transition_conflict_response
+
+
+class AsyncStartTaskAPIView(AsyncAPIView):
+    permission_classes = [IsAuthenticated]
+
+    async def post(self, request, pk):
+        task = await aget_object_or_404(Task, pk=pk, owner=request.user)
+        duration_minutes = request.user.get_focus_duration_minutes()
+
+        task, session = await TaskService.astart_task(
+            task,
+            request.user,
+            duration_minutes=duration_minutes,
+        )
+
+        return Response({
+            "task": TaskStatusSerializer(task).data,
+            "pomodoro_session": PomodoroSessionSerializer(session).data
+        },
+        status=status.HTTP_201_CREATED)
+
+
+class AsyncPauseTaskAPIView(AsyncAPIView):
+    permission_classes = [IsAuthenticated]
+
+    async def post(self, request, pk):
+        task = await aget_object_or_404(Task, pk=pk, owner=request.user)
+        try:
+            task, session = await TaskService.apause_task(task, request.user)
+        except TransitionConflict as e:
+            return transition_conflict_response(e)
+
+        return Response({
+            "id": task.id,
+            "status": task.status,
+            "paused_at": session.paused_at,
+            "active_session": {
+                "id": session.id,
+                "paused_duration": session.elapsed_seconds
+            }
+        })
+
+
+class AsyncResumeTaskAPIView(AsyncAPIView):
+    permission_classes = [IsAuthenticated]
+
+    async def post(self, request, pk):
+        task = await aget_object_or_404(Task, pk=pk, owner=request.user)
+        try:
+            task, session = await TaskService.aresume_task(task, request.user)
+        except TransitionConflict as e:
+            return transition_conflict_response(e)
+
+        return Response({
+            "id": task.id,
+            "status": task.status,
+            "resumed_at": timezone.now(),
+            "active_session": {
+                "id": session.id,
+                "remaining_seconds": session.remaining_seconds
+            }
+        })
+
+
+class AsyncCompleteTaskAPIView(AsyncAPIView):
+    permission_classes = [IsAuthenticated]
+
+    async def post(self, request, pk):
+        task = await aget_object_or_404(Task, pk=pk, owner=request.user)
+        try:
+            task = await TaskService.acomplete_task(task, request.user)
+        except TransitionConflict as e:
+            return transition_conflict_response(e)
+
+        return Response(TaskStatusSerializer(task).data)
@@ -0,0 +1,183 @@
+from django.db import transaction
+from django.utils import timezone
+
+from apps.tasks.models import Task
+from apps.tasks.serializers import TaskSerializer
+
+from apps.pomodoro.models import PomodoroSession
+from apps.sync.sequence import ChangeSequence
+from apps.analytics.cache import analytics_cache
+from apps.analytics.services import DailyStatsService
+
+
+class TaskBulkError(Exception):
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__(f"{len(errors)} invalid operations")
+
+    @property
+    def conflict(self):
+        return all(error["code"] == TaskBulkService.ACTIVE_POMODORO for error in self.errors)
+
+
+class TaskBulkService:
+    """
+    Applies a batch of task operations in one transaction:
+
+        {"op": "create", "data": {"title": "...", "priority": "high"}}
+        {"op": "update", "id": 4, "data": {"category": "work"}}
+        {"op": "delete", "id": 5}
+
+    `data` is validated by TaskSerializer (partially for updates), without
+    queries. Ownership and active pomodoros are then checked with one query
+    each for the whole batch: deleting a task, or changing its status, while
+    one of its sessions is running or paused is a conflict. A batch is all
+    or nothing; rows are written with bulk_create, bulk_update and one
+    filtered delete.
+    """
+
+    MAX_OPERATIONS = 500
+
+    OPS = ("create", "update", "delete")
+
+    INVALID = "INVALID"
+    NOT_FOUND = "NOT_FOUND"
+    ACTIVE_POMODORO = "ACTIVE_POMODORO"
+
+    @staticmethod
+    @transaction.atomic
+    def apply(user, operations):
+        """Validate and apply `operations`; returns one result per operation."""
+        if not isinstance(operations, list) or not operations:
+            raise TaskBulkError([TaskBulkService._error(None, TaskBulkService.INVALID, "operations must be a non-empty list")])
+        if len(operations) > TaskBulkService.MAX_OPERATIONS:
+            raise TaskBulkError([TaskBulkService._error(
+                None, TaskBulkService.INVALID,
+                f"At most {TaskBulkService.MAX_OPERATIONS} operations per request",
+            )])
+
+        errors = []
+        parsed = []
+        seen_ids = set()
+        for index, operation in enumerate(operations):
+            try:
+                item = TaskBulkService._parse(index, operation)
+            except ValueError as e:
+                errors.append(TaskBulkService._error(index, TaskBulkService.INVALID, *e.args))
+                continue
+            if item["id"] is not None:
+                if item["id"] in seen_ids:
+                    errors.append(TaskBulkService._error(index, TaskBulkService.INVALID, "Task appears in more than one operation"))
+                    continue
+                seen_ids.add(item["id"])
+            parsed.append(item)
+        if errors:
+            raise TaskBulkError(errors)
+
+        tasks = TaskBulkService._check_targets(user, parsed, errors)
+        if errors:
+            raise TaskBulkError(sorted(errors, key=lambda error: error["index"]))
+
+        return TaskBulkService._write(user, parsed, tasks)
+
+    @staticmethod
+    def _parse(index, operation):
+        if not isinstance(operation, dict):
+            raise ValueError("Each operation must be an object")
+
+        op = operation.get("op")
+        if op not in TaskBulkService.OPS:
+            raise ValueError(f"op must be one of {', '.join(TaskBulkService.OPS)}")
+
+        task_id = operation.get("id")
+        if op == "create":
+            task_id = None
+        elif isinstance(task_id, bool) or not isinstance(task_id, int):
+            raise ValueError("id must be an integer")
+
+        data = {}
+        if op != "delete":
+            serializer = TaskSerializer(data=operation.get("data"), partial=op == "update")
+            if not serializer.is_valid():
+                raise ValueError("Invalid data", serializer.errors)
+            data = serializer.validated_data
+
+        return {"index": index, "op": op, "id": task_id, "data": data}
+
+    @staticmethod
+    def _check_targets(user, parsed, errors):
+        """The user's tasks targeted by updates and deletes, by id."""
+        ids = [item["id"] for item in parsed if item["id"] is not None]
+        tasks = Task.objects.filter(owner=user).in_bulk(ids)
+        active = set(
+            PomodoroSession.objects.filter(task_id__in=list(tasks), completed=False)
+            .values_list("task_id", flat=True)
+        )
+
+        for item in parsed:
+            if item["id"] is None:
+                continue
+            task = tasks.get(item["id"])
+            if task is None:
+                errors.append(TaskBulkService._error(item["index"], TaskBulkService.NOT_FOUND, "Task not found"))
+            elif task.pk in active and (
+                item["op"] == "delete"
+                or item["data"].get("status", task.status) != task.status
+            ):
+                errors.append(TaskBulkService._error(
+                    item["index"], TaskBulkService.ACTIVE_POMODORO,
+                    "Task has an active pomodoro; stop it before deleting the task or changing its status",
+                ))
+        return tasks
+
+    @staticmethod
+    def _write(user, parsed, tasks):
+        now = timezone.now()
+        seq = ChangeSequence.next(user.pk)
+        created = []
+        updated = []
+        fields = set()
+        deleted = []
+        for item in parsed:
+            if item["op"] == "create":
+                created.append(Task(owner=user, sync_seq=seq, **item["data"]))
+            elif item["op"] == "update":
+                task = tasks[item["id"]]
+                for field, value in item["data"].items():
+                    setattr(task, field, value)
+                task.updated_at = now
+                task.sync_seq = seq
+                fields.update(item["data"])
+                updated.append(task)
+            else:
+                deleted.append(tasks[item["id"]])
+
+        Task.objects.bulk_create(created)
+        if updated:
+            Task.objects.bulk_update(updated, sorted(fields | {"updated_at", "sync_seq"}))
+        if deleted:
+            ChangeSequence.tombstone(user.pk, "task", [task.pk for task in deleted], seq=seq)
+            Task.objects.filter(pk__in=[task.pk for task in deleted]).delete()
+
+        DailyStatsService.record_tasks_created(user, created)
+        if updated or deleted:
+            # Updates and deletes move the task counts of the days the tasks were created
+            analytics_cache.touch(user, *(task.created_at for task in updated + deleted))
+
+        new_tasks = iter(created)
+        results = []
+        for item in parsed:
+            if item["op"] == "create":
+                results.append({"index": item["index"], "op": "create", "task": next(new_tasks)})
+            elif item["op"] == "update":
+                results.append({"index": item["index"], "op": "update", "task": tasks[item["id"]]})
+            else:
+                results.append({"index": item["index"], "op": "delete", "id": item["id"]})
+        return results
+
+    @staticmethod
+    def _error(index, code, message, fields=None):
+        error = {"index": index, "code": code, "message": message}
+        if fields:
+            error["fields"] = fields
+        return error
@@ -0,0 +1,114 @@
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F, Sum
+
+from apps.tasks.models import Task
+from apps.pomodoro.models import PomodoroSession
+from apps.sync.sequence import ChangeSequence
+
+
+class TaskCounters:
+    """
+    Denormalized per-task counters of completed focus sessions:
+    `total_focus_seconds` and `completed_pomodoros`.
+
+    Every completion path (manual, websocket, expiry, bulk ingest) adds to
+    them with an atomic F() update, so task lists, completion responses and
+    break selection read the row instead of aggregating sessions.
+    `reconcile_task_counters` verifies and repairs them.
+    """
+
+    @staticmethod
+    def record_session(session):
+        """Add a just-completed focus session to its task's counters."""
+        changes = TaskCounters._increments(session)
+        if changes is None:
+            return
+        ChangeSequence.update(Task.objects.filter(pk=session.task_id), session.user_id, **changes)
+        TaskCounters._apply_in_memory(session)
+
+    @staticmethod
+    async def arecord_session(session):
+        changes = TaskCounters._increments(session)
+        if changes is None:
+            return
+        await ChangeSequence.aupdate(Task.objects.filter(pk=session.task_id), session.user_id, **changes)
+        TaskCounters._apply_in_memory(session)
+
+    @staticmethod
+    @transaction.atomic
+    def record_many(sessions):
+        """Add many completed sessions, one UPDATE per task."""
+        totals = defaultdict(lambda: [0, 0])
+        for session in sessions:
+            if session.task_id and not session.is_break:
+                totals[session.user_id, session.task_id][0] += session.actual_duration_seconds or 0
+                totals[session.user_id, session.task_id][1] += 1
+
+        seqs = {}
+        for (user_id, task_id), (seconds, count) in totals.items():
+            if user_id not in seqs:
+                seqs[user_id] = ChangeSequence.next(user_id)
+            Task.objects.filter(pk=task_id).update(
+                total_focus_seconds=F("total_focus_seconds") + seconds,
+                completed_pomodoros=F("completed_pomodoros") + count,
+                sync_seq=seqs[user_id],
+            )
+
+    @staticmethod
+    def actual(tasks):
+        """{task_id: (focus seconds, pomodoros)} computed from sessions, in one grouped query."""
+        return {
+            row["task_id"]: (row["seconds"] or 0, row["count"])
+            for row in PomodoroSession.objects.filter(
+                task__in=tasks, completed=True, is_break=False
+            )
+            .values("task_id")
+            .annotate(seconds=Sum("actual_duration_seconds"), count=Count("id"))
+            .order_by()
+        }
+
+    @staticmethod
+    def reconcile(tasks, fix=True):
+        """
+        Compare the counters of `tasks` (a queryset) with their sessions.
+        Returns the drifted tasks, corrected in the database when `fix`.
+        """
+        actual = TaskCounters.actual(tasks)
+        drifted = []
+        for task in tasks.only("id", "owner", "title", "total_focus_seconds", "completed_pomodoros").iterator():
+            seconds, count = actual.get(task.id, (0, 0))
+            if (task.total_focus_seconds, task.completed_pomodoros) != (seconds, count):
+                task.stored = (task.total_focus_seconds, task.completed_pomodoros)
+                task.total_focus_seconds, task.completed_pomodoros = seconds, count
+                drifted.append(task)
+
+        if fix and drifted:
+            with transaction.atomic():
+                seqs = {}
+                for task in drifted:
+                    if task.owner_id not in seqs:
+                        seqs[task.owner_id] = ChangeSequence.next(task.owner_id)
+                    task.sync_seq = seqs[task.owner_id]
+                Task.objects.bulk_update(
+                    drifted, ["total_focus_seconds", "completed_pomodoros", "sync_seq"], batch_size=500
+                )
+        return drifted
+
+    @staticmethod
+    def _increments(session):
+        if session.is_break or not session.task_id or not session.completed:
+            return None
+        return {
+            "total_focus_seconds": F("total_focus_seconds") + (session.actual_duration_seconds or 0),
+            "completed_pomodoros": F("completed_pomodoros") + 1,
+        }
+
+    @staticmethod
+    def _apply_in_memory(session):
+        # Keep an already loaded task in step so callers (break selection,
+        # completion responses) can read it without another query
+        if PomodoroSession.task.is_cached(session) and session.task is not None:
+            session.task.total_focus_seconds += session.actual_duration_seconds or 0
+            session.task.completed_pomodoros += 1
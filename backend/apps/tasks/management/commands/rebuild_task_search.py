@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from apps.tasks.search import TaskSearch
+
+
+class Command(BaseCommand):
+    help = "Recreate the task full-text index and its sync triggers, then refill it from the tasks table."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS, help="Database alias")
+
+    def handle(self, *args, **options):
+        connection = connections[options["database"]]
+        if not TaskSearch.install(connection):
+            raise CommandError(
+                f"Full-text search is not available on this {connection.vendor} database; "
+                "search falls back to icontains"
+            )
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt task search index ({TaskSearch.backend(connection.alias)})"))
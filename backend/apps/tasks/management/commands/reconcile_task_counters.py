@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.accounts.models import User
+from apps.tasks.counters import TaskCounters
+from apps.tasks.models import Task
+
+
+class Command(BaseCommand):
+    help = "Verify Task.total_focus_seconds/completed_pomodoros against completed sessions and repair drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", action="append", help="User id or email (repeatable); default all users")
+        parser.add_argument("--check", action="store_true", help="Only report drift; exit with an error if any is found")
+
+    def handle(self, *args, **options):
+        users = User.objects.order_by("id")
+        if options["user"]:
+            ids = [value for value in options["user"] if value.isdigit()]
+            emails = [value for value in options["user"] if not value.isdigit()]
+            users = users.filter(id__in=ids) | users.filter(email__in=emails)
+            if not users.exists():
+                raise CommandError("No matching users")
+
+        fix = not options["check"]
+        drifted = 0
+        for user in users.iterator():
+            for task in TaskCounters.reconcile(Task.objects.filter(owner=user), fix=fix):
+                drifted += 1
+                seconds, count = task.stored
+                self.stdout.write(
+                    f"{user.email} task {task.id}: {seconds}s/{count} pomodoro(s) stored, "
+                    f"{task.total_focus_seconds}s/{task.completed_pomodoros} from sessions"
+                )
+
+        if not fix and drifted:
+            raise CommandError(f"{drifted} task(s) have drifted counters")
+        verb = "Repaired" if fix else "Found"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {drifted} drifted task(s)"))
@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-18 20:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0003_alter_task_options'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['owner', 'created_at', 'id'], name='tasks_owner_i_ffafae_idx'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 6.0 on 2026-10-18 21:05
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_task_counters(apps, schema_editor):
+    Task = apps.get_model("tasks", "Task")
+    PomodoroSession = apps.get_model("pomodoro", "PomodoroSession")
+
+    totals = {
+        row["task_id"]: row
+        for row in PomodoroSession.objects.filter(
+            task__isnull=False, completed=True, is_break=False
+        )
+        .values("task_id")
+        .annotate(seconds=Sum("actual_duration_seconds"), count=Count("id"))
+        .order_by()
+    }
+
+    tasks = []
+    for task in Task.objects.filter(pk__in=list(totals)).iterator():
+        task.total_focus_seconds = totals[task.pk]["seconds"] or 0
+        task.completed_pomodoros = totals[task.pk]["count"]
+        tasks.append(task)
+
+    Task.objects.bulk_update(
+        tasks,
+        ["total_focus_seconds", "completed_pomodoros"],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0004_task_tasks_owner_i_ffafae_idx'),
+        ('pomodoro', '0011_pomodorosession_pomodoro_po_task_id_206024_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='completed_pomodoros',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_task_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 6.0 on 2026-10-18 22:40
+
+from django.db import migrations
+
+
+def install_task_search(apps, schema_editor):
+    from apps.tasks.search import TaskSearch
+
+    TaskSearch.install(schema_editor.connection)
+
+
+def uninstall_task_search(apps, schema_editor):
+    from apps.tasks.search import TaskSearch
+
+    TaskSearch.uninstall(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0005_task_completed_pomodoros'),
+    ]
+
+    operations = [
+        migrations.RunPython(install_task_search, uninstall_task_search),
+    ]
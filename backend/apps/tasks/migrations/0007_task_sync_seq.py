@@ -0,0 +1,33 @@
+# Generated by Django 6.0 on 2026-10-18 23:15
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def reinstall_task_search(apps, schema_editor):
+    # Adding the column rebuilds the tasks table on SQLite, dropping the
+    # full-text triggers
+    from apps.tasks.search import TaskSearch
+
+    TaskSearch.install(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0006_task_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='sync_seq',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['owner', 'sync_seq'], name='tasks_owner_i_12d45b_idx'),
+        ),
+        migrations.RunPython(reinstall_task_search, migrations.RunPython.noop),
+    ]
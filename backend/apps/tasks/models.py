@@ -1,7 +1,9 @@
-from django.db import models
+from django.db import models, transaction
 from apps.accounts.models import User
 
 from apps.accounts.managers import UserTimezoneManager
+from apps.analytics.cache import analytics_cache
+from apps.sync.sequence import ChangeSequence
 
 # Create your models here.
 class Task(models.Model):
@@ -45,7 +47,11 @@ class Task(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     started_at = models.DateTimeField(null=True, blank=True)
     ended_at = models.DateTimeField(null=True, blank=True)
+    # Completed focus sessions, maintained by TaskCounters
     total_focus_seconds = models.IntegerField(default=0)
+    completed_pomodoros = models.PositiveIntegerField(default=0)
+    # Owner's change number of the last write, for /sync/
+    sync_seq = models.BigIntegerField(default=0)
     
     objects = UserTimezoneManager()
     
@@ -54,9 +60,29 @@ class Task(models.Model):
         ordering = ['created_at']
         indexes = [
             models.Index(fields=['owner', 'status']),
+            # Keyset pagination of a user's task list
+            models.Index(fields=['owner', 'created_at', 'id']),
+            models.Index(fields=['owner', 'sync_seq']),
             # models.Index(fields=['organization', 'started_at']),
         ]
         ordering = ['created_at']
 
     def __str__(self):
         return self.title
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic(savepoint=False):
+            self.sync_seq = ChangeSequence.next(self.owner_id)
+            if kwargs.get('update_fields') is not None:
+                kwargs['update_fields'] = {*kwargs['update_fields'], 'sync_seq'}
+            super().save(*args, **kwargs)
+        # Status changes move the task counts of the day it was created
+        analytics_cache.touch(self.owner, self.created_at)
+
+    def delete(self, *args, **kwargs):
+        owner, created_at = self.owner, self.created_at
+        with transaction.atomic(savepoint=False):
+            ChangeSequence.tombstone(self.owner_id, 'task', [self.pk])
+            result = super().delete(*args, **kwargs)
+        analytics_cache.touch(owner, created_at)
+        return result
@@ -0,0 +1,182 @@
+import re
+
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections, transaction
+from django.db.models import Q
+
+from apps.tasks.models import Task
+
+
+class TaskSearch:
+    """
+    Full-text search over task titles and descriptions.
+
+    The index lives in the database and is maintained there, so every
+    write path (save, bulk_create, queryset.update, cascades) keeps it in
+    sync without application hooks:
+
+    - SQLite: an external-content FTS5 table `tasks_fts`, fed by insert,
+      update and delete triggers on `tasks`;
+    - PostgreSQL: a stored generated `search_vector` tsvector column on
+      `tasks` with a GIN index.
+
+    Every query word is a prefix match and all words must match. Results
+    are ranked with title hits above description hits (bm25 / ts_rank_cd).
+    Without FTS5 or on another backend, search falls back to icontains.
+
+    On SQLite, migrations that make Django rebuild the `tasks` table drop
+    its triggers; such migrations should call `install` again, and
+    `rebuild_task_search` repairs an existing database.
+    """
+
+    FTS5 = "fts5"
+    POSTGRES = "postgres"
+    BASIC = "basic"
+
+    MAX_TERMS = 16
+
+    # bm25 column weights: title, description
+    SQLITE_WEIGHTS = (10.0, 1.0)
+
+    _backends = {}
+
+    SQLITE_INSTALL = (
+        "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5("
+        "title, description, content='tasks', content_rowid='id', "
+        "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+        "CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN "
+        "INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description); "
+        "END",
+        "CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN "
+        "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+        "VALUES ('delete', old.id, old.title, old.description); "
+        "END",
+        "CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN "
+        "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+        "VALUES ('delete', old.id, old.title, old.description); "
+        "INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description); "
+        "END",
+        "INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')",
+    )
+    SQLITE_UNINSTALL = (
+        "DROP TRIGGER IF EXISTS tasks_fts_insert",
+        "DROP TRIGGER IF EXISTS tasks_fts_delete",
+        "DROP TRIGGER IF EXISTS tasks_fts_update",
+        "DROP TABLE IF EXISTS tasks_fts",
+    )
+
+    POSTGRES_INSTALL = (
+        "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('simple', coalesce(description, '')), 'B')) STORED",
+        "CREATE INDEX IF NOT EXISTS tasks_search_vector_gin ON tasks USING GIN (search_vector)",
+    )
+    POSTGRES_UNINSTALL = (
+        "DROP INDEX IF EXISTS tasks_search_vector_gin",
+        "ALTER TABLE tasks DROP COLUMN IF EXISTS search_vector",
+    )
+
+    @staticmethod
+    def install(connection):
+        """Create (or recreate) the index for `connection` and fill it."""
+        if connection.vendor == "sqlite":
+            statements = TaskSearch.SQLITE_UNINSTALL + TaskSearch.SQLITE_INSTALL
+        elif connection.vendor == "postgresql":
+            statements = TaskSearch.POSTGRES_INSTALL
+        else:
+            return False
+
+        try:
+            with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+                for statement in statements:
+                    cursor.execute(statement)
+        except OperationalError:
+            # SQLite built without FTS5
+            return False
+        finally:
+            TaskSearch._backends.pop(connection.alias, None)
+        return True
+
+    @staticmethod
+    def uninstall(connection):
+        if connection.vendor == "sqlite":
+            statements = TaskSearch.SQLITE_UNINSTALL
+        elif connection.vendor == "postgresql":
+            statements = TaskSearch.POSTGRES_UNINSTALL
+        else:
+            return
+        with connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+        TaskSearch._backends.pop(connection.alias, None)
+
+    @staticmethod
+    def backend(using=DEFAULT_DB_ALIAS):
+        """FTS5, POSTGRES or BASIC, depending on what the database has installed."""
+        if using not in TaskSearch._backends:
+            connection = connections[using]
+            with connection.cursor() as cursor:
+                if connection.vendor == "sqlite":
+                    cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'tasks_fts'")
+                    found = cursor.fetchone() is not None
+                    backend = TaskSearch.FTS5 if found else TaskSearch.BASIC
+                elif connection.vendor == "postgresql":
+                    cursor.execute(
+                        "SELECT 1 FROM information_schema.columns "
+                        "WHERE table_name = 'tasks' AND column_name = 'search_vector'"
+                    )
+                    found = cursor.fetchone() is not None
+                    backend = TaskSearch.POSTGRES if found else TaskSearch.BASIC
+                else:
+                    backend = TaskSearch.BASIC
+            TaskSearch._backends[using] = backend
+        return TaskSearch._backends[using]
+
+    @staticmethod
+    def terms(query):
+        """Lowercased words of `query`; punctuation and operators are dropped."""
+        return re.findall(r"[^\W_]+", (query or "").lower())[:TaskSearch.MAX_TERMS]
+
+    @staticmethod
+    def search(user, query, *, status=None, limit=20, offset=0):
+        """The user's tasks matching every word of `query`, best match first."""
+        terms = TaskSearch.terms(query)
+        if not terms:
+            return []
+
+        backend = TaskSearch.backend()
+        if backend == TaskSearch.BASIC:
+            return TaskSearch._basic(user, terms, status, limit, offset)
+
+        status_clause = " AND tasks.status = %s" if status else ""
+        if backend == TaskSearch.FTS5:
+            match = " ".join(f'"{term}"*' for term in terms)
+            weights = ", ".join(str(weight) for weight in TaskSearch.SQLITE_WEIGHTS)
+            sql = (
+                "SELECT tasks.id FROM tasks_fts JOIN tasks ON tasks.id = tasks_fts.rowid "
+                f"WHERE tasks_fts MATCH %s AND tasks.owner_id = %s{status_clause} "
+                f"ORDER BY bm25(tasks_fts, {weights}), tasks.id DESC LIMIT %s OFFSET %s"
+            )
+        else:
+            match = " & ".join(f"{term}:*" for term in terms)
+            sql = (
+                "SELECT tasks.id FROM tasks, to_tsquery('simple', %s) query "
+                f"WHERE tasks.search_vector @@ query AND tasks.owner_id = %s{status_clause} "
+                "ORDER BY ts_rank_cd(tasks.search_vector, query) DESC, tasks.id DESC LIMIT %s OFFSET %s"
+            )
+        params = [match, user.pk] + ([status] if status else []) + [limit, offset]
+
+        with connections[DEFAULT_DB_ALIAS].cursor() as cursor:
+            cursor.execute(sql, params)
+            ids = [row[0] for row in cursor.fetchall()]
+
+        tasks = Task.objects.in_bulk(ids)
+        return [tasks[pk] for pk in ids if pk in tasks]
+
+    @staticmethod
+    def _basic(user, terms, status, limit, offset):
+        queryset = Task.objects.filter(owner=user)
+        for term in terms:
+            queryset = queryset.filter(Q(title__icontains=term) | Q(description__icontains=term))
+        if status:
+            queryset = queryset.filter(status=status)
+        return list(queryset.order_by("-created_at", "-id")[offset:offset + limit])
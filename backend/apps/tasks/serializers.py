@@ -1,8 +1,10 @@
 from rest_framework import serializers
 from apps.tasks.models import Task
+from apps.analytics.services import DailyStatsService
+from core.readers import ValuesReader
 
 class TaskSerializer(serializers.ModelSerializer):
-    focus_duration_seconds = serializers.IntegerField(read_only=True)
+    focus_duration_seconds = serializers.IntegerField(source='total_focus_seconds', read_only=True)
     class Meta:
         model = Task
         fields = [
@@ -14,20 +16,25 @@ class TaskSerializer(serializers.ModelSerializer):
             'status',
             'owner_id',
             'focus_duration_seconds',
+            'completed_pomodoros',
             'created_at',
             'updated_at',
             'started_at',
             'ended_at',
         ]
-        read_only_fields = ['id', 'owner_id', 'created_at', 'updated_at', 'started_at', 'ended_at']
+        read_only_fields = ['id', 'owner_id', 'completed_pomodoros', 'created_at', 'updated_at', 'started_at', 'ended_at']
         
     def create(self, validated_data):
         user = self.context['request'].user
         validated_data['owner'] = user
         task = Task.objects.create(**validated_data)
         task.save()
+        DailyStatsService.record_task_created(task)
         return task
     
+# List responses of TaskSerializer, built from .values() rows
+task_reader = ValuesReader(TaskSerializer)
+
 class TaskStatusSerializer(serializers.ModelSerializer):
     class Meta:
         model = Task
@@ -35,6 +42,7 @@ class TaskStatusSerializer(serializers.ModelSerializer):
             'id', 'title', 'status',
             'started_at', 'ended_at',
             'total_focus_seconds',
+            'completed_pomodoros',
             'estimated_pomodoros'
         )
         
\ No newline at end of file
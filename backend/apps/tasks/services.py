@@ -1,18 +1,22 @@
+from asgiref.sync import sync_to_async
 from django.utils import timezone
-from django.db import transaction
-from django.db.models import Sum, Count
-from django.core.exceptions import ValidationError
+from django.db import transaction, IntegrityError
 
 from apps.tasks.models import Task
 
-from apps.pomodoro.models import PomodoroSession, PomodoroPause
-from apps.pomodoro.utils import broadcast_task_event, derive_session_state
+from apps.pomodoro.models import PomodoroSession
+from apps.pomodoro.utils import broadcast_task_event, abroadcast_task_event
 from apps.pomodoro.services import PomodoroService
-from apps.pomodoro.fsm import PomodoroFSM
+from apps.pomodoro.fsm import TransitionConflict
+from apps.pomodoro.transitions import SessionTransitions
+from apps.pomodoro.scheduler import expiry_scheduler
+from apps.analytics.services import DailyStatsService, StreakService
+from core.timing import timed_methods
 class ActivePomodoroExists(Exception):
     def __init__(self, session):
         self.session = session
 
+@timed_methods
 class TaskService:
 
     @staticmethod
@@ -28,68 +32,70 @@ class TaskService:
     @transaction.atomic
     def start_task(task, user, duration_minutes):
         session = TaskService.get_active_session(task, user)
-        active_session = (
-            PomodoroSession.objects
-            .select_for_update()
-            .filter(user=user, completed=False, is_break=False)
-            .first()
-        )
+        active_session = PomodoroSession.objects.filter(
+            user=user, completed=False, is_break=False
+        ).first()
         if active_session:
             broadcast_task_event(user.id, active_session)
             return task, active_session
         if session:
             return task, session
-        
-        session = PomodoroSession.objects.create(
-            task=task,
-            user=user,
-            started_at=timezone.now(),
-            duration_minutes=duration_minutes
-        )
+
+        # No row lock: the one_active_pomodoro_per_user constraint decides
+        # which of two concurrent starts wins.
+        try:
+            with transaction.atomic():
+                session = PomodoroSession.objects.create(
+                    task=task,
+                    user=user,
+                    started_at=timezone.now(),
+                    duration_minutes=duration_minutes,
+                )
+        except IntegrityError:
+            active_session = PomodoroSession.objects.get(
+                user=user, completed=False, is_break=False
+            )
+            return task, active_session
 
         task.status = 'in_progress'
         task.started_at = task.started_at or timezone.now()
         task.save(update_fields=['status', 'started_at'])
         
+        expiry_scheduler.schedule(session)
         broadcast_task_event(user.id, session)
         return task, session
 
     @transaction.atomic
     def pause_task(task, user):
         session = TaskService.get_active_session(task, user)
-        state = derive_session_state(session)
-        
-        if not PomodoroFSM.can_transition(state, "PAUSE"):
-            raise ValidationError("Cannot pause in current state")
+        if not session:
+            raise TransitionConflict("PAUSE", None, "IDLE")
 
-        PomodoroPause.objects.create(
-            session=session,
-            paused_at=timezone.now()
-        )
+        # Pausing an already paused session is a no-op
+        if not SessionTransitions.apply(session, "PAUSE", idempotent=True):
+            return task, session
 
         task.status = "paused"
         task.save(update_fields=["status"])
         
+        expiry_scheduler.schedule(session)
         broadcast_task_event(user.id, session)
         return task, session
     
     @transaction.atomic
     def resume_task(task, user):
         session = TaskService.get_active_session(task, user)
-        state = derive_session_state(session)
-        if not PomodoroFSM.can_transition(state, "RESUME"):
-            raise ValidationError("Cannot resume")
+        if not session:
+            raise TransitionConflict("RESUME", None, "IDLE")
 
-        pause = session.pauses.filter(resumed_at__isnull=True).last()
-        if not pause:
+        # Resuming a running session is a no-op
+        if not SessionTransitions.apply(session, "RESUME", idempotent=True):
             return task, session
 
-        pause.resumed_at = timezone.now()
-        pause.save(update_fields=["resumed_at"])
-
         task.status = "in_progress"
         task.save(update_fields=["status"])
         
+        expiry_scheduler.schedule(session)
         broadcast_task_event(user.id, session)
 
         return task, session
@@ -98,24 +104,108 @@ class TaskService:
     def complete_task(task, user):
         session = TaskService.get_active_session(task, user)
         now = timezone.now()
-        state = derive_session_state(session)
-        if not PomodoroFSM.can_transition(state, "COMPLETE"):
-            raise ValidationError("Cannot complete")
+        if not session:
+            # A repeated complete (e.g. double click) returns the finished task
+            if task.status == "completed":
+                return task
+            raise TransitionConflict("COMPLETE", None, "IDLE")
 
-        PomodoroService.complete_session(session, manual=True)
-
-        totals = PomodoroSession.objects.filter(
-            task=task,
-            completed=True,
-            is_break=False
-        ).aggregate(total=Sum("actual_duration_seconds"))
+        # Counters land on this instance (see TaskCounters)
+        session.task = task
+        PomodoroService.complete_session(session, manual=True, ended_at=now)
 
         task.status = "completed"
         task.ended_at = now
-        task.total_focus_seconds = totals["total"] or 0
-        task.save(update_fields=["status", "ended_at", "total_focus_seconds"])
+        task.save(update_fields=["status", "ended_at"])
+        DailyStatsService.record_task_completed(task)
+        StreakService.record_completion(user, now)
 
         # Broadcast with manual completion
         broadcast_task_event(user.id, session, manual_completion=True)
 
         return task
+
+    # Async counterparts used by the ASGI views in apps/tasks/async_views.py
+
+    @staticmethod
+    async def aget_active_session(task, user):
+        return await PomodoroSession.objects.filter(
+            task=task,
+            user=user,
+            completed=False,
+        ).afirst()
+
+    @staticmethod
+    async def astart_task(task, user, duration_minutes):
+        session = await TaskService.aget_active_session(task, user)
+        active_session = await PomodoroSession.objects.filter(
+            user=user, completed=False, is_break=False
+        ).afirst()
+        if active_session:
+            await abroadcast_task_event(user.id, active_session)
+            return task, active_session
+        if session:
+            return task, session
+
+        try:
+            session = await PomodoroService.astart_focus(task, user, duration_minutes)
+        except IntegrityError:
+            active_session = await PomodoroSession.objects.aget(
+                user=user, completed=False, is_break=False
+            )
+            return task, active_session
+
+        await abroadcast_task_event(user.id, session)
+        return task, session
+
+    @staticmethod
+    async def apause_task(task, user):
+        session = await TaskService.aget_active_session(task, user)
+        if not session:
+            raise TransitionConflict("PAUSE", None, "IDLE")
+
+        if not await PomodoroService.apause(session):
+            return task, session
+
+        task.status = "paused"
+        await task.asave(update_fields=["status"])
+
+        await abroadcast_task_event(user.id, session)
+        return task, session
+
+    @staticmethod
+    async def aresume_task(task, user):
+        session = await TaskService.aget_active_session(task, user)
+        if not session:
+            raise TransitionConflict("RESUME", None, "IDLE")
+
+        if not await PomodoroService.aresume(session):
+            return task, session
+
+        task.status = "in_progress"
+        await task.asave(update_fields=["status"])
+
+        await abroadcast_task_event(user.id, session)
+        return task, session
+
+    @staticmethod
+    async def acomplete_task(task, user):
+        session = await TaskService.aget_active_session(task, user)
+        now = timezone.now()
+        if not session:
+            if task.status == "completed":
+                return task
+            raise TransitionConflict("COMPLETE", None, "IDLE")
+
+        session.task = task
+        await PomodoroService.acomplete_session(session, manual=True, ended_at=now)
+
+        task.status = "completed"
+        task.ended_at = now
+        await task.asave(update_fields=["status", "ended_at"])
+        await sync_to_async(DailyStatsService.record_task_completed)(task)
+        await sync_to_async(StreakService.record_completion)(user, now)
+
+        await abroadcast_task_event(user.id, session, manual_completion=True)
+
+        return task
@@ -0,0 +1,95 @@
+"""
+JSON encoding benchmark: DRF's JSONRenderer against FastJSONRenderer.
+
+Not collected by the default test run; invoke explicitly:
+
+    python manage.py test apps.tasks.tests.bench_json
+
+Encodes already-serialized response bodies, so only the renderer is
+timed: task list pages of 8 and 100 tasks, a 1,000-task list, and the
+analytics range summary, heatmap and dashboard of a user with a year of
+history. FastJSONRenderer is timed with orjson and with its standard
+library fallback; all three must produce the same bytes.
+"""
+import statistics
+import time
+from datetime import date, datetime, timedelta
+from unittest import mock
+
+import pytz
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+
+from apps.analytics.services import AnalyticsService, DailyStatsService, HeatmapService
+from apps.tasks.models import Task
+from apps.tasks.serializers import TaskSerializer
+from core import fastjson
+from core.renderers import FastJSONRenderer
+
+User = get_user_model()
+
+END = date(2026, 3, 31)
+TASKS = 3000
+RUNS = 50
+
+
+class JSONRenderingBenchmark(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="json@example.com", password="password123")
+        Task.objects.bulk_create([
+            Task(
+                title=f"Task {n} – café",
+                description="Write the outline, then the first draft. " * 3,
+                owner=cls.user,
+                status="completed",
+                total_focus_seconds=1500 * (n % 4),
+                completed_pomodoros=n % 4,
+                ended_at=datetime.combine(
+                    END - timedelta(days=n % 365), datetime.min.time()
+                ).replace(hour=12, tzinfo=pytz.UTC),
+            )
+            for n in range(TASKS)
+        ])
+        DailyStatsService.rebuild(cls.user)
+        HeatmapService.rebuild(cls.user)
+
+    def bodies(self):
+        tasks = list(Task.objects.filter(owner=self.user).order_by("-created_at", "-id")[:1000])
+        return {
+            "tasks, 8": {"next": None, "previous": None, "results": TaskSerializer(tasks[:8], many=True).data},
+            "tasks, 100": {"next": None, "previous": None, "results": TaskSerializer(tasks[:100], many=True).data},
+            "tasks, 1000": {"next": None, "previous": None, "results": TaskSerializer(tasks, many=True).data},
+            "range, 366 days": AnalyticsService.get_range_summary(self.user, END - timedelta(days=365), END),
+            "heatmap, 365 days": HeatmapService.get_range(self.user, END - timedelta(days=364), END),
+            "dashboard": AnalyticsService.get_dashboard(self.user),
+        }
+
+    def median_us(self, render, data):
+        timings = []
+        for _ in range(RUNS):
+            started = time.perf_counter()
+            render(data)
+            timings.append(time.perf_counter() - started)
+        return round(statistics.median(timings) * 1_000_000, 1)
+
+    def test_encode_times(self):
+        drf = JSONRenderer()
+        fast = FastJSONRenderer()
+        print(f"\nfast backend: {fastjson.BACKEND}")
+        for name, data in self.bodies().items():
+            expected = drf.render(data)
+            self.assertEqual(fast.render(data), expected)
+
+            drf_us = self.median_us(drf.render, data)
+            fast_us = self.median_us(fast.render, data)
+            with mock.patch.object(fastjson, "orjson", None):
+                self.assertEqual(fast.render(data), expected)
+                fallback_us = self.median_us(fast.render, data)
+
+            print(
+                f"{name:>18} ({len(expected) / 1024:7.1f} KiB): "
+                f"JSONRenderer {drf_us} us, fast {fast_us} us ({drf_us / fast_us:.1f}x), "
+                f"fallback {fallback_us} us"
+            )
@@ -0,0 +1,80 @@
+"""
+Task list pagination benchmark: page-number against keyset pages.
+
+Not collected by the default test run; invoke explicitly:
+
+    python manage.py test apps.tasks.tests.bench_pagination
+
+A user with TASKS tasks (each with a completed session, so the focus
+time annotation joins real rows) is paged at increasing depths. Page
+numbers pay COUNT(*) plus an OFFSET scan; cursor pages should stay flat.
+"""
+import statistics
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from apps.pomodoro.models import PomodoroSession
+from apps.tasks.models import Task
+from core.pagination import KeysetPagination
+
+User = get_user_model()
+
+TASKS = 20_000
+PAGE_SIZE = 8
+RUNS = 5
+
+
+class PaginationBenchmark(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="pages@example.com", password="password123")
+        tasks = Task.objects.bulk_create([
+            Task(title=f"Task {n}", owner=cls.user, status="completed") for n in range(TASKS)
+        ])
+        now = timezone.now()
+        PomodoroSession.objects.bulk_create([
+            PomodoroSession(
+                user=cls.user, task=task, started_at=now, ended_at=now,
+                actual_duration_seconds=1500, completed=True, state="TERMINATED",
+            )
+            for task in tasks
+        ])
+        # Spread created_at so the ordering is realistic
+        for n, task in enumerate(tasks[::100]):
+            Task.objects.filter(pk__gte=task.pk, pk__lt=task.pk + 100).update(
+                created_at=now - timedelta(hours=n)
+            )
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+
+    def median_ms(self, url):
+        timings = []
+        for _ in range(RUNS):
+            started = time.perf_counter()
+            response = self.client.get(url)
+            timings.append(time.perf_counter() - started)
+            self.assertEqual(response.status_code, 200)
+        return round(statistics.median(timings) * 1000, 2)
+
+    def cursor_at(self, offset):
+        if not offset:
+            return ""
+        row = (
+            Task.objects.filter(owner=self.user)
+            .order_by("-created_at", "-id")
+            .values_list("created_at", "id")[offset - 1]
+        )
+        cursor = KeysetPagination().encode_cursor(False, [row[0].isoformat(), row[1]])
+        return f"&cursor={cursor}"
+
+    def test_deep_pages(self):
+        for page in (1, 100, 1000, TASKS // PAGE_SIZE):
+            offset = (page - 1) * PAGE_SIZE
+            numbered = self.median_ms(f"/tasks/?page={page}")
+            keyset = self.median_ms(f"/tasks/?page_size={PAGE_SIZE}{self.cursor_at(offset)}")
+            print(f"\npage {page:>5}: page-number {numbered} ms, cursor {keyset} ms")
@@ -0,0 +1,105 @@
+"""
+List serialization benchmark: ModelSerializer against ValuesReader.
+
+Not collected by the default test run; invoke explicitly:
+
+    python manage.py test apps.tasks.tests.bench_readers
+
+Builds 1,000-item task and session lists, query included, the way the
+list views did before (model instances through TaskSerializer and
+PomodoroSessionSerializer) and do now (.values() rows through
+ValuesReader), plus sparse three-field lists. Reports the median time
+and, from tracemalloc, the peak memory allocated while building one list
+and the size of the list kept.
+"""
+import statistics
+import time
+import tracemalloc
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.pomodoro.models import PomodoroSession
+from apps.pomodoro.serializers import PomodoroSessionSerializer, session_reader
+from apps.pomodoro.snapshot import SessionSnapshot
+from apps.tasks.models import Task
+from apps.tasks.serializers import TaskSerializer, task_reader
+
+User = get_user_model()
+
+ITEMS = 1000
+RUNS = 20
+
+
+class ReaderBenchmark(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="readers@example.com", password="password123")
+        now = timezone.now()
+        tasks = Task.objects.bulk_create([
+            Task(
+                title=f"Task {n}", description="Outline, draft, edit. " * 4, owner=cls.user,
+                status="completed", started_at=now, ended_at=now, total_focus_seconds=1500,
+            )
+            for n in range(ITEMS)
+        ])
+        cls.task = tasks[0]
+        PomodoroSession.objects.bulk_create([
+            PomodoroSession(
+                user=cls.user, task=cls.task, started_at=now - timedelta(minutes=n),
+                ended_at=now, actual_duration_seconds=1500, completed=True, state="TERMINATED",
+            )
+            for n in range(ITEMS)
+        ])
+
+    def tasks(self):
+        return Task.objects.filter(owner=self.user).order_by("-created_at", "-id")
+
+    def sessions(self):
+        return PomodoroSession.objects.filter(task=self.task).order_by("created_at", "id")
+
+    def measure(self, build):
+        self.assertEqual(len(build()), ITEMS)
+        timings = []
+        for _ in range(RUNS):
+            started = time.perf_counter()
+            build()
+            timings.append(time.perf_counter() - started)
+
+        tracemalloc.start()
+        result = build()
+        size, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del result
+        return round(statistics.median(timings) * 1000, 2), round(peak / 1024), round(size / 1024)
+
+    def report(self, name, build):
+        ms, peak_kib, size_kib = self.measure(build)
+        print(f"{name:>34}: {ms:7.2f} ms, allocated at peak {peak_kib:6} KiB, result {size_kib:6} KiB")
+
+    def test_task_list(self):
+        print()
+        self.report("tasks: TaskSerializer", lambda: TaskSerializer(self.tasks(), many=True).data)
+        self.report("tasks: ValuesReader", lambda: task_reader.serialize(task_reader.values(self.tasks())))
+        fields = {"id", "title", "status"}
+        self.report("tasks: ValuesReader, 3 fields", lambda: task_reader.serialize(
+            task_reader.values(self.tasks(), fields), fields
+        ))
+
+    def test_session_list(self):
+        def with_serializer():
+            snapshots = SessionSnapshot.load_many(self.sessions())
+            return PomodoroSessionSerializer(
+                [snapshot.session for snapshot in snapshots], many=True,
+                context={"snapshots": {snapshot.session.id: snapshot for snapshot in snapshots}},
+            ).data
+
+        print()
+        self.report("sessions: PomodoroSessionSerializer", with_serializer)
+        self.report("sessions: ValuesReader", lambda: session_reader.serialize(session_reader.values(self.sessions())))
+        fields = {"id", "started_at", "remaining_seconds"}
+        self.report("sessions: ValuesReader, 3 fields", lambda: session_reader.serialize(
+            session_reader.values(self.sessions(), fields), fields
+        ))
@@ -0,0 +1,82 @@
+"""
+Task search benchmark: the full-text index against the icontains filters.
+
+Not collected by the default test run; invoke explicitly:
+
+    python manage.py test apps.tasks.tests.bench_search
+
+Two users get TASKS tasks each, with titles and descriptions drawn from
+a fixed vocabulary. Each query is run through `/tasks/?title__icontains=`
+and `/tasks/?description__icontains=` (LIKE '%...%' scans of every row)
+and through `/tasks/search/` (an index lookup, ranked).
+"""
+import random
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from rest_framework.test import APITestCase
+
+from apps.tasks.models import Task
+from apps.tasks.search import TaskSearch
+
+User = get_user_model()
+
+TASKS = 100_000
+RUNS = 5
+
+WORDS = (
+    "write review draft plan call email fix deploy read design test refactor "
+    "report budget meeting invoice client blog release sprint backlog roadmap "
+    "interview dentist groceries workout chapter slides notes research migrate"
+).split()
+
+QUERIES = ("quarterly", "invoice", "dentist appointment", "rel")
+
+
+class SearchBenchmark(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        rng = random.Random(42)
+        cls.user = User.objects.create_user(email="search@example.com", password="password123")
+        other = User.objects.create_user(email="other@example.com", password="password123")
+        for owner in (cls.user, other):
+            Task.objects.bulk_create(
+                [
+                    Task(
+                        owner=owner,
+                        title=" ".join(rng.choices(WORDS, k=3)).capitalize(),
+                        description=" ".join(rng.choices(WORDS, k=12)),
+                    )
+                    for _ in range(TASKS)
+                ],
+                batch_size=2000,
+            )
+        # A few rare matches, the usual case for a search box
+        Task.objects.bulk_create([
+            Task(owner=cls.user, title="Quarterly report", description="numbers for the board"),
+            Task(owner=cls.user, title="Book dentist appointment"),
+        ])
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+
+    def median_ms(self, url):
+        timings = []
+        for _ in range(RUNS):
+            started = time.perf_counter()
+            response = self.client.get(url)
+            timings.append(time.perf_counter() - started)
+            self.assertEqual(response.status_code, 200)
+        return round(statistics.median(timings) * 1000, 2)
+
+    def test_search(self):
+        print(f"\n{TASKS} tasks per user, search backend {TaskSearch.backend()}")
+        for query in QUERIES:
+            title = self.median_ms(f"/tasks/?title__icontains={query}")
+            description = self.median_ms(f"/tasks/?description__icontains={query}")
+            search = self.median_ms(f"/tasks/search/?q={query}")
+            print(
+                f"{query!r:>22}: title__icontains {title} ms, "
+                f"description__icontains {description} ms, search {search} ms"
+            )
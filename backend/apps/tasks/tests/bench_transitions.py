@@ -0,0 +1,84 @@
+"""
+Contention benchmark for compare-and-set session transitions.
+
+Not collected by the default test run; invoke explicitly:
+
+    python manage.py test apps.tasks.tests.bench_transitions
+
+Numbers are only meaningful against PostgreSQL (DATABASE_URL). SQLite
+serializes writers (transaction_mode IMMEDIATE), so it cannot show the
+queueing on the user's change counter that SessionTransitions describes.
+"""
+from django.test import TransactionTestCase
+from django.contrib.auth import get_user_model
+
+from apps.pomodoro.fsm import TransitionConflict
+from apps.pomodoro.models import PomodoroSession
+from apps.pomodoro.services import PomodoroService
+from apps.pomodoro.transitions import SessionTransitions
+from apps.tasks.models import Task
+from apps.tasks.tests.utils import ConcurrentRunner
+
+User = get_user_model()
+
+WORKERS = 8
+
+
+class TransitionContentionBenchmark(TransactionTestCase):
+    def _session_for(self, n):
+        user = User.objects.create_user(email=f"bench{n}@example.com", password="password123")
+        task = Task.objects.create(title=f"Bench {n}", owner=user)
+        return PomodoroSession.objects.create(user=user, task=task)
+
+    def test_contended_completion(self):
+        """Every worker races to complete the same session: one may win."""
+        session = self._session_for(0)
+
+        def complete(worker, i):
+            copy = PomodoroSession.objects.select_related("task", "user").get(pk=session.pk)
+            try:
+                PomodoroService.complete_session(copy)
+            except TransitionConflict:
+                return "conflict"
+            return "completed"
+
+        report = ConcurrentRunner().benchmark(complete, workers=WORKERS, iterations=1)
+        print("\ncontended completion:", report)
+
+        self.assertLessEqual(report["outcomes"].get("completed", 0), 1)
+        self.assertLessEqual(
+            PomodoroSession.objects.filter(is_break=True).count(), 1
+        )
+
+    def test_parallel_pause_resume_throughput(self):
+        """Each worker flips its own session between paused and running."""
+        sessions = [self._session_for(n) for n in range(WORKERS)]
+
+        def flip(worker, i):
+            session = PomodoroSession.objects.get(pk=sessions[worker].pk)
+            event = "PAUSE" if session.state == "FOCUS_RUNNING" else "RESUME"
+            SessionTransitions.apply(session, event)
+            return "ok"
+
+        report = ConcurrentRunner().benchmark(flip, workers=WORKERS, iterations=50)
+        print("\nparallel pause/resume:", report)
+
+    def test_same_session_pause_resume_contention(self):
+        """All workers hammer one session; losers see conflicts, never corruption."""
+        session = self._session_for(0)
+
+        def flip(worker, i):
+            copy = PomodoroSession.objects.get(pk=session.pk)
+            event = "PAUSE" if copy.state == "FOCUS_RUNNING" else "RESUME"
+            try:
+                SessionTransitions.apply(copy, event)
+            except TransitionConflict:
+                return "conflict"
+            return "ok"
+
+        report = ConcurrentRunner().benchmark(flip, workers=WORKERS, iterations=50)
+        print("\nsingle-session contention:", report)
+
+        session.refresh_from_db()
+        open_pauses = session.pauses.filter(resumed_at__isnull=True).count()
+        self.assertEqual(open_pauses, 1 if session.state == "FOCUS_PAUSED" else 0)
@@ -0,0 +1,102 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.analytics.models import UserDailyStats
+from apps.pomodoro.models import PomodoroSession
+from apps.tasks.models import Task
+from apps.tasks.tests.base import BaseAPITestCase
+
+User = get_user_model()
+
+
+class TestBulkTasks(BaseAPITestCase):
+    def post(self, operations):
+        return self.client.post("/tasks/bulk/", {"operations": operations}, format="json")
+
+    def test_create_update_delete(self):
+        doomed = Task.objects.create(owner=self.user, title="Old chore")
+
+        response = self.post([
+            {"op": "create", "data": {"title": "Plan sprint", "priority": "high"}},
+            {"op": "update", "id": self.task.id, "data": {"category": "work", "priority": "low"}},
+            {"op": "delete", "id": doomed.id},
+        ])
+
+        self.assertEqual(response.status_code, 200)
+        created, updated, deleted = response.data["results"]
+        self.assertEqual((created["op"], created["task"]["title"]), ("create", "Plan sprint"))
+        self.assertEqual((updated["task"]["category"], updated["task"]["priority"]), ("work", "low"))
+        self.assertEqual(deleted, {"index": 2, "op": "delete", "id": doomed.id})
+
+        self.task.refresh_from_db()
+        self.assertEqual((self.task.category, self.task.priority), ("work", "low"))
+        self.assertEqual(self.task.title, "Write blog post")
+        self.assertFalse(Task.objects.filter(pk=doomed.pk).exists())
+        self.assertTrue(Task.objects.filter(owner=self.user, title="Plan sprint", priority="high").exists())
+        today = timezone.localdate()
+        self.assertEqual(UserDailyStats.objects.get(user=self.user, date=today).tasks_created, 1)
+
+    def test_query_count_does_not_grow_with_batch(self):
+        def count(size):
+            tasks = Task.objects.bulk_create([Task(owner=self.user, title=f"t{n}") for n in range(size * 2)])
+            operations = (
+                [{"op": "create", "data": {"title": f"new {n}"}} for n in range(size)]
+                + [{"op": "update", "id": task.id, "data": {"priority": "high"}} for task in tasks[:size]]
+                + [{"op": "delete", "id": task.id} for task in tasks[size:]]
+            )
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(self.post(operations).status_code, 200)
+            return len(queries)
+
+        count(1)  # creates today's rollup row
+        self.assertEqual(count(3), count(30))
+
+    def test_rejects_whole_batch(self):
+        other = User.objects.create_user(email="other@example.com", password="password123")
+        foreign = Task.objects.create(owner=other, title="Not mine")
+
+        response = self.post([
+            {"op": "create", "data": {"title": "Valid"}},
+            {"op": "update", "id": foreign.id, "data": {"title": "Stolen"}},
+            {"op": "delete", "id": 999999},
+        ])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([(e["index"], e["code"]) for e in response.data["errors"]], [(1, "NOT_FOUND"), (2, "NOT_FOUND")])
+        self.assertFalse(Task.objects.filter(title="Valid").exists())
+        foreign.refresh_from_db()
+        self.assertEqual(foreign.title, "Not mine")
+
+    def test_invalid_operations(self):
+        response = self.post([
+            {"op": "create", "data": {"priority": "urgent"}},
+            {"op": "rename", "id": self.task.id},
+            {"op": "update", "id": "1", "data": {}},
+            {"op": "delete", "id": self.task.id},
+            {"op": "update", "id": self.task.id, "data": {"title": "Twice"}},
+        ])
+
+        self.assertEqual(response.status_code, 400)
+        errors = response.data["errors"]
+        self.assertEqual([e["index"] for e in errors], [0, 1, 2, 4])
+        self.assertIn("title", errors[0]["fields"])
+        self.assertTrue(Task.objects.filter(pk=self.task.pk).exists())
+        self.assertEqual(self.post([]).status_code, 400)
+
+    def test_active_pomodoro_conflicts(self):
+        PomodoroSession.objects.create(user=self.user, task=self.task, started_at=timezone.now())
+
+        for operation in (
+            {"op": "delete", "id": self.task.id},
+            {"op": "update", "id": self.task.id, "data": {"status": "completed"}},
+        ):
+            response = self.post([operation])
+            self.assertEqual(response.status_code, 409)
+            self.assertEqual(response.data["errors"][0]["code"], "ACTIVE_POMODORO")
+
+        # Edits that leave the session alone are fine
+        response = self.post([{"op": "update", "id": self.task.id, "data": {"title": "Renamed", "status": "pending"}}])
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(PomodoroSession.objects.filter(task=self.task, completed=False).exists())
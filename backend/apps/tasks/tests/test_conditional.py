@@ -0,0 +1,52 @@
+from django.contrib.auth import get_user_model
+
+from apps.tasks.models import Task
+from apps.tasks.tests.base import BaseAPITestCase
+
+User = get_user_model()
+
+
+class TestTaskConditionalGet(BaseAPITestCase):
+    def revalidate(self, url, etag):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    def test_unchanged_list_is_not_modified(self):
+        first = self.client.get("/tasks/")
+        etag = first["ETag"]
+        self.assertIn("no-cache", first["Cache-Control"])
+
+        # Only the change counter is read
+        with self.assertNumQueries(1):
+            response = self.revalidate("/tasks/", etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+    def test_writes_change_the_etag(self):
+        url = f"/tasks/{self.task.id}/"
+        etag = self.client.get(url)["ETag"]
+
+        self.client.patch(url, {"priority": "high"}, format="json")
+        response = self.revalidate(url, etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["priority"], "high")
+        self.assertNotEqual(response["ETag"], etag)
+
+        etag = self.client.get("/tasks/")["ETag"]
+        Task.objects.create(owner=self.user, title="Another").delete()
+        self.assertEqual(self.revalidate("/tasks/", etag).status_code, 200)
+
+    def test_other_users_writes_keep_the_etag(self):
+        etag = self.client.get("/tasks/")["ETag"]
+        other = User.objects.create_user(email="other@example.com", password="password123")
+        Task.objects.create(owner=other, title="Theirs")
+
+        self.assertEqual(self.revalidate("/tasks/", etag).status_code, 304)
+
+    def test_errors_and_superusers_get_no_etag(self):
+        self.assertNotIn("ETag", self.client.get("/tasks/999999/"))
+
+        admin = User.objects.create_superuser(email="admin@example.com", password="password123")
+        self.client.force_authenticate(admin)
+        self.assertNotIn("ETag", self.client.get("/tasks/"))
@@ -0,0 +1,81 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.utils import timezone
+
+from apps.pomodoro.models import PomodoroSession
+from apps.pomodoro.services import PomodoroService
+from apps.tasks.models import Task
+from apps.tasks.tests.base import BaseAPITestCase
+
+
+class TestTaskCounters(BaseAPITestCase):
+    def start_focus(self, minutes_ago=25, duration=25):
+        return PomodoroSession.objects.create(
+            user=self.user, task=self.task, duration_minutes=duration,
+            started_at=timezone.now() - timedelta(minutes=minutes_ago),
+        )
+
+    def test_manual_completion_updates_counters(self):
+        self.start_focus(minutes_ago=10)
+
+        response = self.client.post(f"/tasks/{self.task.id}/complete/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["completed_pomodoros"], 1)
+        self.assertAlmostEqual(response.data["total_focus_seconds"], 600, delta=2)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.completed_pomodoros, 1)
+
+    def test_expiry_updates_counters_and_picks_break_from_them(self):
+        Task.objects.filter(pk=self.task.pk).update(completed_pomodoros=3, total_focus_seconds=3 * 1500)
+        session = self.start_focus(minutes_ago=30)
+
+        PomodoroService.expire_session(session.id)
+
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.completed_pomodoros, 4)
+        self.assertEqual(self.task.total_focus_seconds, 4 * 1500)
+        next_break = PomodoroSession.objects.get(user=self.user, is_break=True)
+        self.assertEqual(next_break.break_type, "long")
+
+    def test_breaks_do_not_count(self):
+        session = PomodoroSession.objects.create(
+            user=self.user, task=self.task, is_break=True, break_type="short",
+            started_at=timezone.now() - timedelta(minutes=5),
+        )
+
+        PomodoroService.complete_session(session, manual=True)
+
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.completed_pomodoros, 0)
+
+    def test_task_list_reads_counters(self):
+        Task.objects.filter(pk=self.task.pk).update(completed_pomodoros=2, total_focus_seconds=3000)
+
+        # The change counter (for the ETag) and the page
+        with self.assertNumQueries(2):
+            response = self.client.get("/tasks/")
+
+        self.assertEqual(response.data["results"][0]["focus_duration_seconds"], 3000)
+        self.assertEqual(response.data["results"][0]["completed_pomodoros"], 2)
+
+    def test_reconcile_command(self):
+        PomodoroSession.objects.create(
+            user=self.user, task=self.task, completed=True, actual_duration_seconds=1500,
+            ended_at=timezone.now(), state="TERMINATED",
+        )
+        Task.objects.filter(pk=self.task.pk).update(completed_pomodoros=7)
+
+        with self.assertRaises(CommandError):
+            call_command("reconcile_task_counters", check=True, stdout=StringIO())
+
+        out = StringIO()
+        call_command("reconcile_task_counters", user=[self.user.email], stdout=out)
+
+        self.assertIn("Repaired 1", out.getvalue())
+        self.task.refresh_from_db()
+        self.assertEqual((self.task.total_focus_seconds, self.task.completed_pomodoros), (1500, 1))
+        call_command("reconcile_task_counters", check=True, stdout=StringIO())
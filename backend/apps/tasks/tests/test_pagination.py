@@ -0,0 +1,112 @@
+import base64
+import json
+from datetime import timedelta
+
+from django.utils import timezone
+
+from apps.pomodoro.models import PomodoroSession
+from apps.tasks.models import Task
+from apps.tasks.tests.base import BaseAPITestCase
+
+
+def forged_cursor(position):
+    token = json.dumps({"r": 0, "p": position}).encode()
+    return base64.urlsafe_b64encode(token).decode()
+
+
+FORGED_POSITIONS = (
+    ["garbage", 1],
+    ["2020-01-01T00:00:00", 1],
+    ["2020-01-01T00:00:00Z", "abc"],
+    ["2020-01-01T00:00:00Z", True],
+    ["2020-01-01T00:00:00Z", 2 ** 64],
+    [{"a": 1}, 1],
+    [None, None],
+)
+
+
+class TestTaskKeysetPagination(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        now = timezone.now()
+        for n in range(20):
+            task = Task.objects.create(title=f"Task {n}", owner=self.user)
+            # Pairs share a created_at so the id tiebreak matters
+            Task.objects.filter(pk=task.pk).update(created_at=now - timedelta(minutes=n // 2))
+
+    def walk(self, url):
+        titles, pages = [], 0
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            titles += [task["title"] for task in response.data["results"]]
+            url = response.data["next"]
+            pages += 1
+        return titles, pages
+
+    def test_cursor_pages_cover_every_task_once(self):
+        titles, pages = self.walk("/tasks/?page_size=6")
+
+        self.assertEqual(len(titles), 21)
+        self.assertEqual(len(set(titles)), 21)
+        self.assertEqual(pages, 4)
+        expected = list(Task.objects.filter(owner=self.user).order_by("-created_at", "-id").values_list("title", flat=True))
+        self.assertEqual(titles, expected)
+
+    def test_previous_link_returns_the_prior_page(self):
+        first = self.client.get("/tasks/?page_size=5")
+        second = self.client.get(first.data["next"])
+        back = self.client.get(second.data["previous"])
+
+        self.assertEqual(back.data["results"], first.data["results"])
+        self.assertIsNone(first.data["previous"])
+
+    def test_count_is_optional(self):
+        # The change counter (for the ETag) and the page
+        with self.assertNumQueries(2):
+            response = self.client.get("/tasks/")
+        self.assertNotIn("count", response.data)
+        self.assertEqual(len(response.data["results"]), 8)
+
+        response = self.client.get("/tasks/?count=true")
+        self.assertEqual(response.data["count"], 21)
+
+    def test_page_numbers_still_work(self):
+        response = self.client.get("/tasks/?page=3")
+
+        self.assertEqual(response.data["count"], 21)
+        self.assertEqual(len(response.data["results"]), 5)
+
+    def test_invalid_cursor(self):
+        self.assertEqual(self.client.get("/tasks/?cursor=garbage").status_code, 404)
+        for position in FORGED_POSITIONS:
+            response = self.client.get(f"/tasks/?cursor={forged_cursor(position)}")
+            self.assertEqual(response.status_code, 404, position)
+
+        response = self.client.get(f"/tasks/?cursor={forged_cursor(['2020-01-01T00:00:00+00:00', 1])}")
+        self.assertEqual(response.status_code, 200)
+
+
+class TestSessionKeysetPagination(BaseAPITestCase):
+    def test_sessions_are_a_list_unless_paginated(self):
+        for n in range(5):
+            PomodoroSession.objects.create(
+                user=self.user, task=self.task, completed=True,
+                started_at=timezone.now() - timedelta(hours=n),
+            )
+
+        response = self.client.get(f"/pomodoro/sessions/{self.task.id}/")
+        self.assertEqual(len(response.data), 5)
+
+        response = self.client.get(f"/pomodoro/sessions/{self.task.id}/?page_size=2")
+        ids = [session["id"] for session in response.data["results"]]
+        while response.data["next"]:
+            response = self.client.get(response.data["next"])
+            ids += [session["id"] for session in response.data["results"]]
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(len(ids), 5)
+
+    def test_invalid_cursor(self):
+        for position in FORGED_POSITIONS:
+            response = self.client.get(f"/pomodoro/sessions/{self.task.id}/?cursor={forged_cursor(position)}")
+            self.assertEqual(response.status_code, 404, position)
@@ -0,0 +1,70 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from apps.pomodoro.models import PomodoroSession
+from apps.pomodoro.serializers import PomodoroSessionSerializer, session_reader
+from apps.pomodoro.snapshot import SessionSnapshot
+from apps.tasks.models import Task
+from apps.tasks.serializers import TaskSerializer, task_reader
+from apps.tasks.tests.base import BaseAPITestCase
+
+
+class TestValuesReaders(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        now = timezone.now()
+        Task.objects.create(
+            owner=self.user, title="Done", description="", category="work", priority="high",
+            status="completed", started_at=now - timedelta(hours=1), ended_at=now,
+            total_focus_seconds=1500, completed_pomodoros=1,
+        )
+        PomodoroSession.objects.create(
+            user=self.user, task=self.task, started_at=now - timedelta(hours=2),
+            ended_at=now - timedelta(hours=1, minutes=35), completed=True,
+            actual_duration_seconds=1500, state="TERMINATED",
+        )
+        PomodoroSession.objects.create(
+            user=self.user, task=self.task, started_at=now - timedelta(minutes=10),
+            paused_at=now - timedelta(minutes=2), paused_duration_seconds=30, state="FOCUS_PAUSED",
+        )
+
+    def test_rows_serialize_like_the_serializers(self):
+        tasks = Task.objects.order_by("id")
+        self.assertEqual(
+            task_reader.serialize(task_reader.values(tasks)),
+            TaskSerializer(tasks, many=True).data,
+        )
+
+        now = timezone.now()
+        sessions = PomodoroSession.objects.order_by("id")
+        rows = list(session_reader.values(sessions))
+        SessionSnapshot.add_timing(rows, now)
+        expected = PomodoroSessionSerializer(sessions, many=True, context={
+            "snapshots": {session.id: SessionSnapshot(session, now) for session in sessions},
+        }).data
+        self.assertEqual(session_reader.serialize(rows), expected)
+        self.assertNotIn("ends_at", expected[0])
+
+    def test_task_list_fields(self):
+        response = self.client.get("/tasks/?fields=id,status&page_size=1")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.data["results"][0]), ["id", "status"])
+
+        # The cursor still pages although created_at was not requested
+        response = self.client.get(response.data["next"])
+        self.assertEqual(response.data["results"], [{"id": self.task.id, "status": "pending"}])
+
+        response = self.client.get("/tasks/?fields=id,owner")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("fields", response.data)
+
+    def test_session_list_fields(self):
+        response = self.client.get(f"/pomodoro/sessions/{self.task.id}/?fields=id,remaining_seconds")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([list(row) for row in response.data], [["id", "remaining_seconds"]] * 2)
+        self.assertGreater(response.data[1]["remaining_seconds"], 0)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(f"/pomodoro/sessions/{self.task.id}/?fields=id")
+        self.assertEqual(response.data, [{"id": session.id} for session in self.task.pomodoro_sessions.order_by("created_at", "id")])
@@ -0,0 +1,81 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+
+from apps.tasks.models import Task
+from apps.tasks.search import TaskSearch
+from apps.tasks.tests.base import BaseAPITestCase
+
+User = get_user_model()
+
+
+class TestTaskSearch(BaseAPITestCase):
+    def search(self, q, **params):
+        response = self.client.get("/tasks/search/", {"q": q, **params})
+        self.assertEqual(response.status_code, 200)
+        return [task["title"] for task in response.data["results"]]
+
+    def test_uses_full_text_index(self):
+        self.assertEqual(TaskSearch.backend(), TaskSearch.FTS5 if connection.vendor == "sqlite" else TaskSearch.POSTGRES)
+
+    def test_prefix_words_and_ranking(self):
+        Task.objects.create(owner=self.user, title="Groceries", description="Write the blog shopping list")
+        Task.objects.create(owner=self.user, title="Blog redesign")
+
+        self.assertEqual(self.search("wri blo"), ["Write blog post", "Groceries"])
+        titles = self.search("blog")
+        self.assertEqual(sorted(titles[:2]), ["Blog redesign", "Write blog post"])
+        self.assertEqual(titles[2], "Groceries")
+        self.assertEqual(self.search("blog redesign"), ["Blog redesign"])
+        self.assertEqual(self.search("nothing"), [])
+
+    def test_title_hits_rank_above_description_hits(self):
+        Task.objects.create(owner=self.user, title="Groceries", description="Review the quarterly report")
+        Task.objects.create(owner=self.user, title="Quarterly report")
+
+        self.assertEqual(self.search("quarterly"), ["Quarterly report", "Groceries"])
+
+    def test_index_follows_writes(self):
+        Task.objects.bulk_create([Task(owner=self.user, title="Dentist appointment")])
+        self.assertEqual(self.search("dentist"), ["Dentist appointment"])
+
+        Task.objects.filter(owner=self.user, title="Dentist appointment").update(title="Doctor appointment")
+        self.assertEqual(self.search("dentist"), [])
+        self.assertEqual(self.search("doctor"), ["Doctor appointment"])
+
+        self.task.description = "Draft about caching"
+        self.task.save()
+        self.assertEqual(self.search("caching"), ["Write blog post"])
+
+        self.task.delete()
+        self.assertEqual(self.search("caching"), [])
+
+    def test_only_own_tasks_and_filters(self):
+        other = User.objects.create_user(email="other@example.com", password="password123")
+        Task.objects.create(owner=other, title="Write novel")
+        Task.objects.create(owner=self.user, title="Write tests", status="completed")
+
+        self.assertEqual(sorted(self.search("write")), ["Write blog post", "Write tests"])
+        self.assertEqual(self.search("write", status="completed"), ["Write tests"])
+
+    def test_pages(self):
+        Task.objects.bulk_create([Task(owner=self.user, title=f"Write chapter {n}") for n in range(3)])
+
+        response = self.client.get("/tasks/search/", {"q": "chapter", "limit": 2})
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertEqual(response.data["next_offset"], 2)
+
+        response = self.client.get("/tasks/search/", {"q": "chapter", "limit": 2, "offset": 2})
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertIsNone(response.data["next_offset"])
+
+    def test_query_syntax_is_not_interpreted(self):
+        self.assertEqual(self.search('"write* -(blog:'), ["Write blog post"])
+        self.assertEqual(self.client.get("/tasks/search/", {"q": " *: "}).status_code, 400)
+        self.assertEqual(self.client.get("/tasks/search/", {"q": "x", "status": "nope"}).status_code, 400)
+
+    def test_falls_back_to_icontains(self):
+        with mock.patch.dict(TaskSearch._backends, {"default": TaskSearch.BASIC}):
+            self.assertEqual(self.search("blog wri"), ["Write blog post"])
+            self.assertEqual(self.search("nothing"), [])
@@ -0,0 +1,51 @@
+from unittest import mock
+
+from core.timing import request_timing
+from apps.tasks.tests.base import BaseAPITestCase
+
+
+class TestServerTiming(BaseAPITestCase):
+    def metrics(self, response):
+        return {metric.split(";")[0]: metric for metric in response["Server-Timing"].split(", ")}
+
+    def test_header_on_request(self):
+        self.user.is_staff = True
+        self.user.save(update_fields=["is_staff"])
+
+        with mock.patch.object(request_timing, "header", False):
+            response = self.client.post(f"/tasks/{self.task.id}/start/", HTTP_X_SERVER_TIMING="1")
+
+        self.assertEqual(response.status_code, 201)
+        metrics = self.metrics(response)
+        self.assertRegex(metrics["db"], r'^db;dur=[\d.]+;desc="[1-9]\d* queries"$')
+        self.assertIn("TaskService.start_task", metrics)
+        self.assertIn("broadcast_task_event", metrics)
+        self.assertIn("render", metrics)
+        self.assertIn("total", metrics)
+
+    def test_only_staff_can_ask_for_the_header(self):
+        with mock.patch.object(request_timing, "header", False):
+            response = self.client.get("/tasks/", HTTP_X_SERVER_TIMING="1")
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn("Server-Timing", response)
+
+            self.client.force_authenticate(None)
+            response = self.client.get("/tasks/", HTTP_X_SERVER_TIMING="1")
+            self.assertEqual(response.status_code, 401)
+            self.assertNotIn("Server-Timing", response)
+
+    def test_header_setting(self):
+        with mock.patch.object(request_timing, "header", False):
+            self.assertNotIn("Server-Timing", self.client.get("/tasks/"))
+        with mock.patch.object(request_timing, "header", True):
+            self.assertIn("Server-Timing", self.client.get("/tasks/"))
+            self.assertNotIn("Server-Timing", self.client.get("/tasks/", HTTP_X_SERVER_TIMING="0"))
+
+    def test_slow_request_logged(self):
+        with mock.patch.object(request_timing, "slow_ms", 0), self.assertLogs("core.timing", "WARNING") as logs:
+            self.client.get("/tasks/")
+
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("Slow GET /tasks/", logs.output[0])
+        self.assertIn("2 queries", logs.output[0])
+        self.assertIn("SELECT", logs.output[0])
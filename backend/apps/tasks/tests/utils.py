@@ -1,8 +1,15 @@
+import asyncio
 import threading
+import time
+from collections import Counter
+
+from django.db import connections
+
 
 class ConcurrentRunner:
     def __init__(self):
         self.results = []
+        self.timings = []
 
     def run(self, fn, count=2):
         threads = []
@@ -10,7 +17,12 @@ class ConcurrentRunner:
 
         def wrapped():
             barrier.wait()
-            self.results.append(fn())
+            started = time.perf_counter()
+            try:
+                self.results.append(fn())
+            finally:
+                self.timings.append(time.perf_counter() - started)
+                connections.close_all()
 
         for _ in range(count):
             t = threading.Thread(target=wrapped)
@@ -21,3 +33,78 @@ class ConcurrentRunner:
             t.join()
 
         return self.results
+
+    def benchmark(self, fn, workers=4, iterations=25):
+        """
+        Contention benchmark: `workers` threads start together and each calls
+        `fn(worker, iteration)` `iterations` times. Results are tallied as
+        outcomes, exceptions by class name.
+        """
+        outcomes = Counter()
+        latencies = []
+        lock = threading.Lock()
+        barrier = threading.Barrier(workers)
+
+        def worker(index):
+            barrier.wait()
+            try:
+                for i in range(iterations):
+                    started = time.perf_counter()
+                    try:
+                        outcome = fn(index, i)
+                    except Exception as e:
+                        outcome = type(e).__name__
+                    elapsed = time.perf_counter() - started
+                    with lock:
+                        outcomes[outcome] += 1
+                        latencies.append(elapsed)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(workers)]
+        started = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        wall = time.perf_counter() - started
+
+        return self._report(workers, latencies, wall, outcomes)
+
+    async def abenchmark(self, fn, workers=4, iterations=25):
+        """
+        benchmark() for coroutines: `workers` tasks share one event loop and
+        each awaits `fn(worker, iteration)` `iterations` times.
+        """
+        outcomes = Counter()
+        latencies = []
+
+        async def worker(index):
+            for i in range(iterations):
+                started = time.perf_counter()
+                try:
+                    outcome = await fn(index, i)
+                except Exception as e:
+                    outcome = type(e).__name__
+                latencies.append(time.perf_counter() - started)
+                outcomes[outcome] += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(n) for n in range(workers)))
+        wall = time.perf_counter() - started
+
+        return self._report(workers, latencies, wall, outcomes)
+
+    @staticmethod
+    def _report(workers, latencies, wall, outcomes):
+        latencies.sort()
+        calls = len(latencies)
+        return {
+            "workers": workers,
+            "calls": calls,
+            "seconds": round(wall, 4),
+            "throughput": round(calls / wall, 1) if wall else 0,
+            "p50_ms": round(latencies[calls // 2] * 1000, 2) if calls else 0,
+            "p99_ms": round(latencies[min(calls - 1, int(calls * 0.99))] * 1000, 2) if calls else 0,
+            "outcomes": dict(outcomes),
+        }
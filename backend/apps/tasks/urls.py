@@ -1,13 +1,19 @@
 from django.urls import path
 from rest_framework.routers import DefaultRouter
 
-from apps.tasks import views
+from apps.tasks import views, async_views
 
 urlpatterns = [
+    path('bulk/', views.BulkTaskAPIView.as_view(), name='bulk_tasks'),
+    path('search/', views.TaskSearchAPIView.as_view(), name='search_tasks'),
     path('<int:pk>/start/', views.StartTaskAPIView.as_view(), name='start_task'),
     path('<int:pk>/pause/', views.PauseTaskAPIView.as_view(), name='pause_task'),
     path('<int:pk>/resume/', views.ResumeTaskAPIView.as_view(), name='resume_task'),
     path('<int:pk>/complete/', views.CompleteTaskAPIView.as_view(), name='complete_task'),
+    path('async/<int:pk>/start/', async_views.AsyncStartTaskAPIView.as_view(), name='astart_task'),
+    path('async/<int:pk>/pause/', async_views.AsyncPauseTaskAPIView.as_view(), name='apause_task'),
+    path('async/<int:pk>/resume/', async_views.AsyncResumeTaskAPIView.as_view(), name='aresume_task'),
+    path('async/<int:pk>/complete/', async_views.AsyncCompleteTaskAPIView.as_view(), name='acomplete_task'),
 ]
 
 router = DefaultRouter()
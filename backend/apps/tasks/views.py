@@ -5,39 +5,127 @@ from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
 from django.utils import timezone
-from django.db.models import Sum, Q
 
 from apps.tasks.models import Task
-from apps.tasks.serializers import TaskSerializer, TaskStatusSerializer
+from apps.tasks.serializers import TaskSerializer, TaskStatusSerializer, task_reader
 from apps.tasks.services import TaskService
 from apps.tasks.filters import TaskFilter
+from apps.tasks.search import TaskSearch
+from apps.tasks.bulk import TaskBulkService, TaskBulkError
 from apps.tasks.services import ActivePomodoroExists
 
 from apps.pomodoro.serializers import PomodoroSessionSerializer
+from core.pagination import KeysetPagination
+from core.conditional import conditional
+from apps.sync.sequence import ChangeSequence
+from apps.pomodoro.fsm import TransitionConflict
+from apps.pomodoro.utils import transition_conflict_response
 
 # Create your views here.
+def task_data_version(view, request, *args, **kwargs):
+    """
+    Every write to a user's tasks takes a change number (see
+    ChangeSequence), so the latest one versions all of them. Superusers
+    list everyone's tasks and get no validator.
+    """
+    if request.user.is_superuser:
+        return None
+    return [request.user.pk, ChangeSequence.current(request.user.pk)]
+
 class TaskViewSet(viewsets.ModelViewSet):
     queryset = Task.objects.all().order_by('-created_at')
     serializer_class = TaskSerializer
     permission_classes = [IsAuthenticated]
     filterset_class = TaskFilter
     filter_backends = [DjangoFilterBackend]
+    # Cursor pages on (created_at, id); `?page=` still gets numbered pages
+    pagination_class = KeysetPagination
     
     def get_queryset(self):
         qs =  super().get_queryset()
         if not self.request.user.is_superuser:
             qs = qs.filter(owner=self.request.user)
-            
-        qs = qs.annotate(
-            focus_duration_seconds=Sum(
-                "pomodoro_sessions__actual_duration_seconds",
-                filter=Q(
-                    pomodoro_sessions__is_break=False,
-                    pomodoro_sessions__completed=True
-                )
-            )
-        )
         return qs
+
+    @conditional(task_data_version)
+    def list(self, request, *args, **kwargs):
+        """
+        Built from .values() rows, see ValuesReader; `?fields=id,title`
+        returns only those fields.
+        """
+        fields = task_reader.requested_fields(request)
+        queryset = task_reader.values(
+            self.filter_queryset(self.get_queryset()), fields,
+            extra=[name.lstrip("-") for name in self.paginator.ordering],
+        )
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(task_reader.serialize(page, fields))
+        return Response(task_reader.serialize(queryset, fields))
+
+    @conditional(task_data_version)
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
+class BulkTaskAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        """
+        Apply a list of create/update/delete operations to the user's tasks
+        in one transaction. Nothing is written if any operation is invalid.
+        """
+        try:
+            operations = request.data.get("operations") if isinstance(request.data, dict) else request.data
+            results = TaskBulkService.apply(request.user, operations)
+        except TaskBulkError as e:
+            return Response(
+                {"detail": "Invalid operations", "errors": e.errors},
+                status=status.HTTP_409_CONFLICT if e.conflict else status.HTTP_400_BAD_REQUEST
+            )
+
+        for result in results:
+            if "task" in result:
+                result["task"] = TaskSerializer(result["task"]).data
+        return Response({"results": results})
+
+class TaskSearchAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+    max_limit = 100
+
+    def get(self, request):
+        """
+        Ranked full-text search of the user's tasks. Every word of `q` is
+        matched as a prefix; `status`, `limit` (at most 100) and `offset`
+        are optional.
+        """
+        query = request.query_params.get("q", "")
+        if not TaskSearch.terms(query):
+            return Response(
+                {"detail": "q must contain at least one word"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        task_status = request.query_params.get("status")
+        if task_status and task_status not in dict(Task.STATUS_CHOICES):
+            return Response(
+                {"detail": f"status must be one of {', '.join(dict(Task.STATUS_CHOICES))}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            limit = min(max(int(request.query_params.get("limit", 20)), 1), self.max_limit)
+            offset = max(int(request.query_params.get("offset", 0)), 0)
+        except ValueError:
+            return Response(
+                {"detail": "limit and offset must be integers"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # One extra row tells whether another page exists
+        tasks = TaskSearch.search(request.user, query, status=task_status, limit=limit + 1, offset=offset)
+        return Response({
+            "next_offset": offset + limit if len(tasks) > limit else None,
+            "results": TaskSerializer(tasks[:limit], many=True).data,
+        })
    
 class StartTaskAPIView(APIView):
     permission_classes = [IsAuthenticated]
@@ -74,7 +162,10 @@ class PauseTaskAPIView(APIView):
 
     def post(self, request, pk):
         task = Task.objects.get(pk=pk, owner=request.user)
-        task, session = TaskService.pause_task(task, request.user)
+        try:
+            task, session = TaskService.pause_task(task, request.user)
+        except TransitionConflict as e:
+            return transition_conflict_response(e)
 
         return Response({
             "id": task.id,
@@ -91,7 +182,10 @@ class ResumeTaskAPIView(APIView):
 
     def post(self, request, pk):
         task = Task.objects.get(pk=pk, owner=request.user)
-        task, session = TaskService.resume_task(task, request.user)
+        try:
+            task, session = TaskService.resume_task(task, request.user)
+        except TransitionConflict as e:
+            return transition_conflict_response(e)
 
         return Response({
             "id": task.id,
@@ -108,13 +202,9 @@ class CompleteTaskAPIView(APIView):
 
     def post(self, request, pk):
         task = Task.objects.get(pk=pk, owner=request.user)
-        task = TaskService.complete_task(task, request.user)
-
-        completed_pomodoros = task.pomodoro_sessions.filter(
-            completed=True, is_break=False
-        ).count()
+        try:
+            task = TaskService.complete_task(task, request.user)
+        except TransitionConflict as e:
+            return transition_conflict_response(e)
 
-        return Response({
-            **TaskStatusSerializer(task).data,
-            "completed_pomodoros": completed_pomodoros
-        })
+        return Response(TaskStatusSerializer(task).data)
@@ -4,6 +4,7 @@ from channels.routing import ProtocolTypeRouter, URLRouter
 from channels.auth import AuthMiddlewareStack
 from apps.pomodoro import routing as pomodoro_routing
 from apps.pomodoro.middleware import CookiesJWTAuthMiddleware
+from apps.pomodoro.scheduler import ExpirySchedulerLifespan
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
@@ -14,4 +15,5 @@ application = ProtocolTypeRouter({
             pomodoro_routing.websocket_urlpatterns
         )
     ),
+    "lifespan": ExpirySchedulerLifespan(),
 })
@@ -57,10 +57,12 @@ INSTALLED_APPS = [
     'apps.tasks',
     'apps.pomodoro',
     'apps.analytics',
+    'apps.sync',
 ]
 INSTALLED_APPS += ["rest_framework_simplejwt.token_blacklist"]
 
 MIDDLEWARE = [
+    'core.middleware.ServerTimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -109,6 +111,15 @@ else:
         'default': {
             'ENGINE': 'django.db.backends.sqlite3',
             'NAME': BASE_DIR / 'db.sqlite3',
+            'OPTIONS': {
+                # Transactions take the write lock at BEGIN and wait for it,
+                # instead of failing with "database is locked" when two of
+                # them try to upgrade from reading to writing at once
+                'transaction_mode': 'IMMEDIATE',
+            },
+            # A file rather than the in-memory default, so tests can run
+            # writers on separate connections (apps.sync concurrency test)
+            'TEST': {'NAME': BASE_DIR / 'test_db.sqlite3'},
         }
     }
 
@@ -168,6 +179,16 @@ REST_FRAMEWORK = {
         'apps.accounts.authentication.CookiesJWTAuthentication',
     ),
     'DEFAULT_FILTER_BACKENDS': ['django_filters.rest_framework.DjangoFilterBackend'],
+    # orjson when installed, same output as DRF's JSON renderer and parser
+    'DEFAULT_RENDERER_CLASSES': (
+        'core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'core.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 8,
@@ -197,6 +218,10 @@ AUTH_COOKIE_HTTP_ONLY = True #Flag: So that javascript cannot access the values
 AUTH_COOKIE_PATH = '/'
 AUTH_COOKIE_SAMESITE = 'Lax' #None, Lax, Strict - Use 'Lax' for development (HTTP), 'None' requires HTTPS
 
+# In-process token -> user cache shared by HTTP and websocket auth
+AUTH_USER_CACHE_TTL_SECONDS = 60
+AUTH_USER_CACHE_MAX_ENTRIES = 10000
+
 REDIS_URL = os.getenv(
     "REDIS_URL",
     ""
@@ -216,6 +241,37 @@ CHANNEL_LAYERS = {
     }
 }
 
+# Shared cache for analytics responses; per-process memory when no Redis is configured
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "OPTIONS": {"MAX_ENTRIES": 10000},
+        }
+    }
+
+ANALYTICS_CACHE_ALIAS = "default"
+ANALYTICS_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Per-request timing (core.timing): Server-Timing headers on every
+# response when SERVER_TIMING is on, otherwise only for staff users sending
+# "X-Server-Timing: 1"; requests and WebSocket messages slower than
+# SLOW_REQUEST_MS are logged (None: off)
+SERVER_TIMING = os.getenv("SERVER_TIMING", str(DEBUG)).lower() == "true"
+SLOW_REQUEST_MS = 1000
+
+# Server-side pomodoro expiry, runs inside each ASGI worker
+POMODORO_EXPIRY_SCHEDULER = os.getenv("POMODORO_EXPIRY_SCHEDULER", "true").lower() == "true"
+POMODORO_EXPIRY_TICK_SECONDS = 1
+POMODORO_EXPIRY_RESYNC_SECONDS = 30
+
 GOOGLE_CLIENT_ID = os.getenv(
     "GOOGLE_CLIENT_ID",
     ""
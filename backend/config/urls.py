@@ -32,4 +32,5 @@ urlpatterns = [
     path('tasks/', include('apps.tasks.urls')),
     path('pomodoro/', include('apps.pomodoro.urls')),
     path('analytics/', include('apps.analytics.urls')),
+    path('sync/', include('apps.sync.urls')),
 ]
@@ -3,3 +3,10 @@ from django.apps import AppConfig
 
 class CoreConfig(AppConfig):
     name = 'core'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+        from core.timing import install_query_timer, request_timing
+
+        request_timing.configure()
+        connection_created.connect(install_query_timer, dispatch_uid="core.timing.install_query_timer")
@@ -0,0 +1,61 @@
+import hashlib
+import json
+from functools import wraps
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+
+
+REVALIDATE = {"private": True, "no_cache": True}
+
+
+def make_etag(request, version):
+    """
+    A strong ETag for `version` (any JSON-serializable value that changes
+    whenever the data does) as rendered for this request.
+    """
+    renderer = getattr(getattr(request, "accepted_renderer", None), "format", None)
+    payload = json.dumps([version, renderer], sort_keys=True, default=str)
+    return quote_etag(hashlib.md5(payload.encode(), usedforsecurity=False).hexdigest())
+
+
+def conditional_response(request, version, respond, cache_control=REVALIDATE):
+    """
+    `respond()`, unless the client already holds the representation of
+    `version`: then 304 Not Modified without calling it.
+
+    `version` is a cheap validator (a data version or change counter,
+    never the data itself) and None skips the check. Successful responses
+    carry the ETag and `cache_control`, which by default makes clients
+    revalidate on every use.
+    """
+    if version is None:
+        return respond()
+
+    etag = make_etag(request, version)
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = respond()
+    if response.status_code in (200, 304):
+        response["ETag"] = etag
+        patch_cache_control(response, **cache_control)
+    return response
+
+
+def conditional(version_func, cache_control=REVALIDATE):
+    """
+    Decorator for GET handlers of DRF views, see conditional_response().
+    `version_func(view, request, *args, **kwargs)` runs after
+    authentication and returns the validator.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(view, request, *args, **kwargs):
+            return conditional_response(
+                request,
+                version_func(view, request, *args, **kwargs),
+                lambda: method(view, request, *args, **kwargs),
+                cache_control,
+            )
+        return wrapper
+    return decorator
@@ -0,0 +1,58 @@
+"""
+JSON encoding for API responses, request bodies and WebSocket messages.
+
+Uses orjson when it is installed and the standard library otherwise. The
+output is the same either way, and the same as DRF's JSONRenderer:
+compact UTF-8, with datetimes, dates, Decimals, UUIDs and lazy strings
+converted by DRF's JSONEncoder.
+"""
+import json
+
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+_encoder = JSONEncoder()
+
+if orjson is not None:
+    # Datetimes go through DRF's encoder too, which writes UTC as "Z"
+    _OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+def dumps(obj):
+    """`obj` as compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        try:
+            return _escape_line_separators(orjson.dumps(obj, default=_encoder.default, option=_OPTIONS))
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits; the standard library
+            # encodes those, and raises the usual errors otherwise
+            pass
+    return _escape_line_separators(json.dumps(
+        obj, cls=JSONEncoder, ensure_ascii=False, allow_nan=False, separators=(",", ":"),
+    ).encode())
+
+
+def dumps_text(obj):
+    """`obj` as a JSON string, e.g. for a WebSocket text frame."""
+    return dumps(obj).decode()
+
+
+def loads(data):
+    """Parse JSON bytes or str. Raises ValueError on invalid input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _escape_line_separators(data):
+    # Valid JSON but not valid JavaScript; DRF escapes them as well
+    if b"\xe2\x80\xa8" in data or b"\xe2\x80\xa9" in data:
+        data = data.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+    return data
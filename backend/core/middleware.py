@@ -0,0 +1,48 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from core.timing import request_timing
+
+
+class ServerTimingMiddleware:
+    """
+    Times each request: query count, database time, rendering and the
+    named spans of the services it went through. Adds a Server-Timing
+    header when configured or asked for by staff (see RequestTiming) and
+    logs slow requests.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        with request_timing.record(self.label(request), self.enabled(request)) as timer:
+            response = self.get_response(request)
+        return self.finish(request, response, timer)
+
+    async def __acall__(self, request):
+        with request_timing.record(self.label(request), self.enabled(request)) as timer:
+            response = await self.get_response(request)
+        return self.finish(request, response, timer)
+
+    @staticmethod
+    def enabled(request):
+        return request_timing.may_send_header(request) or request_timing.slow_ms is not None
+
+    @staticmethod
+    def label(request):
+        return f"{request.method} {request.path}"
+
+    @staticmethod
+    def finish(request, response, timer):
+        # request.user is set by now, by DRF's authentication if not earlier
+        if timer is not None and request_timing.wants_header(request):
+            response["Server-Timing"] = timer.server_timing()
+        return response
@@ -0,0 +1,203 @@
+import base64
+import json
+from datetime import datetime
+
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (cursor) pagination over a unique composite ordering.
+
+    Each page is `WHERE (created_at, id) < cursor ORDER BY ... LIMIT n`,
+    so with a matching index every page costs the same however deep it
+    is, and no COUNT(*) runs unless the client asks for `?count=true`.
+    The cursor is an opaque token holding the boundary row's ordering
+    values and the direction.
+
+    Requests that pass `page` are served by PageNumberPagination instead,
+    so existing page-number clients keep working.
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+    page_number_query_param = "page"
+
+    invalid_cursor_message = "Invalid cursor"
+
+    # Type of each ordering field's cursor value, checked before it reaches the ORM
+    position_types = {"created_at": datetime, "id": int}
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_number_pagination = None
+        if self.page_number_query_param and self.page_number_query_param in request.query_params:
+            self.page_number_pagination = PageNumberPagination()
+            self.page_number_pagination.page_size = self.page_size
+            self.page_number_pagination.page_size_query_param = self.page_size_query_param
+            self.page_number_pagination.max_page_size = self.max_page_size
+            queryset = queryset.order_by(*self.ordering)
+            return self.page_number_pagination.paginate_queryset(queryset, request, view)
+
+        self.page_size = self.get_page_size(request)
+        reverse, position = self.decode_cursor(request)
+
+        self.count = None
+        if request.query_params.get(self.count_query_param, "").lower() in ("1", "true"):
+            self.count = queryset.order_by().count()
+
+        ordering = self.ordering
+        if reverse:
+            ordering = tuple(self._flip(field) for field in ordering)
+        if position is not None:
+            queryset = queryset.filter(self._after(ordering, position))
+        rows = list(queryset.order_by(*ordering)[:self.page_size + 1])
+
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        self.first_position = self._position(rows[0]) if rows else None
+        self.last_position = self._position(rows[-1]) if rows else None
+        return rows
+
+    def get_paginated_response(self, data):
+        if self.page_number_pagination is not None:
+            return self.page_number_pagination.get_paginated_response(data)
+
+        payload = {}
+        if self.count is not None:
+            payload["count"] = self.count
+        payload["next"] = self.get_next_link()
+        payload["previous"] = self.get_previous_link()
+        payload["results"] = data
+        return Response(payload)
+
+    def get_next_link(self):
+        if not self.has_next or self.last_position is None:
+            return None
+        return self._link(False, self.last_position)
+
+    def get_previous_link(self):
+        if not self.has_previous or self.first_position is None:
+            return None
+        return self._link(True, self.first_position)
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def encode_cursor(self, reverse, position):
+        token = json.dumps({"r": int(reverse), "p": position}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(token.encode()).decode()
+
+    def decode_cursor(self, request):
+        """(reverse, position) for the request's cursor, or (False, None)."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return False, None
+        try:
+            token = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            reverse, position = bool(token["r"]), token["p"]
+            if not isinstance(position, list) or len(position) != len(self.ordering):
+                raise ValueError
+            position = [
+                self._parse_position_value(field.lstrip("-"), value)
+                for field, value in zip(self.ordering, position)
+            ]
+        except (TypeError, ValueError, KeyError, UnicodeDecodeError):
+            raise NotFound(self.invalid_cursor_message)
+        return reverse, position
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Cursor from a previous response's next or previous link.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": f"Results per page, at most {self.max_page_size}.",
+                "schema": {"type": "integer"},
+            },
+            {
+                "name": self.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Include the total count (costs a COUNT query).",
+                "schema": {"type": "boolean"},
+            },
+        ]
+
+    def _position(self, row):
+        values = []
+        for field in self.ordering:
+            name = field.lstrip("-")
+            # Model instances, or .values() rows
+            value = row[name] if isinstance(row, dict) else getattr(row, name)
+            values.append(value.isoformat() if isinstance(value, datetime) else value)
+        return values
+
+    def _parse_position_value(self, name, value):
+        """A cursor value checked against its field's type; raises ValueError."""
+        kind = self.position_types[name]
+        if kind is datetime:
+            parsed = parse_datetime(value) if isinstance(value, str) else None
+            if parsed is None or not timezone.is_aware(parsed):
+                raise ValueError(value)
+            return parsed
+        # bool is an int subclass; the bound keeps values within a bigint
+        if not isinstance(value, int) or isinstance(value, bool) or abs(value) >= 2 ** 63:
+            raise ValueError(value)
+        return value
+
+    def _link(self, reverse, position):
+        url = self.request.build_absolute_uri()
+        if self.page_number_query_param:
+            url = remove_query_param(url, self.page_number_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(reverse, position))
+
+    @staticmethod
+    def _flip(field):
+        return field[1:] if field.startswith("-") else f"-{field}"
+
+    @staticmethod
+    def _after(ordering, position):
+        """Rows strictly after `position` in `ordering`, as a lexicographic OR of ANDs."""
+        condition = Q()
+        for depth, field in enumerate(ordering):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            term = Q(**{f"{name}__{lookup}": position[depth]})
+            for previous, value in zip(ordering[:depth], position[:depth]):
+                term &= Q(**{previous.lstrip("-"): value})
+            condition |= term
+
+        # The redundant non-strict bound on the leading field gives the
+        # planner an index range to seek to instead of scanning the OR
+        first = ordering[0]
+        bound = "lte" if first.startswith("-") else "gte"
+        return Q(**{f"{first.lstrip('-')}__{bound}": position[0]}) & condition
@@ -0,0 +1,24 @@
+from rest_framework.renderers import JSONRenderer
+
+from core import fastjson
+from core.timing import timed
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer encoding with core.fastjson. Pretty-printed output
+    (`Accept: application/json; indent=4`, the browsable API) and
+    non-default UNICODE_JSON/COMPACT_JSON/STRICT_JSON settings are left
+    to JSONRenderer.
+    """
+
+    @timed("render")
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if (
+            self.ensure_ascii or not self.compact or not self.strict
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        return fastjson.dumps(data)
@@ -1,3 +1,56 @@
-from django.test import TestCase
+import io
+import uuid
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from core import fastjson
+from core.parsers import FastJSONParser
+from core.renderers import FastJSONRenderer
+
+
+class FastJSONTests(SimpleTestCase):
+    data = {
+        "id": 7,
+        "created_at": datetime(2026, 3, 1, 9, 30, 15, 123456, tzinfo=dt_timezone.utc),
+        "local": datetime(2026, 3, 1, 9, 30, tzinfo=dt_timezone(timedelta(hours=5, minutes=45))),
+        "day": date(2026, 3, 1),
+        "hours": Decimal("1.25"),
+        "uuid": uuid.UUID(int=1),
+        "label": gettext_lazy("Focus"),
+        "title": "Café ☕\u2028line",
+        "nested": [{"n": None, "ok": True, "ratio": 0.1}],
+        "counts": {3: 1},
+    }
+
+    def test_renderer_matches_drf(self):
+        expected = JSONRenderer().render(self.data)
+        self.assertEqual(FastJSONRenderer().render(self.data), expected)
+
+        with mock.patch.object(fastjson, "orjson", None):
+            self.assertEqual(FastJSONRenderer().render(self.data), expected)
+
+        # Wider than orjson's integers
+        self.assertEqual(fastjson.dumps({"huge": 2 ** 70}), b'{"huge":1180591620717411303424}')
+
+    def test_pretty_printing_is_left_to_drf(self):
+        rendered = FastJSONRenderer().render({"a": 1}, "application/json; indent=2")
+        self.assertEqual(rendered, b'{\n  "a": 1\n}')
+        self.assertEqual(FastJSONRenderer().render(None), b"")
+
+    def test_parser(self):
+        body = '{"title": "Café", "ids": [1, 2]}'.encode()
+        self.assertEqual(FastJSONParser().parse(io.BytesIO(body)), {"title": "Café", "ids": [1, 2]})
+
+        for invalid in (b"", b"{'a': 1}", b'{"a": NaN}'):
+            with self.assertRaises(ParseError):
+                FastJSONParser().parse(io.BytesIO(invalid))
+
+    def test_unsupported_types_still_raise(self):
+        with self.assertRaises(TypeError):
+            fastjson.dumps({"value": object()})
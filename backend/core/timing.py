@@ -0,0 +1,230 @@
+import heapq
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from inspect import isfunction, iscoroutinefunction
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+_current = ContextVar("request_timer", default=None)
+
+
+class RequestTimer:
+    """
+    Queries, database time and named spans of one HTTP request or
+    WebSocket message. Work done in sync_to_async threads is recorded too,
+    since they run in a copy of the caller's context.
+    """
+
+    SLOWEST_QUERIES = 5
+
+    def __init__(self, label):
+        self.label = label
+        self.started = time.perf_counter()
+        self.finished = None
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.spans = {}
+        self.slowest = []
+        self._lock = threading.Lock()
+
+    @property
+    def total_seconds(self):
+        return (self.finished or time.perf_counter()) - self.started
+
+    def add(self, name, seconds):
+        with self._lock:
+            total, count = self.spans.get(name, (0.0, 0))
+            self.spans[name] = (total + seconds, count + 1)
+
+    def add_query(self, sql, seconds):
+        with self._lock:
+            self.queries += 1
+            self.db_seconds += seconds
+            entry = (seconds, self.queries, sql)
+            if len(self.slowest) < self.SLOWEST_QUERIES:
+                heapq.heappush(self.slowest, entry)
+            else:
+                heapq.heappushpop(self.slowest, entry)
+
+    def server_timing(self):
+        """The Server-Timing header value; durations in milliseconds."""
+        metrics = [f'db;dur={self.db_seconds * 1000:.1f};desc="{self.queries} queries"']
+        for name, (seconds, count) in self.spans.items():
+            metric = f"{name};dur={seconds * 1000:.1f}"
+            if count > 1:
+                metric += f';desc="{count} calls"'
+            metrics.append(metric)
+        metrics.append(f"total;dur={self.total_seconds * 1000:.1f}")
+        return ", ".join(metrics)
+
+    def summary(self):
+        spans = ", ".join(
+            f"{name} {seconds * 1000:.1f} ms" + (f" x{count}" if count > 1 else "")
+            for name, (seconds, count) in self.spans.items()
+        )
+        lines = [
+            f"{self.label}: {self.total_seconds * 1000:.0f} ms, "
+            f"{self.queries} queries in {self.db_seconds * 1000:.0f} ms"
+            + (f"; {spans}" if spans else "")
+        ]
+        for seconds, _, sql in sorted(self.slowest, reverse=True):
+            lines.append(f"  {seconds * 1000:8.1f} ms  {sql[:300]}")
+        return "\n".join(lines)
+
+
+class RequestTiming:
+    """
+    Per-request instrumentation, see ServerTimingMiddleware and
+    TimedConsumerMixin.
+
+    `SERVER_TIMING` sends the Server-Timing header with every response; a
+    request can turn it off for itself with `X-Server-Timing: 0`, and staff
+    users can turn it on with `X-Server-Timing: 1`. Requests and messages
+    slower than `SLOW_REQUEST_MS` are logged with their slowest queries
+    (None disables that).
+    """
+
+    def __init__(self, header=False, slow_ms=1000):
+        self.header = header
+        self.slow_ms = slow_ms
+
+    def configure(self):
+        self.header = getattr(settings, "SERVER_TIMING", self.header)
+        self.slow_ms = getattr(settings, "SLOW_REQUEST_MS", self.slow_ms)
+
+    @staticmethod
+    def requested(request):
+        """The request's X-Server-Timing choice: True, False or None."""
+        return {"1": True, "0": False}.get(request.headers.get("X-Server-Timing"))
+
+    def may_send_header(self, request):
+        """Whether wants_header() can be true, before the user is known."""
+        requested = self.requested(request)
+        return requested is not False and (self.header or bool(requested))
+
+    def wants_header(self, request):
+        """Whether the response gets the header; ask once the request is authenticated."""
+        requested = self.requested(request)
+        if requested is False:
+            return False
+        if self.header:
+            return True
+        # Timings name internal services; only staff may ask for them
+        user = getattr(request, "user", None)
+        return bool(requested and user is not None and user.is_staff)
+
+    @contextmanager
+    def record(self, label, enabled=True):
+        """Record into a new RequestTimer (None when not `enabled`) while inside."""
+        if not enabled:
+            yield None
+            return
+        timer = RequestTimer(label)
+        token = _current.set(timer)
+        try:
+            yield timer
+        finally:
+            timer.finished = time.perf_counter()
+            _current.reset(token)
+            if self.slow_ms is not None and timer.total_seconds * 1000 >= self.slow_ms:
+                logger.warning("Slow %s", timer.summary())
+
+
+request_timing = RequestTiming()
+
+
+def current_timer():
+    return _current.get()
+
+
+@contextmanager
+def span(name):
+    """Add the time spent inside to the current request's `name` span."""
+    timer = _current.get()
+    if timer is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer.add(name, time.perf_counter() - started)
+
+
+def timed(name):
+    """Decorator: a `name` span around each call of a sync or async function."""
+    def decorator(func):
+        if iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                timer = _current.get()
+                if timer is None:
+                    return await func(*args, **kwargs)
+                started = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    timer.add(name, time.perf_counter() - started)
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            timer = _current.get()
+            if timer is None:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timer.add(name, time.perf_counter() - started)
+        return wrapper
+    return decorator
+
+
+def timed_methods(cls):
+    """Class decorator: a "Class.method" span around each public method."""
+    for name, attr in list(vars(cls).items()):
+        if name.startswith("_"):
+            continue
+        label = f"{cls.__name__}.{name}"
+        if isinstance(attr, (staticmethod, classmethod)):
+            setattr(cls, name, type(attr)(timed(label)(attr.__func__)))
+        elif isfunction(attr):
+            setattr(cls, name, timed(label)(attr))
+    return cls
+
+
+def time_query(execute, sql, params, many, context):
+    """Database execute wrapper feeding the current RequestTimer."""
+    timer = _current.get()
+    if timer is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timer.add_query(sql, time.perf_counter() - started)
+
+
+def install_query_timer(sender, connection, **kwargs):
+    """connection_created receiver: time every query on every connection."""
+    if time_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, time_query)
+
+
+class TimedConsumerMixin:
+    """
+    Records each message a Channels consumer handles (connect, receive,
+    group events) like a request; slow ones are logged.
+    """
+
+    async def dispatch(self, message):
+        label = f"WS {self.scope.get('path', '')} {message.get('type', '')}"
+        with request_timing.record(label, enabled=request_timing.slow_ms is not None):
+            await super().dispatch(message)